@@ -18,6 +18,10 @@ logger = logging.getLogger(__name__)
 def get_cached_services() -> Tuple[Any, Any, Any, Any, Any]:
     """Get cached service instances using lru_cache for automatic memoization.
 
+    The arXiv client keeps a pooled HTTP transport that is opened lazily on the
+    running event loop; callers should ``await arxiv_client.aclose()`` before
+    their ``asyncio.run`` loop ends so the cached instance can be reused.
+
     :returns: Tuple of (arxiv_client, pdf_parser, database, metadata_fetcher, opensearch_client)
     """
     logger.info("Initializing services (cached with lru_cache)")
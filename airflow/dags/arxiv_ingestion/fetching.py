@@ -23,15 +23,19 @@ async def run_paper_ingestion_pipeline(
     max_results = arxiv_client.max_results
     logger.info(f"Using default max_results from config: {max_results}")
 
-    with database.get_session() as session:
-        return await metadata_fetcher.fetch_and_process_papers(
-            max_results=max_results,
-            from_date=target_date,
-            to_date=target_date,
-            process_pdfs=process_pdfs,
-            store_to_db=True,
-            db_session=session,
-        )
+    try:
+        with database.get_session() as session:
+            return await metadata_fetcher.fetch_and_process_papers(
+                max_results=max_results,
+                from_date=target_date,
+                to_date=target_date,
+                process_pdfs=process_pdfs,
+                store_to_db=True,
+                db_session=session,
+            )
+    finally:
+        # Pooled connections are bound to this asyncio.run loop; the cached client reopens on next use
+        await arxiv_client.aclose()
 
 
 def fetch_daily_papers(**context):
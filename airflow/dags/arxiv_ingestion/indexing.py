@@ -31,7 +31,10 @@ async def _index_papers_with_chunks(papers):
             paper_dict = paper
         papers_data.append(paper_dict)
 
-    stats = await indexing_service.index_papers_batch(papers=papers_data, replace_existing=True)
+    try:
+        stats = await indexing_service.index_papers_batch(papers=papers_data, replace_existing=True)
+    finally:
+        await indexing_service.close()
 
     return stats
 
@@ -0,0 +1,157 @@
+"""Compare streaming arXiv feed parsing with parsing the whole response body at once.
+
+Serves a synthetic Atom page through an in-memory transport, in chunks with an optional
+delay per chunk to mimic the network, and measures for each path:
+
+- time to first entry: until the first ArxivPaper is available to the caller
+- total time: until the whole page is parsed
+- peak memory: tracemalloc peak while the page is consumed (papers are not kept)
+
+"fromstring" reads the body and builds the full tree with ``ET.fromstring`` (the
+pre-streaming path); "streaming" is ``ArxivClient._stream_page``.
+
+Run from the repository root:
+
+    python -m scripts.benchmark_arxiv_feed_parsing --entries 2000 --chunk-delay-ms 1
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from typing import AsyncIterator, Callable, Dict, Optional
+from xml.sax.saxutils import escape
+
+import httpx
+from src.config import ArxivSettings
+from src.schemas.arxiv.paper import ArxivPaper
+from src.services.arxiv.client import ArxivClient
+
+FEED_URL = "https://export.arxiv.org/api/query?search_query=cat:cs.AI"
+
+_ENTRY = """  <entry>
+    <id>http://arxiv.org/abs/2507.{number:05d}v1</id>
+    <published>2025-07-23T17:59:59Z</published>
+    <title>{title}</title>
+    <summary>{summary}</summary>
+{authors}
+    <link href="http://arxiv.org/abs/2507.{number:05d}v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2507.{number:05d}v1" rel="related" type="application/pdf"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+"""
+
+
+def build_feed(entries: int) -> bytes:
+    """Build an arXiv API page with ``entries`` entries of realistic size (~2 KB each)."""
+    summary = escape(" ".join(f"word{i % 97}" for i in range(180)))
+    authors = "\n".join(f"    <author><name>Author {i} Surname</name></author>" for i in range(6))
+    body = "".join(
+        _ENTRY.format(number=n, title=f"Synthetic paper {n} on agents &amp; planning", summary=summary, authors=authors)
+        for n in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"'
+        ' xmlns:arxiv="http://arxiv.org/schemas/atom">\n'
+        f"  <opensearch:totalResults>{entries}</opensearch:totalResults>\n"
+        f"{body}</feed>\n"
+    ).encode("utf-8")
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, chunk_size: int, chunk_delay: float):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.body), self.chunk_size):
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            yield self.body[start : start + self.chunk_size]
+
+
+class _BenchmarkClient(ArxivClient):
+    """ArxivClient whose HTTP client serves the synthetic feed instead of the network."""
+
+    def __init__(self, body: bytes, chunk_size: int, chunk_delay: float):
+        super().__init__(ArxivSettings())
+        self._body = body
+        self._chunk_size = chunk_size
+        self._chunk_delay = chunk_delay
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=_ChunkedStream(self._body, self._chunk_size, self._chunk_delay))
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def parse_with_fromstring(client: ArxivClient) -> AsyncIterator[ArxivPaper]:
+    response = await client.http_client.get(FEED_URL)
+    response.raise_for_status()
+    root = ET.fromstring(response.text)
+    for entry in root.findall("atom:entry", client.namespaces):
+        paper = client._parse_single_entry(entry)
+        if paper:
+            yield paper
+
+
+async def parse_with_streaming(client: ArxivClient) -> AsyncIterator[ArxivPaper]:
+    async for paper in client._stream_page(FEED_URL):
+        yield paper
+
+
+async def measure(parse: Callable[[ArxivClient], AsyncIterator[ArxivPaper]], client: ArxivClient) -> Dict[str, float]:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    first_entry: Optional[float] = None
+    count = 0
+
+    async for _ in parse(client):
+        if first_entry is None:
+            first_entry = time.perf_counter() - started
+        count += 1
+
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"entries": count, "first_entry_s": first_entry or 0.0, "total_s": total, "peak_mb": peak / 1024 / 1024}
+
+
+async def run(entries: int, chunk_size: int, chunk_delay_ms: float, repeat: int) -> None:
+    body = build_feed(entries)
+    client = _BenchmarkClient(body, chunk_size, chunk_delay_ms / 1000)
+    print(
+        f"Feed: {entries} entries, {len(body) / 1024 / 1024:.1f} MB, "
+        f"{chunk_size // 1024} KiB chunks, {chunk_delay_ms} ms/chunk"
+    )
+
+    try:
+        for name, parse in (("fromstring", parse_with_fromstring), ("streaming", parse_with_streaming)):
+            runs = [await measure(parse, client) for _ in range(repeat)]
+            best = min(runs, key=lambda result: result["total_s"])
+            print(
+                f"{name:>10}: {best['entries']} entries, first entry {best['first_entry_s'] * 1000:.1f} ms, "
+                f"total {best['total_s']:.3f} s, peak {best['peak_mb']:.1f} MB (best of {repeat})"
+            )
+    finally:
+        await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000, help="Entries in the synthetic page (arXiv maximum: 2000)")
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024, help="Bytes per response chunk")
+    parser.add_argument("--chunk-delay-ms", type=float, default=0.0, help="Delay before each chunk, to mimic the network")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path; the fastest is reported")
+    args = parser.parse_args()
+    asyncio.run(run(args.entries, args.chunk_size, args.chunk_delay_ms, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
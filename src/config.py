@@ -31,14 +31,31 @@ class ArxivSettings(BaseConfigSettings):
 
     base_url: str = "https://export.arxiv.org/api/query"
     pdf_cache_dir: str = "./data/arxiv_pdfs"
+    pdf_cache_max_size_mb: int = 5120  # LRU eviction budget for cached PDFs (0 = unlimited)
     rate_limit_delay: float = 3.0
     timeout_seconds: int = 30
     max_results: int = 15
+    id_list_batch_size: int = 100  # IDs per id_list request in batched lookups
     search_category: str = "cs.AI"
     download_max_retries: int = 3
     download_retry_delay_base: float = 5.0
     max_concurrent_downloads: int = 5
     max_concurrent_parsing: int = 1
+    pipeline_queue_size: int = 10  # Bound of each queue between ingestion stages
+    fetch_page_size: int = 100  # Papers per arXiv page when streaming metadata
+
+    # Token bucket rate limiting: "memory" (per process) or "redis" (shared by API and Airflow workers)
+    rate_limit_backend: Literal["memory", "redis"] = "memory"
+    rate_limit_burst: int = 1
+    pdf_rate_limit_delay: float = 1.0  # Seconds per PDF download token
+    pdf_rate_limit_burst: int = 3
+    rate_limit_redis_prefix: str = "arxiv:rate_limit"
+
+    # Shared HTTP transport (connection pooling / keep-alive)
+    http2: bool = True
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0
 
     namespaces: dict = {
         "atom": "http://www.w3.org/2005/Atom",
@@ -67,6 +84,24 @@ class PDFParserSettings(BaseConfigSettings):
     do_ocr: bool = False
     do_table_structure: bool = True
 
+    # Process pool for Docling conversions (0 parses in-process, one document at a time in a worker thread)
+    parse_workers: int = 2
+    max_tasks_per_child: int = 50
+    parse_timeout_seconds: float = 300.0
+
+    # Split documents longer than shard_pages into page ranges parsed in parallel (0 disables)
+    shard_pages: int = 10
+    max_document_pages: int = 200  # Page limit for sharded documents; without sharding max_pages applies
+
+    # Try the pypdfium2 text layer first; fall back to Docling below this quality score
+    fast_path_enabled: bool = True
+    fast_path_min_quality: float = 0.6
+
+    # Parsed documents keyed by PDF sha256 + parser options, so retries and re-ingests skip parsing
+    result_cache_enabled: bool = True
+    result_cache_dir: str = "./data/parse_cache"
+    result_cache_max_size_mb: int = 1024
+
 
 class ChunkingSettings(BaseConfigSettings):
     model_config = SettingsConfigDict(
@@ -81,6 +116,71 @@ class ChunkingSettings(BaseConfigSettings):
     overlap_size: int = 100  # Words to overlap between chunks
     min_chunk_size: int = 100  # Minimum words for a valid chunk
     section_based: bool = True  # Use section-based chunking when available
+    # Paper context repeated in each section chunk: "full" (title + abstract), "title-only" or "none".
+    # Title and abstract are always indexed as separate searchable fields.
+    header_strategy: Literal["full", "title-only", "none"] = "full"
+    workers: int = 2  # Processes chunking papers ahead of embedding in batch indexing (0 = inline)
+
+    # Token-budget mode: size chunks with the embedding model's tokenizer instead of words
+    token_budget: bool = False
+    tokenizer_name: str = "jinaai/jina-embeddings-v3"
+    chunk_tokens: int = 768  # Target tokens per chunk, header included
+    overlap_tokens: int = 96
+    min_chunk_tokens: int = 128
+
+
+class EmbeddingsSettings(BaseConfigSettings):
+    model_config = SettingsConfigDict(
+        env_file=[".env", str(ENV_FILE_PATH), ".env.local", str(LOCAL_ENV_FILE_PATH)],
+        env_prefix="EMBEDDINGS__",
+        extra="ignore",
+        frozen=True,
+        case_sensitive=False,
+    )
+
+    # "jina" calls the Jina API; "local" runs a sentence-transformers model on this host.
+    # OPENSEARCH__VECTOR_DIMENSION must match the model (checked at startup). Vectors of different
+    # models are not comparable, so switching backends means recreating the chunk index and re-indexing.
+    backend: Literal["jina", "local"] = "jina"
+    timeout_seconds: float = 30.0
+
+    # Local backend
+    local_model_name: str = "BAAI/bge-large-en-v1.5"  # 1024 dims, same as the default index
+    local_pooling: Literal["model", "mean", "cls", "max", "lasttoken"] = "model"  # "model" keeps the model's own
+    local_normalize: bool = True  # L2-normalize vectors (cosine similarity == dot product)
+    local_device: str = "cpu"
+    local_workers: int = 2  # Inference threads; torch also parallelizes each batch across cores
+    local_max_seq_length: int = 0  # Truncation length in tokens (0 = model default)
+
+    # Passages per request; batch indexing coalesces chunks of several papers into full batches,
+    # sending a partial batch after batch_max_wait_seconds
+    batch_size: int = 50
+    batch_max_wait_seconds: float = 0.1
+    max_concurrent_papers: int = 16  # Papers embedded/indexed concurrently in batch indexing
+
+    # Batches of one embed_passages call are sent concurrently, bounded per client
+    max_concurrent_requests: int = 4
+
+    # Retries on 429/5xx and transport errors: jittered exponential backoff unless Retry-After is sent
+    max_retries: int = 4
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+
+    # Passage vectors keyed by sha256(text) + model, task and dimensions; only misses are sent to the API.
+    # "sqlite" is local to the process host, "redis" is shared by the API and Airflow workers.
+    cache_enabled: bool = True
+    cache_backend: Literal["sqlite", "redis"] = "sqlite"
+    cache_dir: str = "./data/embedding_cache"
+    cache_max_size_mb: int = 2048  # LRU eviction budget (0 = unlimited)
+    cache_dtype: Literal["float32", "float16"] = "float32"  # float16 halves storage, ~1e-3 relative error
+    cache_redis_prefix: str = "embeddings"
+
+    # Query embeddings: in-process LRU in front of a shared Redis tier, keyed by the normalized query
+    query_cache_enabled: bool = True
+    query_cache_max_entries: int = 1024
+    query_cache_redis: bool = True  # Falls back to the in-process tier alone when Redis is unreachable
+    query_cache_ttl_hours: int = 24
+    query_cache_redis_prefix: str = "query_embeddings"
 
 
 class OpenSearchSettings(BaseConfigSettings):
@@ -98,7 +198,7 @@ class OpenSearchSettings(BaseConfigSettings):
     max_text_size: int = 1000000
 
     # Vector search settings
-    vector_dimension: int = 1024  # Jina embeddings dimension
+    vector_dimension: int = 1024  # Must match the embeddings backend (Jina v3: 1024)
     vector_space_type: str = "cosinesimil"  # cosinesimil, l2, innerproduct
 
     # Hybrid search settings
@@ -181,6 +281,7 @@ class Settings(BaseConfigSettings):
     arxiv: ArxivSettings = Field(default_factory=ArxivSettings)
     pdf_parser: PDFParserSettings = Field(default_factory=PDFParserSettings)
     chunking: ChunkingSettings = Field(default_factory=ChunkingSettings)
+    embeddings: EmbeddingsSettings = Field(default_factory=EmbeddingsSettings)
     opensearch: OpenSearchSettings = Field(default_factory=OpenSearchSettings)
     langfuse: LangfuseSettings = Field(default_factory=LangfuseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
@@ -35,6 +35,14 @@ class PDFCacheException(Exception):
     """Exception raised for PDF cache-related errors."""
 
 
+class ParseCacheException(Exception):
+    """Exception raised for parse result cache errors."""
+
+
+class EmbeddingCacheException(Exception):
+    """Exception raised for embedding cache errors."""
+
+
 # Week 3+: OpenSearch exceptions (placeholders for Week 1)
 class OpenSearchException(Exception):
     """Base exception for OpenSearch-related errors."""
@@ -99,6 +99,11 @@ async def lifespan(app: FastAPI):
         await app.state.telegram_service.stop()
         logger.info("Telegram bot stopped")
 
+    await app.state.arxiv_client.aclose()
+    logger.info("arXiv client connections closed")
+
+    app.state.pdf_parser.shutdown()
+
     database.teardown()
     logger.info("API shutdown complete")
 
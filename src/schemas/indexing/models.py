@@ -1,4 +1,5 @@
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -9,6 +10,7 @@ class ChunkMetadata(BaseModel):
     start_char: int
     end_char: int
     word_count: int
+    token_count: Optional[int] = None
     overlap_with_previous: int
     overlap_with_next: int
     section_title: Optional[str] = None
@@ -20,3 +22,44 @@ class TextChunk(BaseModel):
     metadata: ChunkMetadata
     arxiv_id: str
     paper_id: str
+
+
+@dataclass(slots=True)
+class ChunkRecord:
+    """Flat chunk used on the indexing hot path (chunker -> embeddings -> bulk index).
+
+    Holds the same data as ``TextChunk`` without per-field validation or a nested model; the
+    chunker builds it from already-checked values. ``embedding`` is filled in after embedding.
+    """
+
+    text: str
+    arxiv_id: str
+    paper_id: str
+    chunk_index: int
+    start_char: int
+    end_char: int
+    word_count: int
+    overlap_with_previous: int = 0
+    overlap_with_next: int = 0
+    section_title: Optional[str] = None
+    token_count: Optional[int] = None
+    chunk_hash: Optional[str] = None  # sha256 of text; unchanged chunks keep their stored embedding
+    embedding: Optional[List[float]] = None
+
+    def to_text_chunk(self) -> TextChunk:
+        """Validated model for callers outside the indexing path."""
+        return TextChunk(
+            text=self.text,
+            metadata=ChunkMetadata(
+                chunk_index=self.chunk_index,
+                start_char=self.start_char,
+                end_char=self.end_char,
+                word_count=self.word_count,
+                token_count=self.token_count,
+                overlap_with_previous=self.overlap_with_previous,
+                overlap_with_next=self.overlap_with_next,
+                section_title=self.section_title,
+            ),
+            arxiv_id=self.arxiv_id,
+            paper_id=self.paper_id,
+        )
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 class ParserType(str, Enum):
 
     DOCLING = "docling"
+    PDFIUM = "pdfium"
 
 
 class PaperSection(BaseModel):
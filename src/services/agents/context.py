@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from langfuse._client.span import LangfuseSpan
 from typing import TYPE_CHECKING, Optional
 
-from src.services.embeddings.jina_client import JinaEmbeddingsClient
+from src.services.embeddings.base import EmbeddingsBackend
 from src.services.langfuse.client import LangfuseTracer
 from src.services.ollama.client import OllamaClient
 from src.services.opensearch.client import OpenSearchClient
@@ -13,7 +13,7 @@ class Context:
 
     ollama_client: OllamaClient
     opensearch_client: OpenSearchClient
-    embeddings_client: JinaEmbeddingsClient
+    embeddings_client: EmbeddingsBackend
     langfuse_tracer: Optional[LangfuseTracer]
     trace: Optional["LangfuseSpan"] = None
     langfuse_enabled: bool = False
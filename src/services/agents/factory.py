@@ -1,6 +1,6 @@
 from typing import Optional
 
-from src.services.embeddings.jina_client import JinaEmbeddingsClient
+from src.services.embeddings.base import EmbeddingsBackend
 from src.services.langfuse.client import LangfuseTracer
 from src.services.ollama.client import OllamaClient
 from src.services.opensearch.client import OpenSearchClient
@@ -12,7 +12,7 @@ from .config import GraphConfig
 def make_agentic_rag_service(
     opensearch_client: OpenSearchClient,
     ollama_client: OllamaClient,
-    embeddings_client: JinaEmbeddingsClient,
+    embeddings_client: EmbeddingsBackend,
     langfuse_tracer: Optional[LangfuseTracer] = None,
     top_k: int = 3,
     use_hybrid: bool = True,
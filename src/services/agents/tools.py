@@ -3,7 +3,7 @@ import logging
 from langchain_core.documents import Document
 from langchain_core.tools import tool
 
-from src.services.embeddings.jina_client import JinaEmbeddingsClient
+from src.services.embeddings.base import EmbeddingsBackend
 from src.services.opensearch.client import OpenSearchClient
 
 logger = logging.getLogger(__name__)
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 def create_retriever_tool(
     opensearch_client: OpenSearchClient,
-    embeddings_client: JinaEmbeddingsClient,
+    embeddings_client: EmbeddingsBackend,
     top_k: int = 3,
     use_hybrid: bool = True,
 ):
@@ -1,26 +1,147 @@
 import asyncio
+import hashlib
+import json
 import logging
+import re
 import time
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple
 from urllib.parse import quote, urlencode
 
 import httpx
 from src.config import ArxivSettings
-from src.exceptions import ArxivAPIException, ArxivAPITimeoutError, ArxivParseError, PDFDownloadException, PDFDownloadTimeoutError
+from src.exceptions import (
+    ArxivAPIException,
+    ArxivAPITimeoutError,
+    ArxivParseError,
+    PDFCacheException,
+    PDFDownloadException,
+    PDFDownloadTimeoutError,
+)
 from src.schemas.arxiv.paper import ArxivPaper
 
+from .pdf_cache import PDFCache, PDFCacheEntry
+from .rate_limiter import InMemoryRateLimiter, RateLimiter, rate_from_delay
+
 logger = logging.getLogger(__name__)
 
+# arXiv API hard limit on entries returned by a single query
+ARXIV_MAX_PAGE_SIZE = 2000
+
+_ARXIV_VERSION_SUFFIX = re.compile(r"v\d+$")
+
+
+def normalize_arxiv_id(arxiv_id: str, keep_version: bool = False) -> str:
+    """
+    Normalize an arXiv ID for lookups by stripping whitespace, an ``arXiv:`` prefix and the version suffix.
+
+    Args:
+        arxiv_id: arXiv paper ID (e.g., "2507.17748v1", "arXiv:2507.17748", "hep-th/9901001v2")
+        keep_version: Keep the version suffix (only whitespace and prefix are removed)
+
+    Returns:
+        Unversioned arXiv ID (e.g., "2507.17748", "hep-th/9901001")
+    """
+    cleaned = arxiv_id.strip()
+    if cleaned.lower().startswith("arxiv:"):
+        cleaned = cleaned[len("arxiv:") :]
+    return cleaned if keep_version else _ARXIV_VERSION_SUFFIX.sub("", cleaned)
+
+
+@dataclass
+class PDFDownloadStats:
+    """Transfer statistics for a single PDF download."""
+
+    arxiv_id: str
+    bytes_downloaded: int = 0
+    bytes_resumed: int = 0
+    seconds: float = 0.0
+    attempts: int = 0
+    resumed: bool = False
+    not_modified: bool = False
+
+    @property
+    def throughput_bytes_per_second(self) -> float:
+        return self.bytes_downloaded / self.seconds if self.seconds > 0 else 0.0
+
 
 class ArxivClient:
     """Client for fetching papers from arXiv API."""
 
-    def __init__(self, settings: ArxivSettings):
+    def __init__(
+        self,
+        settings: ArxivSettings,
+        api_rate_limiter: Optional[RateLimiter] = None,
+        pdf_rate_limiter: Optional[RateLimiter] = None,
+    ):
         self._settings = settings
-        self._last_request_time: Optional[float] = None
+        self._api_rate_limiter = api_rate_limiter or InMemoryRateLimiter(
+            "api", rate=rate_from_delay(settings.rate_limit_delay), capacity=settings.rate_limit_burst
+        )
+        self._pdf_rate_limiter = pdf_rate_limiter or InMemoryRateLimiter(
+            "pdf", rate=rate_from_delay(settings.pdf_rate_limit_delay), capacity=settings.pdf_rate_limit_burst
+        )
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Shared connection-pooled HTTP client.
+
+        Created lazily on first use and re-created if the event loop changed
+        (e.g. successive ``asyncio.run`` calls in Airflow tasks), since pooled
+        connections cannot be reused across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            self._http_client = self._create_http_client()
+            self._http_client_loop = loop
+        return self._http_client
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the pooled, keep-alive HTTP client (HTTP/2 when available)."""
+        limits = httpx.Limits(
+            max_connections=self._settings.max_connections,
+            max_keepalive_connections=self._settings.max_keepalive_connections,
+            keepalive_expiry=self._settings.keepalive_expiry,
+        )
+        timeout = float(self.timeout_seconds)
+
+        try:
+            return httpx.AsyncClient(timeout=timeout, limits=limits, http2=self._settings.http2)
+        except ImportError:
+            logger.warning("HTTP/2 requested but 'h2' package is not installed, falling back to HTTP/1.1")
+            return httpx.AsyncClient(timeout=timeout, limits=limits)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client. A new one is created on next use."""
+        client, loop = self._http_client, self._http_client_loop
+        self._http_client = None
+        self._http_client_loop = None
+
+        if client is None or client.is_closed:
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        # Connections bound to a finished loop cannot be closed gracefully; just drop them
+        if loop is running_loop:
+            await client.aclose()
 
     @cached_property
     def pdf_cache_dir(self) -> Path:
@@ -29,6 +150,11 @@ class ArxivClient:
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
+    @cached_property
+    def pdf_cache(self) -> PDFCache:
+        """Size-bounded PDF cache with on-disk index."""
+        return PDFCache(self.pdf_cache_dir, max_size_bytes=self._settings.pdf_cache_max_size_mb * 1024 * 1024)
+
     @property
     def base_url(self) -> str:
         return self._settings.base_url
@@ -53,6 +179,37 @@ class ArxivClient:
     def search_category(self) -> str:
         return self._settings.search_category
 
+    def _build_category_query(self, from_date: Optional[str] = None, to_date: Optional[str] = None) -> str:
+        """
+        Build the search query for the configured category with optional date filtering.
+
+        Args:
+            from_date: Filter papers submitted after this date (format: YYYYMMDD)
+            to_date: Filter papers submitted before this date (format: YYYYMMDD)
+
+        Returns:
+            arXiv search query string
+        """
+        search_query = f"cat:{self.search_category}"
+
+        # Add date filtering if provided
+        if from_date or to_date:
+            # Convert dates to arXiv format (YYYYMMDDHHMM) - use 0000 for start of day, 2359 for end
+            date_from = f"{from_date}0000" if from_date else "*"
+            date_to = f"{to_date}2359" if to_date else "*"
+            # Use correct arXiv API syntax with + symbols
+            search_query += f" AND submittedDate:[{date_from}+TO+{date_to}]"
+
+        return search_query
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Wait for an API token (arXiv recommends one request every 3 seconds)."""
+        await self._api_rate_limiter.acquire()
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get wait-time metrics for the metadata API and PDF download rate limiters."""
+        return {"api": self._api_rate_limiter.get_stats(), "pdf": self._pdf_rate_limiter.get_stats()}
+
     async def fetch_papers(
         self,
         max_results: Optional[int] = None,
@@ -79,21 +236,12 @@ class ArxivClient:
         if max_results is None:
             max_results = self.max_results
 
-        # Build search query
-        search_query = f"cat:{self.search_category}"
-
-        # Add date filtering if provided
-        if from_date or to_date:
-            # Convert dates to arXiv format (YYYYMMDDHHMM) - use 0000 for start of day, 2359 for end
-            date_from = f"{from_date}0000" if from_date else "*"
-            date_to = f"{to_date}2359" if to_date else "*"
-            # Use correct arXiv API syntax with + symbols
-            search_query += f" AND submittedDate:[{date_from}+TO+{date_to}]"
+        search_query = self._build_category_query(from_date, to_date)
 
         params = {
             "search_query": search_query,
             "start": start,
-            "max_results": min(max_results, 2000),
+            "max_results": min(max_results, ARXIV_MAX_PAGE_SIZE),
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
@@ -104,21 +252,9 @@ class ArxivClient:
         try:
             logger.info(f"Fetching {max_results} {self.search_category} papers from arXiv")
 
-            # Add rate limiting delay between all requests (arXiv recommends 3 seconds)
-            if self._last_request_time is not None:
-                time_since_last = time.time() - self._last_request_time
-                if time_since_last < self.rate_limit_delay:
-                    sleep_time = self.rate_limit_delay - time_since_last
-                    await asyncio.sleep(sleep_time)
+            await self._wait_for_rate_limit()
 
-            self._last_request_time = time.time()
-
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                xml_data = response.text
-
-            papers = self._parse_response(xml_data)
+            papers = [paper async for paper in self._stream_page(url)]
             logger.info(f"Fetched {len(papers)} papers")
 
             return papers
@@ -170,7 +306,7 @@ class ArxivClient:
         params = {
             "search_query": search_query,
             "start": start,
-            "max_results": min(max_results, 2000),
+            "max_results": min(max_results, ARXIV_MAX_PAGE_SIZE),
             "sortBy": sort_by,
             "sortOrder": sort_order,
         }
@@ -179,21 +315,9 @@ class ArxivClient:
         url = f"{self.base_url}?{urlencode(params, quote_via=quote, safe=safe)}"
 
         try:
-            # Add rate limiting delay between all requests (arXiv recommends 3 seconds)
-            if self._last_request_time is not None:
-                time_since_last = time.time() - self._last_request_time
-                if time_since_last < self.rate_limit_delay:
-                    sleep_time = self.rate_limit_delay - time_since_last
-                    await asyncio.sleep(sleep_time)
-
-            self._last_request_time = time.time()
+            await self._wait_for_rate_limit()
 
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                xml_data = response.text
-
-            papers = self._parse_response(xml_data)
+            papers = [paper async for paper in self._stream_page(url)]
             logger.info(f"Query returned {len(papers)} papers")
 
             return papers
@@ -208,6 +332,100 @@ class ArxivClient:
             logger.error(f"Failed to fetch papers from arXiv: {e}")
             raise ArxivAPIException(f"Unexpected error fetching papers from arXiv: {e}")
 
+    async def iter_papers(
+        self,
+        query: Optional[str] = None,
+        page_size: int = 100,
+        max_results: Optional[int] = None,
+        start: int = 0,
+        sort_by: str = "submittedDate",
+        sort_order: str = "descending",
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+    ) -> AsyncIterator[ArxivPaper]:
+        """
+        Stream papers from arXiv, paging through results with ``start`` offsets.
+
+        Pages are requested under the client rate limit and each page is parsed
+        incrementally, yielding papers as their ``</entry>`` closes, so consumers can start working before the
+        last page has arrived. Paging stops once ``opensearch:totalResults`` is
+        reached, an empty page is returned, or ``max_results`` papers were yielded.
+
+        Args:
+            query: Custom arXiv search query (defaults to the configured category,
+                filtered by from_date/to_date)
+            page_size: Number of entries requested per page (capped at 2000)
+            max_results: Total number of papers to yield (None for all results)
+            start: Starting index for pagination
+            sort_by: Sort criteria (submittedDate, lastUpdatedDate, relevance)
+            sort_order: Sort order (ascending, descending)
+            from_date: Filter papers submitted after this date (format: YYYYMMDD), default query only
+            to_date: Filter papers submitted before this date (format: YYYYMMDD), default query only
+
+        Yields:
+            ArxivPaper objects in result order
+        """
+        search_query = query or self._build_category_query(from_date, to_date)
+        page_size = max(1, min(page_size, ARXIV_MAX_PAGE_SIZE))
+
+        offset = start
+        yielded = 0
+        total_results: Optional[int] = None
+
+        while max_results is None or yielded < max_results:
+            batch_size = page_size if max_results is None else min(page_size, max_results - yielded)
+            params = {
+                "search_query": search_query,
+                "start": offset,
+                "max_results": batch_size,
+                "sortBy": sort_by,
+                "sortOrder": sort_order,
+            }
+
+            safe = ":+[]*"  # Don't encode :, +, [, ], *, characters needed for arXiv queries
+            url = f"{self.base_url}?{urlencode(params, quote_via=quote, safe=safe)}"
+
+            page_info: Dict[str, Optional[int]] = {}
+            page_count = 0
+
+            try:
+                await self._wait_for_rate_limit()
+
+                async for paper in self._stream_page(url, page_info):
+                    page_count += 1
+                    yielded += 1
+                    yield paper
+
+            except httpx.TimeoutException as e:
+                logger.error(f"arXiv API timeout at offset {offset}: {e}")
+                raise ArxivAPITimeoutError(f"arXiv API request timed out at offset {offset}: {e}")
+            except httpx.HTTPStatusError as e:
+                logger.error(f"arXiv API HTTP error at offset {offset}: {e}")
+                raise ArxivAPIException(f"arXiv API returned error {e.response.status_code} at offset {offset}: {e}")
+            except ArxivParseError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to fetch papers from arXiv at offset {offset}: {e}")
+                raise ArxivAPIException(f"Unexpected error fetching papers from arXiv at offset {offset}: {e}")
+
+            if page_info.get("total_results") is not None:
+                total_results = page_info["total_results"]
+
+            logger.info(f"Fetched page at offset {offset}: {page_count} papers (total results: {total_results})")
+
+            if not page_count:
+                if total_results is not None and offset < total_results:
+                    logger.warning(f"arXiv returned an empty page at offset {offset} of {total_results}, stopping")
+                break
+
+            # Advance by the requested size; entries that failed to parse must not shift the window
+            offset += batch_size
+
+            if total_results is not None and offset >= total_results:
+                break
+
+        logger.info(f"Streamed {yielded} papers for query: {search_query}")
+
     async def fetch_paper_by_id(self, arxiv_id: str) -> Optional[ArxivPaper]:
         """
         Fetch a specific paper by its arXiv ID.
@@ -218,65 +436,129 @@ class ArxivClient:
         Returns:
             ArxivPaper object or None if not found
         """
-        # Clean the arXiv ID (remove version if needed for search)
-        clean_id = arxiv_id.split("v")[0] if "v" in arxiv_id else arxiv_id
-        params = {"id_list": clean_id, "max_results": 1}
+        papers = await self.fetch_papers_by_ids([arxiv_id])
+        paper = papers.get(normalize_arxiv_id(arxiv_id))
 
-        safe = ":+[]*"  # Don't encode :, +, [, ], *, characters needed for arXiv queries
-        url = f"{self.base_url}?{urlencode(params, quote_via=quote, safe=safe)}"
+        if paper is None:
+            logger.warning(f"Paper {arxiv_id} not found")
+        return paper
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                xml_data = response.text
+    async def fetch_papers_by_ids(self, arxiv_ids: List[str], batch_size: Optional[int] = None) -> Dict[str, ArxivPaper]:
+        """
+        Fetch many papers by arXiv ID using batched ``id_list`` queries.
 
-            papers = self._parse_response(xml_data)
+        IDs are packed into comma-separated ``id_list`` requests of up to
+        ``batch_size`` entries, each sent under the client rate limit.
+        Versioned IDs fetch that exact version, unversioned IDs fetch the
+        latest one; either way results are keyed by the unversioned ID.
 
-            if papers:
-                return papers[0]
-            else:
-                logger.warning(f"Paper {arxiv_id} not found")
-                return None
+        Args:
+            arxiv_ids: arXiv paper IDs (e.g., ["2507.17748v1", "2507.17749", "hep-th/9901001"])
+            batch_size: Maximum IDs per request (uses settings default if None)
 
-        except httpx.TimeoutException as e:
-            logger.error(f"arXiv API timeout for paper {arxiv_id}: {e}")
-            raise ArxivAPITimeoutError(f"arXiv API request timed out for paper {arxiv_id}: {e}")
-        except httpx.HTTPStatusError as e:
-            logger.error(f"arXiv API HTTP error for paper {arxiv_id}: {e}")
-            raise ArxivAPIException(f"arXiv API returned error {e.response.status_code} for paper {arxiv_id}: {e}")
-        except Exception as e:
-            logger.error(f"Failed to fetch paper {arxiv_id} from arXiv: {e}")
-            raise ArxivAPIException(f"Unexpected error fetching paper {arxiv_id} from arXiv: {e}")
+        Returns:
+            Dict mapping normalized arXiv ID (version stripped) to ArxivPaper; missing papers are omitted
+        """
+        if batch_size is None:
+            batch_size = self._settings.id_list_batch_size
+        batch_size = max(1, min(batch_size, ARXIV_MAX_PAGE_SIZE))
+
+        # De-duplicate on the normalized ID while keeping the requested form (and version) of the first occurrence
+        requested: Dict[str, str] = {}
+        for arxiv_id in arxiv_ids:
+            cleaned = normalize_arxiv_id(arxiv_id, keep_version=True)
+            if cleaned:
+                requested.setdefault(normalize_arxiv_id(cleaned), cleaned)
+
+        id_list = list(requested.values())
+        papers: Dict[str, ArxivPaper] = {}
+
+        for i in range(0, len(id_list), batch_size):
+            batch = id_list[i : i + batch_size]
+            # id_list queries default to 10 results, so always ask for the whole batch
+            params = {"id_list": ",".join(batch), "max_results": len(batch)}
 
-    def _parse_response(self, xml_data: str) -> List[ArxivPaper]:
+            safe = ":+[]*,/"  # Don't encode :, +, [, ], *, comma and / (old-style IDs)
+            url = f"{self.base_url}?{urlencode(params, quote_via=quote, safe=safe)}"
+
+            try:
+                await self._wait_for_rate_limit()
+
+                async for paper in self._stream_page(url):
+                    key = normalize_arxiv_id(paper.arxiv_id)
+                    if key in requested:
+                        papers[key] = paper
+                    else:
+                        logger.warning(f"arXiv returned unrequested paper {paper.arxiv_id}")
+
+            except httpx.TimeoutException as e:
+                logger.error(f"arXiv API timeout for id_list batch of {len(batch)} papers: {e}")
+                raise ArxivAPITimeoutError(f"arXiv API request timed out for id_list batch of {len(batch)} papers: {e}")
+            except httpx.HTTPStatusError as e:
+                logger.error(f"arXiv API HTTP error for id_list batch of {len(batch)} papers: {e}")
+                raise ArxivAPIException(f"arXiv API returned error {e.response.status_code} for id_list batch: {e}")
+            except ArxivParseError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to fetch id_list batch of {len(batch)} papers from arXiv: {e}")
+                raise ArxivAPIException(f"Unexpected error fetching papers by ID from arXiv: {e}")
+
+        missing = len(requested) - len(papers)
+        logger.info(f"Fetched {len(papers)}/{len(requested)} papers by ID in {-(-len(id_list) // batch_size)} requests")
+        if missing:
+            logger.warning(f"{missing} requested papers not found on arXiv")
+
+        return papers
+
+    async def _stream_page(self, url: str, page_info: Optional[Dict[str, Optional[int]]] = None) -> AsyncIterator[ArxivPaper]:
         """
-        Parse arXiv API XML response into ArxivPaper objects.
+        Stream and incrementally parse an arXiv API XML response.
+
+        The body is fed chunk by chunk into an ``XMLPullParser``; each entry is
+        converted to an ArxivPaper as soon as its ``</entry>`` closes and is then
+        dropped from the tree, so memory stays flat regardless of page size.
 
         Args:
-            xml_data: Raw XML response from arXiv API
+            url: arXiv API query URL
+            page_info: Optional dict populated with ``total_results`` (opensearch:totalResults)
 
-        Returns:
-            List of parsed ArxivPaper objects
+        Yields:
+            Parsed ArxivPaper objects in feed order
         """
-        try:
-            root = ET.fromstring(xml_data)
-            entries = root.findall("atom:entry", self.namespaces)
-
-            papers = []
-            for entry in entries:
-                paper = self._parse_single_entry(entry)
-                if paper:
-                    papers.append(paper)
+        parser = ET.XMLPullParser(events=("start", "end"))
+        entry_tag = f"{{{self.namespaces['atom']}}}entry"
+        total_tag = f"{{{self.namespaces['opensearch']}}}totalResults"
+        root: Optional[ET.Element] = None
 
-            return papers
+        async with self.http_client.stream("GET", url) as response:
+            response.raise_for_status()
 
-        except ET.ParseError as e:
-            logger.error(f"Failed to parse arXiv XML response: {e}")
-            raise ArxivParseError(f"Failed to parse arXiv XML response: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error parsing arXiv response: {e}")
-            raise ArxivParseError(f"Unexpected error parsing arXiv response: {e}")
+            try:
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+
+                    for event, elem in parser.read_events():
+                        if event == "start":
+                            if root is None:
+                                root = elem
+                            continue
+
+                        if elem.tag == entry_tag:
+                            paper = self._parse_single_entry(elem)
+                            # Release the parsed entry so the tree never grows with the page size
+                            if root is not None:
+                                root.remove(elem)
+                            elem.clear()
+                            if paper:
+                                yield paper
+                        elif elem.tag == total_tag and page_info is not None:
+                            page_info["total_results"] = self._get_total_results_text(elem.text)
+
+                parser.close()
+
+            except ET.ParseError as e:
+                logger.error(f"Failed to parse arXiv XML response: {e}")
+                raise ArxivParseError(f"Failed to parse arXiv XML response: {e}")
 
     def _parse_single_entry(self, entry: ET.Element) -> Optional[ArxivPaper]:
         """
@@ -334,6 +616,23 @@ class ArxivClient:
         text = elem.text.strip()
         return text.replace("\n", " ") if clean_newlines else text
 
+    def _get_total_results_text(self, total_text: Optional[str]) -> Optional[int]:
+        """
+        Convert opensearch:totalResults text to an integer.
+
+        Args:
+            total_text: Raw element text
+
+        Returns:
+            Total number of results or None if missing/invalid
+        """
+        total_text = total_text.strip() if total_text else ""
+        try:
+            return int(total_text) if total_text else None
+        except ValueError:
+            logger.warning(f"Invalid opensearch:totalResults value: {total_text}")
+            return None
+
     def _get_arxiv_id(self, entry: ET.Element) -> Optional[str]:
         """
         Extract arXiv ID from entry.
@@ -347,7 +646,11 @@ class ArxivClient:
         id_elem = entry.find("atom:id", self.namespaces)
         if id_elem is None or id_elem.text is None:
             return None
-        return id_elem.text.split("/")[-1]
+        # Keep the archive prefix of old-style IDs (e.g. http://arxiv.org/abs/hep-th/9901001v1)
+        id_text = id_elem.text.strip()
+        if "/abs/" in id_text:
+            return id_text.split("/abs/", 1)[1]
+        return id_text.split("/")[-1]
 
     def _get_authors(self, entry: ET.Element) -> List[str]:
         """
@@ -408,27 +711,50 @@ class ArxivClient:
 
         Args:
             paper: ArxivPaper object containing PDF URL
-            force_download: Force re-download even if file exists
+            force_download: Re-validate with the server even if a cached copy exists
+                (sends If-None-Match / If-Modified-Since, keeping the cached file on 304)
 
         Returns:
             Path to downloaded PDF file or None if download failed
         """
+        pdf_path, _ = await self.download_pdf_with_stats(paper, force_download)
+        return pdf_path
+
+    async def download_pdf_with_stats(
+        self, paper: ArxivPaper, force_download: bool = False
+    ) -> Tuple[Optional[Path], Optional[PDFDownloadStats]]:
+        """
+        Download PDF like ``download_pdf`` and also return the transfer stats.
+
+        Args:
+            paper: ArxivPaper object containing PDF URL
+            force_download: Re-validate with the server even if a cached copy exists
+
+        Returns:
+            Tuple of (path or None if the download failed, PDFDownloadStats or None if served
+            from cache without a request)
+        """
         if not paper.pdf_url:
             logger.error(f"No PDF URL for paper {paper.arxiv_id}")
-            return None
+            return None, None
 
-        pdf_path = self._get_pdf_path(paper.arxiv_id)
+        try:
+            cached_entry = await asyncio.to_thread(self.pdf_cache.get, paper.arxiv_id)
+        except PDFCacheException as e:
+            logger.warning(f"PDF cache lookup failed for {paper.arxiv_id}, downloading: {e}")
+            cached_entry = None
 
-        # Return cached PDF if exists
-        if pdf_path.exists() and not force_download:
-            logger.info(f"Using cached PDF: {pdf_path.name}")
-            return pdf_path
+        # Return cached PDF if it passed validation
+        if cached_entry and not force_download:
+            logger.info(f"Using cached PDF: {cached_entry.path.name}")
+            return cached_entry.path, None
 
         # Download with retry
-        if await self._download_with_retry(paper.pdf_url, pdf_path):
-            return pdf_path
+        stats = PDFDownloadStats(arxiv_id=paper.arxiv_id)
+        if await self._download_with_retry(paper.pdf_url, paper.arxiv_id, cached_entry=cached_entry, stats=stats):
+            return self._get_pdf_path(paper.arxiv_id), stats
         else:
-            return None
+            return None, stats
 
     def _get_pdf_path(self, arxiv_id: str) -> Path:
         """
@@ -440,54 +766,240 @@ class ArxivClient:
         Returns:
             Path object for the PDF file
         """
-        safe_filename = arxiv_id.replace("/", "_") + ".pdf"
-        return self.pdf_cache_dir / safe_filename
+        return self.pdf_cache.path_for(arxiv_id)
 
-    async def _download_with_retry(self, url: str, path: Path, max_retries: Optional[int] = None) -> bool:
-        """Download a file with retry logic."""
+    async def _download_with_retry(
+        self,
+        url: str,
+        arxiv_id: str,
+        max_retries: Optional[int] = None,
+        cached_entry: Optional[PDFCacheEntry] = None,
+        stats: Optional[PDFDownloadStats] = None,
+    ) -> bool:
+        """
+        Download a PDF into the cache with retry logic.
+
+        Bytes are appended to a ``<id>.pdf.part`` file that survives failed
+        attempts (and runs), next to a ``.part.validator`` file holding the ETag /
+        Last-Modified it was started with. Later attempts resume it with
+        ``Range: bytes=N-`` plus ``If-Range``, so a PDF that changed on the server
+        comes back as a full 200 instead of being appended to the old prefix; a
+        partial file without a validator is discarded. The final length is checked
+        against Content-Length / Content-Range and the sha256 is computed while
+        streaming before the file is atomically moved into the cache. Disk writes
+        run in a worker thread. Transfer figures are recorded in ``stats``.
+        """
         if max_retries is None:
             max_retries = self._settings.download_max_retries
 
+        path = self._get_pdf_path(arxiv_id)
+        part_path = path.with_name(f"{path.name}.part")
+        validator_path = part_path.with_name(f"{part_path.name}.validator")
+
+        # Conditional request when re-validating an existing cache entry
+        headers = {"Accept-Encoding": "identity"}  # Byte ranges must refer to the raw file
+        if cached_entry is not None:
+            if cached_entry.etag:
+                headers["If-None-Match"] = cached_entry.etag
+            if cached_entry.last_modified:
+                headers["If-Modified-Since"] = cached_entry.last_modified
+
+        if stats is None:
+            stats = PDFDownloadStats(arxiv_id=arxiv_id)
+        started_at = time.monotonic()
+        restarted = False
+        attempt = 0
+
         logger.info(f"Downloading PDF from {url}")
 
-        # Respect rate limits
-        await asyncio.sleep(self.rate_limit_delay)
+        try:
+            while attempt < max_retries:
+                stats.attempts += 1
+                try:
+                    # Every attempt takes a token from the shared PDF bucket
+                    await self._pdf_rate_limiter.acquire()
+
+                    resume_from, validators = await asyncio.to_thread(self._load_partial_download, part_path, validator_path)
+                    request_headers = dict(headers)
+                    if resume_from:
+                        request_headers["Range"] = f"bytes={resume_from}-"
+                        request_headers["If-Range"] = self._if_range_validator(validators)
+
+                    async with self.http_client.stream("GET", url, headers=request_headers) as response:
+                        if response.status_code == 304 and cached_entry is not None:
+                            logger.info(f"PDF not modified, keeping cached copy: {path.name}")
+                            await asyncio.to_thread(self.pdf_cache.touch, arxiv_id)
+                            stats.not_modified = True
+                            return True
+
+                        if response.status_code == 416:
+                            # Stale or oversized partial file; one free restart from byte 0
+                            await asyncio.to_thread(self._discard_partial_download, part_path, validator_path)
+                            if not restarted:
+                                restarted = True
+                                logger.warning(f"Server rejected resume of {part_path.name} at byte {resume_from}, restarting")
+                                continue
 
-        for attempt in range(max_retries):
-            try:
-                async with httpx.AsyncClient(timeout=float(self.timeout_seconds)) as client:
-                    async with client.stream("GET", url) as response:
                         response.raise_for_status()
-                        with open(path, "wb") as f:
+
+                        if resume_from and response.status_code == 206:
+                            expected_size = self._parse_content_range_total(response.headers.get("Content-Range"))
+                            stats.resumed = True
+                            stats.bytes_resumed += resume_from
+                            logger.info(f"Resuming {path.name} from byte {resume_from}")
+                        else:
+                            # Range unsupported, validator changed or no partial file: full download
+                            resume_from = 0
+                            content_length = response.headers.get("Content-Length")
+                            expected_size = int(content_length) if content_length and content_length.isdigit() else None
+                            validators = {
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                            }
+
+                        etag = response.headers.get("ETag") or validators.get("etag")
+                        last_modified = response.headers.get("Last-Modified") or validators.get("last_modified")
+
+                        f, digest = await asyncio.to_thread(
+                            self._open_partial_download, part_path, validator_path, resume_from, validators
+                        )
+                        written = 0
+                        try:
                             async for chunk in response.aiter_bytes():
-                                f.write(chunk)
-                logger.info(f"Successfully downloaded to {path.name}")
-                return True
+                                await asyncio.to_thread(self._write_chunk, f, digest, chunk)
+                                written += len(chunk)
+                                stats.bytes_downloaded += len(chunk)
+                        finally:
+                            await asyncio.to_thread(f.close)
+
+                    final_size = resume_from + written
+                    if expected_size is not None and final_size != expected_size:
+                        if final_size > expected_size:
+                            await asyncio.to_thread(self._discard_partial_download, part_path, validator_path)
+                        raise httpx.RemoteProtocolError(
+                            f"Incomplete PDF download for {arxiv_id}: {final_size} of {expected_size} bytes"
+                        )
+
+                    # The index write and eviction unlinks stay off the event loop
+                    await asyncio.to_thread(
+                        self.pdf_cache.put,
+                        arxiv_id,
+                        part_path,
+                        sha256=digest.hexdigest(),
+                        etag=etag,
+                        last_modified=last_modified,
+                    )
+                    await asyncio.to_thread(validator_path.unlink, missing_ok=True)
+                    logger.info(f"Successfully downloaded to {path.name}")
+                    return True
+
+                except httpx.TimeoutException as e:
+                    if attempt < max_retries - 1:
+                        wait_time = self._settings.download_retry_delay_base * (attempt + 1)
+                        logger.warning(f"PDF download timeout (attempt {attempt + 1}/{max_retries}): {e}")
+                        logger.info(f"Retrying in {wait_time}s...")
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logger.error(f"PDF download failed after {max_retries} attempts due to timeout: {e}")
+                        raise PDFDownloadTimeoutError(f"PDF download timed out after {max_retries} attempts: {e}")
+                except httpx.HTTPError as e:
+                    if attempt < max_retries - 1:
+                        wait_time = self._settings.download_retry_delay_base * (attempt + 1)  # Exponential backoff
+                        logger.warning(f"Download failed (attempt {attempt + 1}/{max_retries}): {e}")
+                        logger.info(f"Retrying in {wait_time}s...")
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logger.error(f"Failed after {max_retries} attempts: {e}")
+                        raise PDFDownloadException(f"PDF download failed after {max_retries} attempts: {e}")
+                except Exception as e:
+                    logger.error(f"Unexpected download error: {e}")
+                    raise PDFDownloadException(f"Unexpected error during PDF download: {e}")
+
+                attempt += 1
+
+            # Only reached with max_retries <= 0
+            return False
+
+        finally:
+            stats.seconds = time.monotonic() - started_at
+
+    @staticmethod
+    def _load_partial_download(part_path: Path, validator_path: Path) -> Tuple[int, Dict[str, Optional[str]]]:
+        """
+        Find a resumable partial download.
 
-            except httpx.TimeoutException as e:
-                if attempt < max_retries - 1:
-                    wait_time = self._settings.download_retry_delay_base * (attempt + 1)
-                    logger.warning(f"PDF download timeout (attempt {attempt + 1}/{max_retries}): {e}")
-                    logger.info(f"Retrying in {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(f"PDF download failed after {max_retries} attempts due to timeout: {e}")
-                    raise PDFDownloadTimeoutError(f"PDF download timed out after {max_retries} attempts: {e}")
-            except httpx.HTTPError as e:
-                if attempt < max_retries - 1:
-                    wait_time = self._settings.download_retry_delay_base * (attempt + 1)  # Exponential backoff
-                    logger.warning(f"Download failed (attempt {attempt + 1}/{max_retries}): {e}")
-                    logger.info(f"Retrying in {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(f"Failed after {max_retries} attempts: {e}")
-                    raise PDFDownloadException(f"PDF download failed after {max_retries} attempts: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected download error: {e}")
-                raise PDFDownloadException(f"Unexpected error during PDF download: {e}")
+        Returns:
+            Tuple of (bytes already on disk, validators the download was started with); (0, {})
+            when there is nothing to resume. A partial file without a usable validator is deleted.
+        """
+        resume_from = part_path.stat().st_size if part_path.exists() else 0
+        try:
+            validators = json.loads(validator_path.read_text()) if resume_from else {}
+        except (OSError, ValueError):
+            validators = {}
+        if not isinstance(validators, dict):
+            validators = {}
+
+        if resume_from and ArxivClient._if_range_validator(validators) is None:
+            # Without If-Range a changed PDF would be appended to the old prefix
+            logger.info(f"Discarding {part_path.name}: no validator to resume it safely")
+            ArxivClient._discard_partial_download(part_path, validator_path)
+            return 0, {}
+        return resume_from, validators
+
+    @staticmethod
+    def _if_range_validator(validators: Dict[str, Optional[str]]) -> Optional[str]:
+        """Strong ETag, else Last-Modified; If-Range cannot use weak ETags."""
+        etag = validators.get("etag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return validators.get("last_modified")
+
+    @staticmethod
+    def _open_partial_download(
+        part_path: Path, validator_path: Path, resume_from: int, validators: Dict[str, Optional[str]]
+    ) -> Tuple[BinaryIO, Any]:
+        """
+        Open the ``.part`` file for writing and start its sha256.
 
-        # Clean up partial download
-        if path.exists():
-            path.unlink()
+        A resumed download hashes the prefix already on disk first; a new one truncates the
+        file and records the validators to resume it with later.
+        """
+        digest = hashlib.sha256()
+        if resume_from:
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+            return open(part_path, "ab"), digest
+
+        if ArxivClient._if_range_validator(validators) is not None:
+            validator_path.write_text(json.dumps(validators))
+        else:
+            validator_path.unlink(missing_ok=True)
+        return open(part_path, "wb"), digest
+
+    @staticmethod
+    def _write_chunk(f: BinaryIO, digest: Any, chunk: bytes) -> None:
+        f.write(chunk)
+        digest.update(chunk)
+
+    @staticmethod
+    def _discard_partial_download(part_path: Path, validator_path: Path) -> None:
+        part_path.unlink(missing_ok=True)
+        validator_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _parse_content_range_total(content_range: Optional[str]) -> Optional[int]:
+        """
+        Extract the complete length from a Content-Range header.
 
-        return False
+        Args:
+            content_range: Header value (e.g., "bytes 1000-1999/2000")
+
+        Returns:
+            Total size in bytes or None if unknown
+        """
+        if not content_range or "/" not in content_range:
+            return None
+        total = content_range.rsplit("/", 1)[1].strip()
+        return int(total) if total.isdigit() else None
@@ -1,6 +1,44 @@
-from src.config import get_settings
+import logging
+from typing import Tuple
+
+from src.config import Settings, get_settings
 
 from .client import ArxivClient
+from .rate_limiter import InMemoryRateLimiter, RateLimiter, RedisRateLimiter, rate_from_delay
+
+logger = logging.getLogger(__name__)
+
+
+def make_arxiv_rate_limiters(settings: Settings) -> Tuple[RateLimiter, RateLimiter]:
+    """Create the metadata API and PDF download rate limiters for the configured backend.
+
+    Falls back to in-process buckets when the Redis backend is selected but unreachable.
+
+    :param settings: Application settings
+    :returns: Tuple of (api_rate_limiter, pdf_rate_limiter)
+    """
+    arxiv_settings = settings.arxiv
+    api_rate = rate_from_delay(arxiv_settings.rate_limit_delay)
+    pdf_rate = rate_from_delay(arxiv_settings.pdf_rate_limit_delay)
+
+    if arxiv_settings.rate_limit_backend == "redis":
+        from src.services.cache.factory import make_redis_client
+
+        try:
+            redis_client = make_redis_client(settings)
+            prefix = arxiv_settings.rate_limit_redis_prefix
+            logger.info(f"Using Redis-backed arXiv rate limiter ({prefix})")
+            return (
+                RedisRateLimiter("api", api_rate, arxiv_settings.rate_limit_burst, redis_client, f"{prefix}:api"),
+                RedisRateLimiter("pdf", pdf_rate, arxiv_settings.pdf_rate_limit_burst, redis_client, f"{prefix}:pdf"),
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limiter unavailable, falling back to in-process rate limiting: {e}")
+
+    return (
+        InMemoryRateLimiter("api", api_rate, arxiv_settings.rate_limit_burst),
+        InMemoryRateLimiter("pdf", pdf_rate, arxiv_settings.pdf_rate_limit_burst),
+    )
 
 
 def make_arxiv_client() -> ArxivClient:
@@ -12,7 +50,9 @@ def make_arxiv_client() -> ArxivClient:
     # Get settings from centralized config
     settings = get_settings()
 
+    api_rate_limiter, pdf_rate_limiter = make_arxiv_rate_limiters(settings)
+
     # Create arXiv client with explicit settings
-    client = ArxivClient(settings=settings.arxiv)
+    client = ArxivClient(settings=settings.arxiv, api_rate_limiter=api_rate_limiter, pdf_rate_limiter=pdf_rate_limiter)
 
     return client
@@ -0,0 +1,362 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from src.exceptions import PDFCacheException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PDFCacheEntry:
+    """Index record for a cached PDF."""
+
+    arxiv_id: str
+    path: Path
+    size: int
+    sha256: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    last_access: float = 0.0
+    page_count: Optional[int] = None
+    has_text_layer: Optional[bool] = None
+
+
+class PDFCache:
+    """Size-bounded PDF cache with an on-disk SQLite index and LRU eviction.
+
+    Files are written atomically (temp file + rename) and every entry records its
+    size and sha256, so truncated downloads never look like cache hits. Lookups
+    only compare the indexed size with ``stat()``; full hash checks are opt-in.
+
+    Methods block on sqlite and file I/O; async callers run them with ``asyncio.to_thread``.
+    """
+
+    INDEX_FILENAME = "pdf_cache_index.sqlite3"
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes  # 0 disables eviction
+        self.index_path = self.cache_dir / self.INDEX_FILENAME
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        # Entries still needed by this process (e.g. downloaded and queued for parsing)
+        self._pinned: Counter = Counter()
+        self._pin_lock = threading.Lock()
+
+        self._init_index()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived index connection (safe across processes sharing the cache dir)."""
+        try:
+            conn = sqlite3.connect(self.index_path, timeout=30)
+        except sqlite3.Error as e:
+            raise PDFCacheException(f"Failed to open PDF cache index {self.index_path}: {e}")
+
+        try:
+            with conn:
+                yield conn
+        except sqlite3.Error as e:
+            logger.error(f"PDF cache index error: {e}")
+            raise PDFCacheException(f"PDF cache index error: {e}")
+        finally:
+            conn.close()
+
+    def _init_index(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pdf_cache (
+                    arxiv_id TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    last_access REAL NOT NULL,
+                    page_count INTEGER,
+                    has_text_layer INTEGER
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pdf_cache_last_access ON pdf_cache (last_access)")
+
+            # Indexes created before validation results were memoized lack these columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(pdf_cache)")}
+            for column, column_type in (("page_count", "INTEGER"), ("has_text_layer", "INTEGER")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE pdf_cache ADD COLUMN {column} {column_type}")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pdf_cache_filename ON pdf_cache (filename)")
+
+    def path_for(self, arxiv_id: str) -> Path:
+        """Get the final cache path for a paper's PDF."""
+        safe_filename = arxiv_id.replace("/", "_") + ".pdf"
+        return self.cache_dir / safe_filename
+
+    _COLUMNS = "arxiv_id, filename, size, sha256, etag, last_modified, last_access, page_count, has_text_layer"
+
+    def _row_to_entry(self, row: tuple) -> PDFCacheEntry:
+        arxiv_id, filename, size, sha256, etag, last_modified, last_access, page_count, has_text_layer = row
+        return PDFCacheEntry(
+            arxiv_id=arxiv_id,
+            path=self.cache_dir / filename,
+            size=size,
+            sha256=sha256,
+            etag=etag,
+            last_modified=last_modified,
+            last_access=last_access,
+            page_count=page_count,
+            has_text_layer=None if has_text_layer is None else bool(has_text_layer),
+        )
+
+    def get(self, arxiv_id: str, verify_hash: bool = False) -> Optional[PDFCacheEntry]:
+        """
+        Look up a valid cache entry and mark it as recently used.
+
+        Args:
+            arxiv_id: arXiv paper ID
+            verify_hash: Also re-hash the file and compare with the indexed sha256
+
+        Returns:
+            PDFCacheEntry or None on a miss (stale entries are dropped)
+        """
+        entry = self.peek(arxiv_id)
+
+        if entry is None:
+            entry = self._adopt_unindexed(arxiv_id)
+
+        if entry is not None and not self._is_valid(entry, verify_hash):
+            logger.warning(f"Dropping invalid cached PDF for {arxiv_id}")
+            self.remove(arxiv_id)
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self.touch(arxiv_id)
+        return entry
+
+    def peek(self, arxiv_id: str) -> Optional[PDFCacheEntry]:
+        """Get the indexed entry without validating it or updating its access time."""
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {self._COLUMNS} FROM pdf_cache WHERE arxiv_id = ?", (arxiv_id,)).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def lookup_file(self, path: Path) -> Optional[PDFCacheEntry]:
+        """
+        Get the entry for a file in the cache directory if its size still matches the index.
+
+        Used by the PDF parser to reuse the indexed sha256 and memoized validation results.
+        Does not count as a cache hit or update the access time.
+        """
+        path = Path(path)
+        if path.parent.resolve() != self.cache_dir.resolve():
+            return None
+
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT {self._COLUMNS} FROM pdf_cache WHERE filename = ?", (path.name,)).fetchone()
+        if row is None:
+            return None
+
+        entry = self._row_to_entry(row)
+        return entry if self._is_valid(entry) else None
+
+    def record_pdf_info(self, arxiv_id: str, sha256: str, page_count: int, has_text_layer: bool) -> None:
+        """Memoize validation results; ignored if the entry was replaced by different content meanwhile."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE pdf_cache SET page_count = ?, has_text_layer = ? WHERE arxiv_id = ? AND sha256 = ?",
+                (page_count, int(has_text_layer), arxiv_id, sha256),
+            )
+
+    def _is_valid(self, entry: PDFCacheEntry, verify_hash: bool = False) -> bool:
+        try:
+            if entry.path.stat().st_size != entry.size:
+                return False
+        except FileNotFoundError:
+            return False
+
+        if verify_hash:
+            return self._hash_file(entry.path) == entry.sha256
+        return True
+
+    def _adopt_unindexed(self, arxiv_id: str) -> Optional[PDFCacheEntry]:
+        """Index a PDF written before the index existed, if it looks complete."""
+        path = self.path_for(arxiv_id)
+        if not path.exists() or not self._looks_complete(path):
+            return None
+
+        logger.info(f"Adopting unindexed cached PDF: {path.name}")
+        return self._upsert(arxiv_id, path, path.stat().st_size, self._hash_file(path), None, None)
+
+    @staticmethod
+    def _looks_complete(path: Path) -> bool:
+        """Cheap completeness check: PDF header at the start and %%EOF marker near the end."""
+        try:
+            with open(path, "rb") as f:
+                if not f.read(5).startswith(b"%PDF-"):
+                    return False
+                f.seek(max(0, path.stat().st_size - 1024))
+                return b"%%EOF" in f.read()
+        except OSError:
+            return False
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def put(
+        self,
+        arxiv_id: str,
+        temp_path: Path,
+        sha256: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> PDFCacheEntry:
+        """
+        Atomically move a fully written temp file into the cache and index it.
+
+        Args:
+            arxiv_id: arXiv paper ID
+            temp_path: Completed download in the cache directory
+            sha256: Hex digest computed while streaming (computed from the file if None)
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            The stored PDFCacheEntry
+        """
+        final_path = self.path_for(arxiv_id)
+        size = temp_path.stat().st_size
+        if sha256 is None:
+            sha256 = self._hash_file(temp_path)
+
+        os.replace(temp_path, final_path)
+        entry = self._upsert(arxiv_id, final_path, size, sha256, etag, last_modified)
+        self.evict(keep=arxiv_id)
+        return entry
+
+    def _upsert(
+        self, arxiv_id: str, path: Path, size: int, sha256: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> PDFCacheEntry:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO pdf_cache (arxiv_id, filename, size, sha256, etag, last_modified, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(arxiv_id) DO UPDATE SET
+                    filename = excluded.filename,
+                    size = excluded.size,
+                    sha256 = excluded.sha256,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    last_access = excluded.last_access,
+                    page_count = CASE WHEN pdf_cache.sha256 = excluded.sha256 THEN pdf_cache.page_count END,
+                    has_text_layer = CASE WHEN pdf_cache.sha256 = excluded.sha256 THEN pdf_cache.has_text_layer END
+                """,
+                (arxiv_id, path.name, size, sha256, etag, last_modified, now),
+            )
+        return PDFCacheEntry(arxiv_id, path, size, sha256, etag, last_modified, now)
+
+    def touch(self, arxiv_id: str) -> None:
+        """Mark an entry as recently used."""
+        with self._connect() as conn:
+            conn.execute("UPDATE pdf_cache SET last_access = ? WHERE arxiv_id = ?", (time.time(), arxiv_id))
+
+    def remove(self, arxiv_id: str) -> None:
+        """Remove an entry and its file."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM pdf_cache WHERE arxiv_id = ?", (arxiv_id,))
+        self.path_for(arxiv_id).unlink(missing_ok=True)
+
+    def pin(self, arxiv_id: str) -> None:
+        """Protect an entry from eviction by this process until ``unpin``; pins nest."""
+        with self._pin_lock:
+            self._pinned[arxiv_id] += 1
+
+    def unpin(self, arxiv_id: str) -> None:
+        with self._pin_lock:
+            self._pinned[arxiv_id] -= 1
+            if self._pinned[arxiv_id] <= 0:
+                del self._pinned[arxiv_id]
+
+    def total_size(self) -> int:
+        """Total indexed bytes."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM pdf_cache").fetchone()[0]
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Evict least recently used entries until the cache fits the byte budget.
+
+        Pinned entries are never evicted.
+
+        Args:
+            keep: arXiv ID that must not be evicted (e.g. the file just written)
+
+        Returns:
+            Number of evicted entries
+        """
+        if self.max_size_bytes <= 0:
+            return 0
+
+        total = self.total_size()
+        if total <= self.max_size_bytes:
+            return 0
+
+        with self._connect() as conn:
+            candidates = conn.execute("SELECT arxiv_id, size FROM pdf_cache ORDER BY last_access ASC").fetchall()
+
+        with self._pin_lock:
+            protected = set(self._pinned)
+        if keep is not None:
+            protected.add(keep)
+
+        evicted = 0
+        for arxiv_id, size in candidates:
+            if total <= self.max_size_bytes:
+                break
+            if arxiv_id in protected:
+                continue
+            self.remove(arxiv_id)
+            total -= size
+            evicted += 1
+
+        self._evictions += evicted
+        if evicted:
+            logger.info(f"Evicted {evicted} PDFs from cache ({total / 1024 / 1024:.1f}MB remaining)")
+        return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache usage and hit/miss counters."""
+        with self._connect() as conn:
+            entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pdf_cache").fetchone()
+        return {
+            "entries": entries,
+            "size_bytes": total,
+            "max_size_bytes": self.max_size_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
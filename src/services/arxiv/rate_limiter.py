@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+# Atomic token bucket with reservation: tokens may go negative, the returned value is
+# how long the caller must wait for its reserved token. Times come from the Redis
+# server clock so every worker shares one timeline.
+REDIS_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local server_time = redis.call('TIME')
+local now = tonumber(server_time[1]) + tonumber(server_time[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - requested
+
+local wait = 0
+if tokens < 0 then
+    wait = -tokens / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((wait + capacity / rate) * 1000) + 1000)
+
+return tostring(wait)
+"""
+
+
+def rate_from_delay(delay_seconds: float) -> float:
+    """Convert a per-request delay into a token rate (tokens per second); a delay of 0 disables limiting."""
+    return 1.0 / delay_seconds if delay_seconds > 0 else math.inf
+
+
+class RateLimiter(ABC):
+    """Base class for token bucket rate limiters shared by arXiv operations."""
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        if rate <= 0:
+            raise ValueError("Rate limiter rate must be positive")
+        if capacity < 1:
+            raise ValueError("Rate limiter capacity must be at least 1")
+
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+        self._acquisitions = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @abstractmethod
+    async def _reserve(self, tokens: float) -> float:
+        """Reserve tokens and return the number of seconds to wait before using them."""
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until the requested tokens are available.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            Seconds spent waiting
+        """
+        # An infinite rate (zero delay) disables limiting but still records metrics
+        wait_time = 0.0 if math.isinf(self.rate) else await self._reserve(tokens)
+        if wait_time > 0:
+            logger.debug(f"Rate limiter '{self.name}' waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+
+        self._acquisitions += 1
+        self._total_wait += wait_time
+        if wait_time > 0:
+            self._throttled += 1
+            self._max_wait = max(self._max_wait, wait_time)
+
+        return wait_time
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get wait-time metrics collected by this limiter instance."""
+        return {
+            "name": self.name,
+            "backend": self.backend,
+            "rate_per_second": None if math.isinf(self.rate) else self.rate,
+            "capacity": self.capacity,
+            "acquisitions": self._acquisitions,
+            "throttled": self._throttled,
+            "total_wait_seconds": round(self._total_wait, 3),
+            "avg_wait_seconds": round(self._total_wait / self._acquisitions, 3) if self._acquisitions else 0.0,
+            "max_wait_seconds": round(self._max_wait, 3),
+        }
+
+    def reset_stats(self) -> None:
+        """Reset collected wait-time metrics."""
+        self._acquisitions = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    @abstractmethod
+    def backend(self) -> str:
+        """Backend identifier used in metrics."""
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """In-process asyncio token bucket."""
+
+    def __init__(self, name: str, rate: float, capacity: float = 1.0):
+        super().__init__(name, rate, capacity)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    @property
+    def backend(self) -> str:
+        return "memory"
+
+    async def _reserve(self, tokens: float) -> float:
+        # No await between read and update, so this is atomic on the event loop
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate) - tokens
+        self._updated_at = now
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class RedisRateLimiter(RateLimiter):
+    """Redis-backed token bucket shared by every process using the same key."""
+
+    def __init__(self, name: str, rate: float, capacity: float, redis_client: redis.Redis, key: str):
+        super().__init__(name, rate, capacity)
+        self.redis = redis_client
+        self.key = key
+        self._script = redis_client.register_script(REDIS_TOKEN_BUCKET_SCRIPT)
+        self._fallback = InMemoryRateLimiter(name, rate, capacity)
+
+    @property
+    def backend(self) -> str:
+        return "redis"
+
+    async def _reserve(self, tokens: float) -> float:
+        try:
+            result = await asyncio.to_thread(self._script, keys=[self.key], args=[self.rate, self.capacity, tokens])
+            return max(0.0, float(result))
+        except redis.RedisError as e:
+            logger.warning(f"Redis rate limiter '{self.name}' unavailable, using in-process bucket: {e}")
+            return await self._fallback._reserve(tokens)
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 import redis
 from src.config import Settings
@@ -7,9 +8,15 @@ from src.services.cache.client import CacheClient
 logger = logging.getLogger(__name__)
 
 
-def make_redis_client(settings: Settings) -> redis.Redis:
-    """Create Redis client with connection pooling."""
+def make_redis_client(settings: Settings, decode_responses: Optional[bool] = None) -> redis.Redis:
+    """Create Redis client with connection pooling.
+
+    :param settings: Application settings
+    :param decode_responses: Override ``settings.redis.decode_responses`` (binary values need False)
+    """
     redis_settings = settings.redis
+    if decode_responses is None:
+        decode_responses = redis_settings.decode_responses
 
     try:
         client = redis.Redis(
@@ -17,7 +24,7 @@ def make_redis_client(settings: Settings) -> redis.Redis:
             port=redis_settings.port,
             password=redis_settings.password if redis_settings.password else None,
             db=redis_settings.db,
-            decode_responses=redis_settings.decode_responses,
+            decode_responses=decode_responses,
             socket_timeout=redis_settings.socket_timeout,
             socket_connect_timeout=redis_settings.socket_connect_timeout,
             retry_on_timeout=True,
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from src.exceptions import EmbeddingCacheException
+
+from .cache import EmbeddingCache
+from .query_cache import QueryEmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+# Cache namespaces for the two embedding roles (Jina's task names, reused by every backend)
+PASSAGE_TASK = "retrieval.passage"
+QUERY_TASK = "retrieval.query"
+
+
+class EmbeddingsBackend(ABC):
+    """Interface shared by embedding backends used for indexing and search.
+
+    Backends implement ``_embed_passages`` and ``_embed_query``; the public methods put the
+    passage cache and the query cache in front of them. Cache keys include ``model_id`` and
+    ``dimensions``, so backends never read each other's vectors.
+    """
+
+    def __init__(self, cache: Optional[EmbeddingCache] = None, query_cache: Optional[QueryEmbeddingCache] = None):
+        self.cache = cache
+        self.query_cache = query_cache
+
+    @property
+    @abstractmethod
+    def model_id(self) -> str:
+        """Model identifier, stored with indexed chunks as ``embedding_model``."""
+
+    @property
+    @abstractmethod
+    def dimensions(self) -> int:
+        """Length of the returned vectors."""
+
+    @abstractmethod
+    async def _embed_passages(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """Embed passages without caching, one embedding per text in input order."""
+
+    @abstractmethod
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed a search query without caching."""
+
+    async def embed_passages(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
+        """
+        Embed passages, serving cached vectors and embedding only the distinct misses.
+
+        Args:
+            texts: Passages to embed
+            batch_size: Passages per request or inference batch
+
+        Returns:
+            One embedding per passage, in input order
+        """
+        if not texts:
+            return []
+
+        if self.cache is None:
+            return await self._embed_passages(texts, batch_size)
+
+        keys = [self.cache.make_key(text, self.model_id, PASSAGE_TASK, self.dimensions) for text in texts]
+        cached = await self._cache_get(keys)
+
+        misses: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in misses:
+                misses[key] = text
+
+        if misses:
+            embedded = await self._embed_passages(list(misses.values()), batch_size)
+            computed = dict(zip(misses.keys(), embedded))
+            await self._cache_put(computed)
+            cached.update(computed)
+
+        logger.info(f"Embedded {len(texts)} passages ({len(texts) - len(misses)} from cache)")
+        return [cached[key] for key in keys]
+
+    async def embed_query(self, query: str) -> List[float]:
+        """Embed a search query, checking the query embedding cache first."""
+        if self.query_cache is None:
+            return await self._embed_query(query)
+
+        cache_key = self.query_cache.make_key(query, self.model_id, self.dimensions)
+        embedding = await self.query_cache.get(cache_key)
+        if embedding is not None:
+            logger.debug(f"Query embedding cache hit: '{query[:50]}...'")
+            return embedding
+
+        embedding = await self._embed_query(query)
+        await self.query_cache.put(cache_key, embedding)
+        return embedding
+
+    async def _cache_get(self, keys: List[str]) -> Dict[str, List[float]]:
+        try:
+            return await asyncio.to_thread(self.cache.get_many, keys)
+        except EmbeddingCacheException as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all passages: {e}")
+            return {}
+
+    async def _cache_put(self, embeddings: Dict[str, List[float]]) -> None:
+        try:
+            await asyncio.to_thread(self.cache.put_many, embeddings)
+        except EmbeddingCacheException as e:
+            logger.warning(f"Failed to cache {len(embeddings)} embeddings: {e}")
+
+    async def close(self):
+        """Release backend resources."""
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from .base import EmbeddingsBackend
+
+logger = logging.getLogger(__name__)
+
+
+class _Caller:
+    """Result slots of one ``embed`` call, completed when its last text is embedded."""
+
+    __slots__ = ("embeddings", "remaining", "future")
+
+    def __init__(self, size: int, future: asyncio.Future):
+        self.embeddings: List[Optional[List[float]]] = [None] * size
+        self.remaining = size
+        self.future = future
+
+
+class EmbeddingBatcher:
+    """Coalesces passage embeddings from concurrent callers into full-size API requests.
+
+    Callers (e.g. one per paper being indexed) await ``embed`` with their own texts. Texts are
+    queued and sent as one request as soon as ``batch_size`` are waiting, or after
+    ``max_wait_seconds`` for a partial batch. Each caller gets back exactly its embeddings, in
+    order. A failed request fails every caller with a text in it.
+    """
+
+    def __init__(self, embeddings_client: EmbeddingsBackend, batch_size: int = 50, max_wait_seconds: float = 0.1):
+        self.embeddings_client = embeddings_client
+        self.batch_size = max(1, batch_size)
+        self.max_wait_seconds = max_wait_seconds
+
+        self._pending: List[Tuple[str, _Caller, int]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight: set = set()
+
+        self._requests = 0
+        self._texts = 0
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Queue texts for embedding and wait for their vectors."""
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        caller = _Caller(len(texts), loop.create_future())
+        self._pending.extend((text, caller, position) for position, text in enumerate(texts))
+
+        while len(self._pending) >= self.batch_size:
+            self._send(self._pending[: self.batch_size])
+            del self._pending[: self.batch_size]
+
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self.flush)
+        elif not self._pending and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        return await caller.future
+
+    def flush(self) -> None:
+        """Send whatever is queued now, even if the batch is not full."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            self._send(self._pending)
+            self._pending = []
+
+    def _send(self, batch: List[Tuple[str, _Caller, int]]) -> None:
+        task = asyncio.create_task(self._embed_batch(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _embed_batch(self, batch: List[Tuple[str, _Caller, int]]) -> None:
+        texts = [text for text, _, _ in batch]
+        self._requests += 1
+        self._texts += len(texts)
+        try:
+            embeddings = await self.embeddings_client.embed_passages(texts, batch_size=len(texts))
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Embedding count mismatch: {len(embeddings)} != {len(texts)}")
+        except Exception as e:
+            for _, caller, _ in batch:
+                if not caller.future.done():
+                    caller.future.set_exception(e)
+            return
+
+        for (_, caller, position), embedding in zip(batch, embeddings):
+            caller.embeddings[position] = embedding
+            caller.remaining -= 1
+            if caller.remaining == 0 and not caller.future.done():
+                caller.future.set_result(caller.embeddings)
+
+    async def close(self) -> None:
+        """Flush the queue and wait for requests in flight."""
+        self.flush()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        if self._requests:
+            logger.info(
+                f"Embedding batcher sent {self._texts} texts in {self._requests} requests "
+                f"(average {self._texts / self._requests:.1f} per request, batch size {self.batch_size})"
+            )
@@ -0,0 +1,277 @@
+import hashlib
+import logging
+import sqlite3
+import struct
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import redis
+from src.exceptions import EmbeddingCacheException
+
+logger = logging.getLogger(__name__)
+
+# Stored vectors start with their struct format char, so entries survive a dtype change
+_DTYPE_FORMATS = {"float32": "f", "float16": "e"}
+_FORMAT_SIZES = {"f": 4, "e": 2}
+
+# SQLite limits bound parameters per statement
+_SQLITE_BATCH = 500
+
+
+def encode_vector(vector: List[float], dtype: str = "float32") -> bytes:
+    fmt = _DTYPE_FORMATS[dtype]
+    return fmt.encode() + struct.pack(f"<{len(vector)}{fmt}", *vector)
+
+
+def decode_vector(blob: bytes) -> List[float]:
+    fmt = chr(blob[0])
+    return list(struct.unpack(f"<{(len(blob) - 1) // _FORMAT_SIZES[fmt]}{fmt}", blob[1:]))
+
+
+class EmbeddingCache(ABC):
+    """Cache of computed embeddings keyed by text hash, model, task and dimensions.
+
+    Subclasses store opaque vector blobs; encoding, hit/miss counting and the key scheme live
+    here. Vectors are stored as float32, or as float16 to halve the footprint.
+    """
+
+    def __init__(self, dtype: str = "float32"):
+        if dtype not in _DTYPE_FORMATS:
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        self.dtype = dtype
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(text: str, model: str, task: str, dimensions: int) -> str:
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}:{task}:{dimensions}:{text_hash}"
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up several embeddings at once and mark the hits as recently used.
+
+        Args:
+            keys: Keys from ``make_key``
+
+        Returns:
+            Dict of key to embedding for the keys that were cached
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found = {key: decode_vector(blob) for key, blob in self._get_blobs(unique_keys).items()}
+        self._hits += len(found)
+        self._misses += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store several embeddings and evict old entries if over budget."""
+        if embeddings:
+            self._put_blobs({key: encode_vector(vector, self.dtype) for key, vector in embeddings.items()})
+            self._evictions += self.evict()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache usage and hit/miss counters since the last reset."""
+        lookups = self._hits + self._misses
+        return {
+            **self._usage(),
+            "dtype": self.dtype,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @abstractmethod
+    def _get_blobs(self, keys: List[str]) -> Dict[str, bytes]:
+        """Fetch stored blobs for the keys that exist."""
+
+    @abstractmethod
+    def _put_blobs(self, blobs: Dict[str, bytes]) -> None:
+        """Store blobs, overwriting existing keys."""
+
+    @abstractmethod
+    def evict(self) -> int:
+        """Evict least recently used entries until the cache fits its budget; returns the count."""
+
+    @abstractmethod
+    def _usage(self) -> Dict[str, Any]:
+        """Entry count and size figures for ``get_stats``."""
+
+
+class SQLiteEmbeddingCache(EmbeddingCache):
+    """Local embedding cache in a SQLite file, size-bounded with LRU eviction."""
+
+    INDEX_FILENAME = "embedding_cache.sqlite3"
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int = 0, dtype: str = "float32"):
+        super().__init__(dtype)
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes  # 0 disables eviction
+        self.db_path = self.cache_dir / self.INDEX_FILENAME
+
+        self._init_db()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+        except sqlite3.Error as e:
+            raise EmbeddingCacheException(f"Failed to open embedding cache {self.db_path}: {e}")
+
+        try:
+            with conn:
+                yield conn
+        except sqlite3.Error as e:
+            logger.error(f"Embedding cache error: {e}")
+            raise EmbeddingCacheException(f"Embedding cache error: {e}")
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_access ON embedding_cache (last_access)")
+
+    def _get_blobs(self, keys: List[str]) -> Dict[str, bytes]:
+        found = {}
+        now = time.time()
+        with self._connect() as conn:
+            for i in range(0, len(keys), _SQLITE_BATCH):
+                batch = keys[i : i + _SQLITE_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT cache_key, vector FROM embedding_cache WHERE cache_key IN ({placeholders})", batch
+                ).fetchall()
+                found.update(rows)
+            if found:
+                conn.executemany("UPDATE embedding_cache SET last_access = ? WHERE cache_key = ?", [(now, key) for key in found])
+        return found
+
+    def _put_blobs(self, blobs: Dict[str, bytes]) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (cache_key, vector, size, last_access) VALUES (?, ?, ?, ?)",
+                [(key, blob, len(blob), now) for key, blob in blobs.items()],
+            )
+
+    def evict(self) -> int:
+        if self.max_size_bytes <= 0:
+            return 0
+
+        with self._connect() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM embedding_cache").fetchone()[0]
+            if total <= self.max_size_bytes:
+                return 0
+
+            evicted = []
+            for cache_key, size in conn.execute("SELECT cache_key, size FROM embedding_cache ORDER BY last_access ASC"):
+                if total <= self.max_size_bytes:
+                    break
+                evicted.append((cache_key,))
+                total -= size
+            conn.executemany("DELETE FROM embedding_cache WHERE cache_key = ?", evicted)
+
+        logger.info(f"Evicted {len(evicted)} embeddings from cache ({total / 1024 / 1024:.1f}MB remaining)")
+        return len(evicted)
+
+    def _usage(self) -> Dict[str, Any]:
+        with self._connect() as conn:
+            entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM embedding_cache").fetchone()
+        return {"backend": "sqlite", "entries": entries, "size_bytes": total, "max_size_bytes": self.max_size_bytes}
+
+
+class RedisEmbeddingCache(EmbeddingCache):
+    """Embedding cache in Redis, shared by the API and Airflow workers.
+
+    Vectors are plain string keys under ``prefix``; a sorted set of last-access times drives
+    LRU eviction once the entries exceed the byte budget. Needs a client created with
+    ``decode_responses=False``.
+    """
+
+    def __init__(self, redis_client: redis.Redis, prefix: str = "embeddings", max_size_bytes: int = 0, dtype: str = "float32"):
+        super().__init__(dtype)
+        self.redis = redis_client
+        self.prefix = prefix
+        self.max_size_bytes = max_size_bytes  # 0 disables eviction
+        self._lru_key = f"{prefix}:lru"
+        self._entry_size = 0  # Blob size of the last write, to turn the byte budget into an entry count
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _get_blobs(self, keys: List[str]) -> Dict[str, bytes]:
+        if not keys:
+            return {}
+        try:
+            values = self.redis.mget([self._key(key) for key in keys])
+            found = {key: value for key, value in zip(keys, values) if value is not None}
+            if found:
+                now = time.time()
+                self.redis.zadd(self._lru_key, {key: now for key in found})
+        except redis.RedisError as e:
+            raise EmbeddingCacheException(f"Embedding cache error: {e}")
+        return found
+
+    def _put_blobs(self, blobs: Dict[str, bytes]) -> None:
+        now = time.time()
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, blob in blobs.items():
+                pipe.set(self._key(key), blob)
+            pipe.zadd(self._lru_key, {key: now for key in blobs})
+            pipe.execute()
+        except redis.RedisError as e:
+            raise EmbeddingCacheException(f"Embedding cache error: {e}")
+        self._entry_size = len(next(iter(blobs.values())))
+
+    def evict(self) -> int:
+        if self.max_size_bytes <= 0 or not self._entry_size:
+            return 0
+
+        max_entries = max(1, self.max_size_bytes // self._entry_size)
+        try:
+            excess = self.redis.zcard(self._lru_key) - max_entries
+            if excess <= 0:
+                return 0
+            evicted = [key.decode() if isinstance(key, bytes) else key for key, _ in self.redis.zpopmin(self._lru_key, excess)]
+            if evicted:
+                self.redis.delete(*[self._key(key) for key in evicted])
+        except redis.RedisError as e:
+            raise EmbeddingCacheException(f"Embedding cache error: {e}")
+
+        logger.info(f"Evicted {len(evicted)} embeddings from Redis cache")
+        return len(evicted)
+
+    def _usage(self) -> Dict[str, Any]:
+        try:
+            entries = self.redis.zcard(self._lru_key)
+        except redis.RedisError as e:
+            raise EmbeddingCacheException(f"Embedding cache error: {e}")
+        return {
+            "backend": "redis",
+            "entries": entries,
+            "size_bytes": entries * self._entry_size,
+            "max_size_bytes": self.max_size_bytes,
+        }
@@ -1,39 +1,155 @@
+import logging
+from pathlib import Path
 from typing import Optional
 
 from src.config import Settings, get_settings
+from src.exceptions import ConfigurationError, EmbeddingCacheException
 
+from .base import EmbeddingsBackend
+from .cache import EmbeddingCache, RedisEmbeddingCache, SQLiteEmbeddingCache
 from .jina_client import JinaEmbeddingsClient
+from .query_cache import QueryEmbeddingCache
 
+logger = logging.getLogger(__name__)
 
-def make_embeddings_service(settings: Optional[Settings] = None) -> JinaEmbeddingsClient:
+
+def make_embedding_cache(settings: Settings) -> Optional[EmbeddingCache]:
+    """Create the passage embedding cache, or None when it is disabled or unavailable.
+
+    Falls back to the local SQLite cache when the Redis backend is selected but unreachable.
+
+    :param settings: Application settings
+    :returns: EmbeddingCache instance or None
+    """
+    embeddings_settings = settings.embeddings
+    if not embeddings_settings.cache_enabled:
+        return None
+
+    max_size_bytes = embeddings_settings.cache_max_size_mb * 1024 * 1024
+
+    if embeddings_settings.cache_backend == "redis":
+        from src.services.cache.factory import make_redis_client
+
+        try:
+            redis_client = make_redis_client(settings, decode_responses=False)
+            logger.info(f"Using Redis embedding cache ({embeddings_settings.cache_redis_prefix})")
+            return RedisEmbeddingCache(
+                redis_client,
+                prefix=embeddings_settings.cache_redis_prefix,
+                max_size_bytes=max_size_bytes,
+                dtype=embeddings_settings.cache_dtype,
+            )
+        except Exception as e:
+            logger.warning(f"Redis embedding cache unavailable, falling back to local cache: {e}")
+
+    try:
+        return SQLiteEmbeddingCache(
+            Path(embeddings_settings.cache_dir), max_size_bytes=max_size_bytes, dtype=embeddings_settings.cache_dtype
+        )
+    except (EmbeddingCacheException, OSError) as e:
+        logger.warning(f"Embedding cache unavailable, embedding without it: {e}")
+        return None
+
+
+def make_query_embedding_cache(settings: Settings) -> Optional[QueryEmbeddingCache]:
+    """Create the query embedding cache, or None when it is disabled.
+
+    The Redis tier is skipped with a warning when Redis is unreachable; the in-process LRU still works.
+
+    :param settings: Application settings
+    :returns: QueryEmbeddingCache instance or None
+    """
+    embeddings_settings = settings.embeddings
+    if not embeddings_settings.query_cache_enabled:
+        return None
+
+    redis_client = None
+    if embeddings_settings.query_cache_redis:
+        from src.services.cache.factory import make_redis_client
+
+        try:
+            redis_client = make_redis_client(settings, decode_responses=False)
+        except Exception as e:
+            logger.warning(f"Redis query embedding cache unavailable, using in-process cache only: {e}")
+
+    return QueryEmbeddingCache(
+        max_entries=embeddings_settings.query_cache_max_entries,
+        redis_client=redis_client,
+        ttl_seconds=embeddings_settings.query_cache_ttl_hours * 3600,
+        prefix=embeddings_settings.query_cache_redis_prefix,
+        dtype=embeddings_settings.cache_dtype,
+    )
+
+
+def make_embeddings_backend(settings: Settings, query_cache: Optional[QueryEmbeddingCache] = None) -> EmbeddingsBackend:
+    """Create the embeddings backend selected by ``settings.embeddings.backend``.
+
+    Raises ConfigurationError when the model's dimensions differ from the chunk index's vector dimension.
+
+    :param settings: Application settings
+    :param query_cache: Optional query embedding cache
+    :returns: EmbeddingsBackend instance
+    """
+    embeddings_settings = settings.embeddings
+
+    if embeddings_settings.backend == "local":
+        from .local_client import LocalEmbeddingsClient
+
+        backend: EmbeddingsBackend = LocalEmbeddingsClient(
+            model_name=embeddings_settings.local_model_name,
+            pooling=embeddings_settings.local_pooling,
+            normalize=embeddings_settings.local_normalize,
+            device=embeddings_settings.local_device,
+            workers=embeddings_settings.local_workers,
+            max_seq_length=embeddings_settings.local_max_seq_length,
+            cache=make_embedding_cache(settings),
+            query_cache=query_cache,
+        )
+    else:
+        backend = JinaEmbeddingsClient(
+            api_key=settings.jina_api_key,
+            timeout_seconds=embeddings_settings.timeout_seconds,
+            max_concurrent_requests=embeddings_settings.max_concurrent_requests,
+            max_retries=embeddings_settings.max_retries,
+            retry_base_delay=embeddings_settings.retry_base_delay,
+            retry_max_delay=embeddings_settings.retry_max_delay,
+            cache=make_embedding_cache(settings),
+            query_cache=query_cache,
+        )
+
+    if backend.dimensions != settings.opensearch.vector_dimension:
+        raise ConfigurationError(
+            f"Embedding model {backend.model_id} returns {backend.dimensions}-dim vectors but "
+            f"OPENSEARCH__VECTOR_DIMENSION is {settings.opensearch.vector_dimension}; set it to {backend.dimensions} "
+            f"and recreate the chunk index"
+        )
+    return backend
+
+
+def make_embeddings_service(settings: Optional[Settings] = None) -> EmbeddingsBackend:
     """Factory function to create embeddings service.
 
     Creates a new client instance each time to avoid closed client issues.
+    The service embeds search queries, so it also gets the query embedding cache.
 
     :param settings: Optional settings instance
-    :returns: JinaEmbeddingsClient instance
+    :returns: EmbeddingsBackend instance
     """
     if settings is None:
         settings = get_settings()
 
-    # Get API key from settings
-    api_key = settings.jina_api_key
-
-    return JinaEmbeddingsClient(api_key=api_key)
+    return make_embeddings_backend(settings, query_cache=make_query_embedding_cache(settings))
 
 
-def make_embeddings_client(settings: Optional[Settings] = None) -> JinaEmbeddingsClient:
+def make_embeddings_client(settings: Optional[Settings] = None) -> EmbeddingsBackend:
     """Factory function to create embeddings client.
 
     Creates a new client instance each time to avoid closed client issues.
 
     :param settings: Optional settings instance
-    :returns: JinaEmbeddingsClient instance
+    :returns: EmbeddingsBackend instance
     """
     if settings is None:
         settings = get_settings()
 
-    # Get API key from settings
-    api_key = settings.jina_api_key
-
-    return JinaEmbeddingsClient(api_key=api_key)
+    return make_embeddings_backend(settings)
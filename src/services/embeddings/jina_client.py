@@ -1,68 +1,184 @@
+import asyncio
 import logging
-from typing import List
+import random
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
 
 import httpx
 from src.schemas.embeddings.jina import JinaEmbeddingRequest, JinaEmbeddingResponse
 
-logger = logging.getLogger(__name__)
-
+from .base import PASSAGE_TASK, QUERY_TASK, EmbeddingsBackend
+from .cache import EmbeddingCache
+from .query_cache import QueryEmbeddingCache
 
-class JinaEmbeddingsClient:
+logger = logging.getLogger(__name__)
 
-    def __init__(self, api_key: str, base_url: str = "https://api.jina.ai/v1"):
-        
+# Jina's size rejections: too many tokens (per input or per request) or too many inputs. Other
+# 400/422 errors (e.g. an invalid dimensions value) must fail fast rather than be split.
+_TOO_LARGE_DETAIL = re.compile(
+    r"tokens?\b[^.]{0,80}?\b(?:exceed|maximum|limit|too long|too many)"
+    r"|\b(?:exceed\w*|maximum|limit|too long|too many)\b[^.]{0,80}?\btokens?\b"
+    r"|\b(?:inputs?|texts?|sequences?) (?:is |are )?too long"
+    r"|too many (?:inputs|texts|items)"
+    r"|number of (?:inputs|texts|items)[^.]{0,40}?(?:exceed|maximum|limit)"
+    r"|at most \d+ items",
+    re.IGNORECASE,
+)
+
+
+class JinaEmbeddingsClient(EmbeddingsBackend):
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.jina.ai/v1",
+        timeout_seconds: float = 30.0,
+        max_concurrent_requests: int = 4,
+        max_retries: int = 4,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        cache: Optional[EmbeddingCache] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+        model: str = "jina-embeddings-v3",
+        dimensions: int = 1024,
+    ):
+        super().__init__(cache=cache, query_cache=query_cache)
+        self._model = model
+        self._dimensions = dimensions
         self.api_key = api_key
         self.base_url = base_url
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(timeout=timeout_seconds)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        # Largest request the API accepted after a size rejection; later batches are pre-split
+        self._max_batch_inputs: Optional[int] = None
+        # Requests in flight across all concurrent calls on this client
+        self._request_slots = asyncio.Semaphore(max(1, max_concurrent_requests))
         logger.info("Jina embeddings client initialized")
 
-    async def embed_passages(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
-       
-        embeddings = []
+    @property
+    def model_id(self) -> str:
+        return self._model
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
 
-            request_data = JinaEmbeddingRequest(
-                model="jina-embeddings-v3", task="retrieval.passage", dimensions=1024, input=batch
-            )
-
-            try:
-                response = await self.client.post(
-                    f"{self.base_url}/embeddings", headers=self.headers, json=request_data.model_dump()
-                )
-                response.raise_for_status()
-
-                result = JinaEmbeddingResponse(**response.json())
-                batch_embeddings = [item["embedding"] for item in result.data]
-                embeddings.extend(batch_embeddings)
-
-                logger.debug(f"Embedded batch of {len(batch)} passages")
-
-            except httpx.HTTPError as e:
-                logger.error(f"Error embedding passages: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error in embed_passages: {e}")
-                raise
+    async def _embed_passages(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        """Send batches concurrently, up to the client's in-flight request limit."""
+        tasks = [
+            asyncio.create_task(self._embed_batch(texts[i : i + batch_size], PASSAGE_TASK))
+            for i in range(0, len(texts), batch_size)
+        ]
+        try:
+            batches = await asyncio.gather(*tasks)
+        except httpx.HTTPError as e:
+            logger.error(f"Error embedding passages: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in embed_passages: {e}")
+            raise
+        finally:
+            # One failed batch fails the call; do not leave the others running
+            for task in tasks:
+                task.cancel()
 
+        embeddings = [embedding for batch in batches for embedding in batch]
         logger.info(f"Successfully embedded {len(texts)} passages")
         return embeddings
 
-    async def embed_query(self, query: str) -> List[float]:
-       
-        request_data = JinaEmbeddingRequest(model="jina-embeddings-v3", task="retrieval.query", dimensions=1024, input=[query])
+    async def _embed_batch(self, texts: List[str], task: str) -> List[List[float]]:
+        """Embed one batch, halving it when the API rejects the request as too large.
 
+        The reduced size is remembered, so later batches on this client are split up front.
+        """
+        if self._max_batch_inputs is None or len(texts) <= self._max_batch_inputs:
+            try:
+                return await self._request_embeddings(texts, task)
+            except httpx.HTTPStatusError as e:
+                if len(texts) == 1 or not self._is_too_large(e.response):
+                    raise
+                logger.warning(f"Embedding request of {len(texts)} inputs rejected as too large, splitting")
+                self._max_batch_inputs = min(self._max_batch_inputs or len(texts), len(texts) // 2)
+
+        step = self._max_batch_inputs
+        parts = await asyncio.gather(*(self._embed_batch(texts[i : i + step], task) for i in range(0, len(texts), step)))
+        return [embedding for part in parts for embedding in part]
+
+    async def _request_embeddings(self, texts: List[str], task: str) -> List[List[float]]:
+        """POST one embeddings request, retrying rate limits, server errors and transport errors."""
+        request_data = JinaEmbeddingRequest(model=self._model, task=task, dimensions=self._dimensions, input=texts)
+
+        attempt = 0
+        while True:
+            retry_after = None
+            async with self._request_slots:
+                try:
+                    response = await self.client.post(
+                        f"{self.base_url}/embeddings", headers=self.headers, json=request_data.model_dump()
+                    )
+                except httpx.TransportError as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    reason = f"{type(e).__name__}: {e}"
+                else:
+                    if response.status_code != 429 and response.status_code < 500:
+                        response.raise_for_status()
+                        result = JinaEmbeddingResponse(**response.json())
+                        data = sorted(result.data, key=lambda item: item.get("index", 0))
+                        logger.debug(f"Embedded batch of {len(texts)} inputs")
+                        return [item["embedding"] for item in data]
+
+                    if attempt >= self.max_retries:
+                        response.raise_for_status()
+                    reason = f"HTTP {response.status_code}"
+                    retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+
+            # Back off outside the slot so other batches can use it
+            if retry_after is None:
+                backoff = min(self.retry_max_delay, self.retry_base_delay * 2**attempt)
+                retry_after = random.uniform(backoff / 2, backoff)
+            logger.warning(
+                f"Embedding request failed ({reason}), retry {attempt + 1}/{self.max_retries} in {retry_after:.1f}s"
+            )
+            await asyncio.sleep(retry_after)
+            attempt += 1
+
+    @staticmethod
+    def _is_too_large(response: httpx.Response) -> bool:
+        if response.status_code == 413:
+            return True
+        if response.status_code in (400, 422):
+            return _TOO_LARGE_DETAIL.search(response.text) is not None
+        return False
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+        if not value:
+            return None
         try:
-            response = await self.client.post(f"{self.base_url}/embeddings", headers=self.headers, json=request_data.model_dump())
-            response.raise_for_status()
-
-            result = JinaEmbeddingResponse(**response.json())
-            embedding = result.data[0]["embedding"]
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    async def _embed_query(self, query: str) -> List[float]:
+        try:
+            embedding = (await self._request_embeddings([query], QUERY_TASK))[0]
 
             logger.debug(f"Embedded query: '{query[:50]}...'")
             return embedding
@@ -77,11 +193,3 @@ class JinaEmbeddingsClient:
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
-
-    async def __aenter__(self):
-        """Async context manager entry."""
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.close()
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
+
+from .base import EmbeddingsBackend
+from .cache import EmbeddingCache
+from .query_cache import QueryEmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+# "model" keeps the pooling configured with the model; the others rebuild it on the raw transformer
+POOLING_MODES = ("model", "mean", "cls", "max", "lasttoken")
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_name: str, pooling: str, device: str, max_seq_length: int):
+    """Load a sentence-transformers model once per process and configuration."""
+    from sentence_transformers import SentenceTransformer, models
+
+    if pooling == "model":
+        model = SentenceTransformer(model_name, device=device)
+    else:
+        transformer = models.Transformer(model_name)
+        pooling_layer = models.Pooling(transformer.auto_model.config.hidden_size, pooling_mode=pooling)
+        model = SentenceTransformer(modules=[transformer, pooling_layer], device=device)
+
+    if max_seq_length:
+        model.max_seq_length = max_seq_length
+    model.eval()
+    return model
+
+
+class LocalEmbeddingsClient(EmbeddingsBackend):
+    """CPU embeddings with a local sentence-transformers model, no network calls.
+
+    Each ``embed_passages`` call is sorted by text length and cut into inference batches, so
+    batches pad to similar lengths; batches run on a thread pool off the event loop. The model's
+    tokenizer is not safe to call from several threads, so tokenization is serialized while the
+    forward passes run concurrently.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        pooling: str = "model",
+        normalize: bool = True,
+        device: str = "cpu",
+        workers: int = 2,
+        max_seq_length: int = 0,
+        cache: Optional[EmbeddingCache] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+    ):
+        if pooling not in POOLING_MODES:
+            raise ValueError(f"Unknown pooling mode '{pooling}', expected one of {POOLING_MODES}")
+
+        super().__init__(cache=cache, query_cache=query_cache)
+        self.model_name = model_name
+        self.pooling = pooling
+        self.normalize = normalize
+        self.device = device
+
+        self._model = _load_model(model_name, pooling, device, max_seq_length)
+        # sentence-transformers 6 renamed get_sentence_embedding_dimension and tokenize
+        get_dimension = getattr(self._model, "get_embedding_dimension", None) or self._model.get_sentence_embedding_dimension
+        self._preprocess = getattr(self._model, "preprocess", None) or self._model.tokenize
+        self._dimensions = get_dimension()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="embeddings")
+        self._tokenize_lock = threading.Lock()
+        logger.info(f"Local embeddings client initialized: {self.model_id} ({self._dimensions} dims on {device})")
+
+    @property
+    def model_id(self) -> str:
+        # Pooling and normalization change the vectors, so they are part of the identity
+        parts = [self.model_name]
+        if self.pooling != "model":
+            parts.append(self.pooling)
+        if not self.normalize:
+            parts.append("unnormalized")
+        return "+".join(parts)
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        """Run one inference batch (called on the thread pool)."""
+        import torch
+
+        with self._tokenize_lock:
+            features = self._preprocess(texts)
+        features = {name: value.to(self._model.device) if hasattr(value, "to") else value for name, value in features.items()}
+
+        with torch.inference_mode():
+            embeddings = self._model(features)["sentence_embedding"]
+            if self.normalize:
+                embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=1)
+        return embeddings.float().cpu().tolist()
+
+    async def _embed_passages(self, texts: List[str], batch_size: int) -> List[List[float]]:
+        loop = asyncio.get_running_loop()
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        batches = [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, self._encode, [texts[i] for i in batch]) for batch in batches)
+        )
+
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        for batch, batch_embeddings in zip(batches, results):
+            for position, embedding in zip(batch, batch_embeddings):
+                embeddings[position] = embedding
+
+        logger.info(f"Successfully embedded {len(texts)} passages locally")
+        return embeddings
+
+    async def _embed_query(self, query: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        embedding = (await loop.run_in_executor(self._executor, self._encode, [query]))[0]
+        logger.debug(f"Embedded query: '{query[:50]}...'")
+        return embedding
+
+    async def close(self):
+        """Stop the inference threads; the loaded model stays cached for the process."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+
+from .cache import decode_vector, encode_vector
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingCache:
+    """Two-tier cache for query embeddings: an in-process LRU in front of an optional Redis layer.
+
+    Keys are built from the normalized query (case-folded, whitespace collapsed), so trivially
+    different spellings of a popular query share one vector. The Redis tier stores compact binary
+    vectors with a TTL and is shared by API workers and the Telegram bot; Redis errors are logged
+    and treated as misses. Needs a client created with ``decode_responses=False``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        redis_client: Optional[redis.Redis] = None,
+        ttl_seconds: int = 86400,
+        prefix: str = "query_embeddings",
+        dtype: str = "float32",
+    ):
+        self.max_entries = max(1, max_entries)
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.dtype = dtype
+
+        # Stored as tuples and handed out as fresh lists, so callers can't mutate cached vectors
+        self._local: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+
+        self._local_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._redis_errors = 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(query.split()).casefold()
+
+    def make_key(self, query: str, model: str, dimensions: int) -> str:
+        query_hash = hashlib.sha256(self.normalize_query(query).encode("utf-8")).hexdigest()
+        return f"{self.prefix}:{model}:{dimensions}:{query_hash}"
+
+    async def get(self, key: str) -> Optional[List[float]]:
+        """Look up a query embedding in the local LRU, then in Redis."""
+        embedding = self._local.get(key)
+        if embedding is not None:
+            self._local.move_to_end(key)
+            self._local_hits += 1
+            return list(embedding)
+
+        if self.redis is not None:
+            try:
+                blob = await asyncio.to_thread(self.redis.get, key)
+            except redis.RedisError as e:
+                self._redis_errors += 1
+                logger.warning(f"Query embedding cache lookup failed: {e}")
+                blob = None
+            if blob is not None:
+                embedding = decode_vector(blob)
+                self._put_local(key, embedding)
+                self._redis_hits += 1
+                return embedding
+
+        self._misses += 1
+        return None
+
+    async def put(self, key: str, embedding: List[float]) -> None:
+        """Store a query embedding in both tiers."""
+        self._put_local(key, embedding)
+
+        if self.redis is not None:
+            try:
+                await asyncio.to_thread(self.redis.set, key, encode_vector(embedding, self.dtype), ex=self.ttl_seconds)
+            except redis.RedisError as e:
+                self._redis_errors += 1
+                logger.warning(f"Failed to store query embedding in cache: {e}")
+
+    def _put_local(self, key: str, embedding: List[float]) -> None:
+        self._local[key] = tuple(embedding)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-tier hit counters since the last reset."""
+        lookups = self._local_hits + self._redis_hits + self._misses
+        hits = self._local_hits + self._redis_hits
+        return {
+            "local_entries": len(self._local),
+            "max_entries": self.max_entries,
+            "redis_enabled": self.redis is not None,
+            "local_hits": self._local_hits,
+            "redis_hits": self._redis_hits,
+            "misses": self._misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "redis_errors": self._redis_errors,
+        }
+
+    def reset_stats(self) -> None:
+        self._local_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._redis_errors = 0
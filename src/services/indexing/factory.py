@@ -1,3 +1,4 @@
+import logging
 from typing import Optional
 
 from src.config import Settings, get_settings
@@ -6,6 +7,40 @@ from src.services.opensearch.factory import make_opensearch_client_fresh
 
 from .hybrid_indexer import HybridIndexingService
 from .text_chunker import TextChunker
+from .tokenization import ApproximateTokenCounter, HuggingFaceTokenCounter, TokenCounter
+
+logger = logging.getLogger(__name__)
+
+
+def make_token_counter(tokenizer_name: str) -> TokenCounter:
+    """Load the local tokenizer, falling back to the approximate counter if it is unavailable."""
+    try:
+        counter = HuggingFaceTokenCounter(tokenizer_name)
+        logger.info(f"Token-budget chunking uses tokenizer {tokenizer_name}")
+        return counter
+    except Exception as e:
+        logger.warning(f"Tokenizer {tokenizer_name} unavailable, using approximate token counts: {e}")
+        return ApproximateTokenCounter()
+
+
+def make_text_chunker(settings: Settings) -> TextChunker:
+    """Create the chunker in word mode, or in token-budget mode when enabled."""
+    chunking = settings.chunking
+    if chunking.token_budget:
+        return TextChunker(
+            chunk_size=chunking.chunk_tokens,
+            overlap_size=chunking.overlap_tokens,
+            min_chunk_size=chunking.min_chunk_tokens,
+            token_counter=make_token_counter(chunking.tokenizer_name),
+            header_strategy=chunking.header_strategy,
+        )
+
+    return TextChunker(
+        chunk_size=chunking.chunk_size,
+        overlap_size=chunking.overlap_size,
+        min_chunk_size=chunking.min_chunk_size,
+        header_strategy=chunking.header_strategy,
+    )
 
 
 def make_hybrid_indexing_service(
@@ -15,13 +50,17 @@ def make_hybrid_indexing_service(
         settings = get_settings()
 
     # Create dependencies using configuration
-    chunker = TextChunker(
-        chunk_size=settings.chunking.chunk_size,
-        overlap_size=settings.chunking.overlap_size,
-        min_chunk_size=settings.chunking.min_chunk_size,
-    )
+    chunker = make_text_chunker(settings)
     embeddings_client = make_embeddings_client(settings)
     opensearch_client = make_opensearch_client_fresh(settings, host=opensearch_host)
 
     # Create indexing service
-    return HybridIndexingService(chunker=chunker, embeddings_client=embeddings_client, opensearch_client=opensearch_client)
+    return HybridIndexingService(
+        chunker=chunker,
+        embeddings_client=embeddings_client,
+        opensearch_client=opensearch_client,
+        chunk_workers=settings.chunking.workers,
+        embedding_batch_size=settings.embeddings.batch_size,
+        embedding_max_wait_seconds=settings.embeddings.batch_max_wait_seconds,
+        max_concurrent_papers=settings.embeddings.max_concurrent_papers,
+    )
@@ -1,7 +1,11 @@
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Dict, List, Optional
 
-from src.services.embeddings.jina_client import JinaEmbeddingsClient
+from src.schemas.indexing.models import ChunkRecord
+from src.services.embeddings.batcher import EmbeddingBatcher
+from src.services.embeddings.base import EmbeddingsBackend
 from src.services.opensearch.client import OpenSearchClient
 
 from .text_chunker import TextChunker
@@ -11,16 +15,28 @@ logger = logging.getLogger(__name__)
 
 class HybridIndexingService:
 
-    def __init__(self, chunker: TextChunker, embeddings_client: JinaEmbeddingsClient, opensearch_client: OpenSearchClient):
+    def __init__(
+        self,
+        chunker: TextChunker,
+        embeddings_client: EmbeddingsBackend,
+        opensearch_client: OpenSearchClient,
+        chunk_workers: int = 2,
+        embedding_batch_size: int = 50,
+        embedding_max_wait_seconds: float = 0.1,
+        max_concurrent_papers: int = 16,
+    ):
         self.chunker = chunker
         self.embeddings_client = embeddings_client
         self.opensearch_client = opensearch_client
+        self.chunk_workers = chunk_workers  # Processes chunking ahead of embedding in batch runs
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_max_wait_seconds = embedding_max_wait_seconds
+        self.max_concurrent_papers = max_concurrent_papers
 
         logger.info("Hybrid indexing service initialized")
 
-    async def index_paper(self, paper_data: Dict) -> Dict[str, int]:
+    async def index_paper(self, paper_data: Dict, replace_existing: bool = False) -> Dict[str, int]:
         arxiv_id = paper_data.get("arxiv_id")
-        paper_id = str(paper_data.get("id", ""))
 
         if not arxiv_id:
             logger.error("Paper missing arxiv_id")
@@ -28,68 +44,67 @@ class HybridIndexingService:
 
         try:
             # Step 1: Chunk the paper using hybrid section-based approach
-            chunks = self.chunker.chunk_paper(
-                title=paper_data.get("title", ""),
-                abstract=paper_data.get("abstract", ""),
-                full_text=paper_data.get("raw_text", paper_data.get("full_text", "")),
-                arxiv_id=arxiv_id,
-                paper_id=paper_id,
-                sections=paper_data.get("sections"),
-            )
+            chunks = self.chunker.chunk_paper(**self.chunker.paper_chunk_args(paper_data))
+        except Exception as e:
+            logger.error(f"Error indexing paper {arxiv_id}: {e}")
+            return {"chunks_created": 0, "chunks_indexed": 0, "embeddings_generated": 0, "errors": 1}
+
+        return await self._index_chunks(paper_data, chunks, replace_existing=replace_existing)
+
+    async def _index_chunks(
+        self,
+        paper_data: Dict,
+        chunks: List[ChunkRecord],
+        replace_existing: bool = False,
+        batcher: Optional[EmbeddingBatcher] = None,
+    ) -> Dict[str, int]:
+        """Embed and index the chunks of one paper (steps 2-4 of ``index_paper``).
 
+        With ``replace_existing`` the paper's stored chunks are diffed against the new ones by
+        content hash: only new chunk texts are embedded, unchanged chunks keep their stored
+        embedding and stale ones are deleted.
+        """
+        arxiv_id = paper_data.get("arxiv_id")
+
+        try:
             if not chunks:
+                if replace_existing:
+                    await asyncio.to_thread(self.opensearch_client.delete_paper_chunks, arxiv_id)
                 logger.warning(f"No chunks created for paper {arxiv_id}")
                 return {"chunks_created": 0, "chunks_indexed": 0, "embeddings_generated": 0, "errors": 0}
 
             logger.info(f"Created {len(chunks)} chunks for paper {arxiv_id}")
 
+            paper_fields = {
+                "embedding_model": self.embeddings_client.model_id,
+                # Denormalized paper metadata for efficient search
+                "title": paper_data.get("title", ""),
+                "authors": ", ".join(paper_data.get("authors", []))
+                if isinstance(paper_data.get("authors"), list)
+                else paper_data.get("authors", ""),
+                "abstract": paper_data.get("abstract", ""),
+                "categories": paper_data.get("categories", []),
+                "published_date": paper_data.get("published_date"),
+            }
+
+            if replace_existing:
+                return await self._sync_chunks(arxiv_id, chunks, paper_fields, batcher)
+
             # Step 2: Generate embeddings for chunks
-            chunk_texts = [chunk.text for chunk in chunks]
-            embeddings = await self.embeddings_client.embed_passages(
-                texts=chunk_texts,
-                batch_size=50,  # Process in batches
-            )
-
-            if len(embeddings) != len(chunks):
-                logger.error(f"Embedding count mismatch: {len(embeddings)} != {len(chunks)}")
-                return {"chunks_created": len(chunks), "chunks_indexed": 0, "embeddings_generated": len(embeddings), "errors": 1}
-
-            # Step 3: Prepare chunks with embeddings for indexing
-            chunks_with_embeddings = []
-
-            for chunk, embedding in zip(chunks, embeddings):
-                # Prepare chunk data for OpenSearch
-                chunk_data = {
-                    "arxiv_id": chunk.arxiv_id,
-                    "paper_id": chunk.paper_id,
-                    "chunk_index": chunk.metadata.chunk_index,
-                    "chunk_text": chunk.text,
-                    "chunk_word_count": chunk.metadata.word_count,
-                    "start_char": chunk.metadata.start_char,
-                    "end_char": chunk.metadata.end_char,
-                    "section_title": chunk.metadata.section_title,
-                    "embedding_model": "jina-embeddings-v3",
-                    # Denormalized paper metadata for efficient search
-                    "title": paper_data.get("title", ""),
-                    "authors": ", ".join(paper_data.get("authors", []))
-                    if isinstance(paper_data.get("authors"), list)
-                    else paper_data.get("authors", ""),
-                    "abstract": paper_data.get("abstract", ""),
-                    "categories": paper_data.get("categories", []),
-                    "published_date": paper_data.get("published_date"),
-                }
-
-                chunks_with_embeddings.append({"chunk_data": chunk_data, "embedding": embedding})
-
-            # Step 4: Index chunks into OpenSearch
-            results = self.opensearch_client.bulk_index_chunks(chunks_with_embeddings)
+            embedded = await self._embed_chunks(chunks, batcher)
+            if embedded != len(chunks):
+                return {"chunks_created": len(chunks), "chunks_indexed": 0, "embeddings_generated": embedded, "errors": 1}
+
+            # Step 3: Index chunks into OpenSearch; the client is synchronous, so the request runs in a
+            # thread and other papers (and the embedding batcher's flush timer) keep running meanwhile
+            results = await asyncio.to_thread(self.opensearch_client.bulk_index_chunks, chunks, paper_fields)
 
             logger.info(f"Indexed paper {arxiv_id}: {results['success']} chunks successful, {results['failed']} failed")
 
             return {
                 "chunks_created": len(chunks),
                 "chunks_indexed": results["success"],
-                "embeddings_generated": len(embeddings),
+                "embeddings_generated": embedded,
                 "errors": results["failed"],
             }
 
@@ -97,44 +112,146 @@ class HybridIndexingService:
             logger.error(f"Error indexing paper {arxiv_id}: {e}")
             return {"chunks_created": 0, "chunks_indexed": 0, "embeddings_generated": 0, "errors": 1}
 
+    async def _embed_chunks(self, chunks: List[ChunkRecord], batcher: Optional[EmbeddingBatcher] = None) -> int:
+        """Embed chunk texts and attach the vectors to the records; returns the embedding count.
+
+        With a batcher, the texts share API requests with other papers being indexed.
+        """
+        if not chunks:
+            return 0
+
+        texts = [chunk.text for chunk in chunks]
+        if batcher is not None:
+            embeddings = await batcher.embed(texts)
+        else:
+            embeddings = await self.embeddings_client.embed_passages(texts=texts, batch_size=self.embedding_batch_size)
+
+        if len(embeddings) != len(chunks):
+            logger.error(f"Embedding count mismatch: {len(embeddings)} != {len(chunks)}")
+            return len(embeddings)
+
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk.embedding = embedding
+        return len(embeddings)
+
+    async def _sync_chunks(
+        self, arxiv_id: str, chunks: List[ChunkRecord], paper_fields: Dict, batcher: Optional[EmbeddingBatcher] = None
+    ) -> Dict[str, int]:
+        """Incrementally re-index a paper: embed added chunks, keep unchanged ones, delete removed ones."""
+        stored = await asyncio.to_thread(self.opensearch_client.get_indexed_chunks, arxiv_id)
+
+        # Stored chunks by content hash; an embedding is reused only if it came from the same model
+        stored_by_hash = defaultdict(list)
+        for doc_id, source in stored.items():
+            if source.get("chunk_hash") and source.get("embedding_model") == paper_fields["embedding_model"]:
+                stored_by_hash[source["chunk_hash"]].append(doc_id)
+
+        new_chunks = []
+        kept_chunks = []
+        for chunk in chunks:
+            doc_ids = stored_by_hash.get(chunk.chunk_hash)
+            if doc_ids:
+                doc_id = doc_ids.pop()
+                kept_chunks.append((doc_id, chunk, stored.pop(doc_id)))
+            else:
+                new_chunks.append(chunk)
+        stale_ids = list(stored)
+
+        embedded = await self._embed_chunks(new_chunks, batcher)
+        if embedded != len(new_chunks):
+            return {"chunks_created": len(chunks), "chunks_indexed": 0, "embeddings_generated": embedded, "errors": 1}
+
+        results = await asyncio.to_thread(
+            self.opensearch_client.sync_paper_chunks, new_chunks, kept_chunks, stale_ids, paper_fields
+        )
+
+        logger.info(
+            f"Re-indexed paper {arxiv_id}: {results['indexed']} new, {len(kept_chunks)} unchanged "
+            f"({results['updated']} metadata updates), {results['deleted']} removed"
+        )
+
+        return {
+            "chunks_created": len(chunks),
+            "chunks_indexed": results["indexed"],
+            "chunks_reused": len(kept_chunks),
+            "chunks_deleted": results["deleted"],
+            "embeddings_generated": embedded,
+            "errors": results["failed"],
+        }
+
     async def index_papers_batch(self, papers: List[Dict], replace_existing: bool = False) -> Dict[str, int]:
         total_stats = {
             "papers_processed": 0,
             "total_chunks_created": 0,
             "total_chunks_indexed": 0,
+            "total_chunks_reused": 0,
+            "total_chunks_deleted": 0,
             "total_embeddings_generated": 0,
             "total_errors": 0,
         }
 
+        # Papers without an arxiv_id are rejected up front, the rest are chunked in a process
+        # pool so the next papers are being chunked while this one is embedded and indexed
+        valid_papers = []
         for paper in papers:
-            arxiv_id = paper.get("arxiv_id")
-
-            # Optionally delete existing chunks
-            if replace_existing and arxiv_id:
-                self.opensearch_client.delete_paper_chunks(arxiv_id)
-
-            # Index the paper
-            stats = await self.index_paper(paper)
+            if paper.get("arxiv_id"):
+                valid_papers.append(paper)
+            else:
+                logger.error("Paper missing arxiv_id")
+                total_stats["papers_processed"] += 1
+                total_stats["total_errors"] += 1
 
-            # Update totals
+        def add_stats(stats: Dict[str, int]) -> None:
             total_stats["papers_processed"] += 1
             total_stats["total_chunks_created"] += stats["chunks_created"]
             total_stats["total_chunks_indexed"] += stats["chunks_indexed"]
+            total_stats["total_chunks_reused"] += stats.get("chunks_reused", 0)
+            total_stats["total_chunks_deleted"] += stats.get("chunks_deleted", 0)
             total_stats["total_embeddings_generated"] += stats["embeddings_generated"]
             total_stats["total_errors"] += stats["errors"]
 
+        # Several papers are embedded at once so their chunks fill shared, full-size requests
+        batcher = EmbeddingBatcher(
+            self.embeddings_client, batch_size=self.embedding_batch_size, max_wait_seconds=self.embedding_max_wait_seconds
+        )
+        paper_slots = asyncio.Semaphore(max(1, self.max_concurrent_papers))
+        tasks = []
+
+        async def index_chunked_paper(paper: Dict, chunks: List[ChunkRecord]) -> None:
+            try:
+                # replace_existing re-indexes incrementally against the stored chunks
+                add_stats(await self._index_chunks(paper, chunks, replace_existing=replace_existing, batcher=batcher))
+            finally:
+                paper_slots.release()
+
+        try:
+            async for index, chunks in self.chunker.chunk_papers_indexed(valid_papers, workers=self.chunk_workers):
+                if chunks is None:
+                    add_stats({"chunks_created": 0, "chunks_indexed": 0, "embeddings_generated": 0, "errors": 1})
+                    continue
+                # Waiting for a slot also stops chunking from running far ahead of indexing
+                await paper_slots.acquire()
+                tasks.append(asyncio.create_task(index_chunked_paper(valid_papers[index], chunks)))
+
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled papers unwind before the batcher is flushed and closed under them
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await batcher.close()
+
         logger.info(
             f"Batch indexing complete: {total_stats['papers_processed']} papers, "
-            f"{total_stats['total_chunks_indexed']} chunks indexed"
+            f"{total_stats['total_chunks_indexed']} chunks indexed, {total_stats['total_chunks_reused']} unchanged"
         )
 
         return total_stats
 
     async def reindex_paper(self, arxiv_id: str, paper_data: Dict) -> Dict[str, int]:
-        # Delete existing chunks
-        deleted = self.opensearch_client.delete_paper_chunks(arxiv_id)
-        if deleted:
-            logger.info(f"Deleted existing chunks for paper {arxiv_id}")
+        # Diff against the stored chunks instead of deleting them; only changed chunks are embedded
+        return await self.index_paper({**paper_data, "arxiv_id": arxiv_id}, replace_existing=True)
 
-        # Index with new data
-        return await self.index_paper(paper_data)
+    async def close(self) -> None:
+        """Stop the chunking worker processes kept between batch runs."""
+        await asyncio.to_thread(self.chunker.shutdown)
@@ -1,34 +1,237 @@
+import asyncio
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Optional, Union
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from src.schemas.indexing.models import ChunkMetadata, TextChunk
+from src.schemas.indexing.models import ChunkRecord
+from src.schemas.pdf_parser.models import PaperSection
+
+from .tokenization import TokenCounter, TokenSpans
 
 logger = logging.getLogger(__name__)
 
+_WORD_PATTERN = re.compile(r"\S+")
+# Parsers emit one paragraph (Docling text item, text-layer paragraph) per line
+_PARAGRAPH_BREAK = re.compile(r"\n\s*")
+# Sentence end followed by the start of a new sentence; avoids "e.g. the" and "Fig. 3"
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])(?<!\b[A-Z]\.)(?<!\be\.g\.)(?<!\bi\.e\.)(?<!\bet al\.)\s+(?=[\"'(\[]?[A-Z])")
+# What each section chunk repeats of the paper: title + abstract, the title, or nothing
+HEADER_STRATEGIES = ("full", "title-only", "none")
+# Leading section number ("3", "3.2", "A.1"); its depth is the section level
+_SECTION_NUMBER = re.compile(r"^(\d+|[A-Z])((?:\.\d+)*)\.?\s+\S")
+
+# Per-process chunker for chunk_papers, installed once by the pool initializer
+_worker_chunker: Optional["TextChunker"] = None
+
+
+def _init_chunk_worker(chunker: "TextChunker") -> None:
+    global _worker_chunker
+    _worker_chunker = chunker
+
+
+def _chunk_paper_in_worker(paper_args: Dict[str, Any]) -> List[ChunkRecord]:
+    return _worker_chunker.chunk_paper(**paper_args)
+
 
 class TextChunker:
 
-    def __init__(self, chunk_size: int = 600, overlap_size: int = 100, min_chunk_size: int = 100):
+    def __init__(
+        self,
+        chunk_size: int = 600,
+        overlap_size: int = 100,
+        min_chunk_size: int = 100,
+        token_counter: Optional[TokenCounter] = None,
+        header_strategy: str = "full",
+    ):
+        # With a token counter, sizes are token budgets; otherwise they count whitespace words
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
         self.min_chunk_size = min_chunk_size
+        self.token_counter = token_counter
 
         if overlap_size >= chunk_size:
             raise ValueError("Overlap size must be less than chunk size")
+        if header_strategy not in HEADER_STRATEGIES:
+            raise ValueError(f"Header strategy must be one of {HEADER_STRATEGIES}, got {header_strategy!r}")
+        self.header_strategy = header_strategy
+
+        # Process pool for chunk_papers, started on first use and kept until shutdown()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
 
+        unit = f"tokens ({token_counter.name})" if token_counter else "words"
         logger.info(
-            f"Text chunker initialized: chunk_size={chunk_size}, overlap_size={overlap_size}, min_chunk_size={min_chunk_size}"
+            f"Text chunker initialized: chunk_size={chunk_size}, overlap_size={overlap_size}, "
+            f"min_chunk_size={min_chunk_size} {unit}, header={header_strategy}"
         )
 
-    def _split_into_words(self, text: str) -> List[str]:
-        # Split on whitespace while keeping the words
-        words = re.findall(r"\S+", text)
-        return words
-
-    def _reconstruct_text(self, words: List[str]) -> str:
-        return " ".join(words)
+    def __getstate__(self) -> Dict[str, Any]:
+        # The chunker is pickled into its own pool workers; the pool itself stays behind
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_workers"] = 0
+        return state
+
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        if self._pool is not None and self._pool_workers != workers:
+            self.shutdown()
+        if self._pool is None:
+            # spawn: forking a process that already runs threads (uvicorn, Airflow) is unsafe.
+            # The chunker (and its tokenizer) is pickled once per worker, not once per paper.
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_chunk_worker,
+                initargs=(self,),
+            )
+            self._pool_workers = workers
+            logger.info(f"Started chunking pool with {workers} workers")
+        return self._pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the chunking worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+            self._pool_workers = 0
+
+    def _word_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Character span of every whitespace-delimited word, in one pass over the text."""
+        return [match.span() for match in _WORD_PATTERN.finditer(text)]
+
+    def _cumulative_sizes(
+        self, text: str, word_spans: List[Tuple[int, int]], token_spans: Optional[TokenSpans] = None
+    ) -> List[int]:
+        """
+        Prefix sums of per-word sizes: sizes[j] - sizes[i] is the size of words i..j-1.
+
+        In token mode each token is attributed to the word it starts in (or the next word if it
+        starts in whitespace), so chunk boundaries stay on word boundaries.
+        """
+        if self.token_counter is None:
+            return list(range(len(word_spans) + 1))
+
+        if token_spans is None:
+            token_spans = self.token_counter.token_spans_batch([text])[0]
+
+        counts = [0] * len(word_spans)
+        word = 0
+        last_word = len(word_spans) - 1
+        for token_start, _ in token_spans:
+            while word < last_word and token_start >= word_spans[word][1]:
+                word += 1
+            counts[word] += 1
+
+        sizes = [0]
+        for count in counts:
+            sizes.append(sizes[-1] + count)
+        return sizes
+
+    @staticmethod
+    def paper_chunk_args(paper_data: Dict) -> Dict[str, Any]:
+        """Map a paper record (as stored/indexed) to ``chunk_paper`` keyword arguments."""
+        return {
+            "title": paper_data.get("title", ""),
+            "abstract": paper_data.get("abstract", ""),
+            "full_text": paper_data.get("raw_text", paper_data.get("full_text", "")),
+            "arxiv_id": paper_data.get("arxiv_id"),
+            "paper_id": str(paper_data.get("id", "")),
+            "sections": paper_data.get("sections"),
+        }
+
+    async def chunk_papers(self, papers: List[Dict], workers: int = 2) -> AsyncIterator[Tuple[str, List[ChunkRecord]]]:
+        """
+        Chunk many papers in a process pool, yielding each paper's chunks as soon as it is done.
+
+        Results arrive in completion order, not input order. A paper that fails to chunk is
+        logged and yielded with an empty list.
+
+        Args:
+            papers: Paper records with the fields read by ``paper_chunk_args``
+            workers: Worker processes, capped at the CPU count; with 0 or 1 papers are chunked
+                one ahead in a background thread
+
+        Yields:
+            (paper_id, chunks) tuples
+        """
+        async for index, chunks in self.chunk_papers_indexed(papers, workers):
+            yield str(papers[index].get("id", "")), chunks or []
+
+    async def chunk_papers_indexed(
+        self, papers: List[Dict], workers: int = 2
+    ) -> AsyncIterator[Tuple[int, Optional[List[ChunkRecord]]]]:
+        """Like ``chunk_papers`` but yields the paper's position in ``papers`` and None on failure."""
+        loop = asyncio.get_running_loop()
+        pool_workers = min(workers, os.cpu_count() or 1)
+        workers = min(pool_workers, len(papers))
+
+        if workers <= 1:
+            # No pool: chunk one paper ahead in a thread so it still overlaps the consumer's I/O
+            def chunk_one(paper: Dict) -> Optional[List[ChunkRecord]]:
+                try:
+                    return self.chunk_paper(**self.paper_chunk_args(paper))
+                except Exception as e:
+                    logger.error(f"Error chunking paper {paper.get('arxiv_id')}: {e}")
+                    return None
+
+            next_chunks = loop.run_in_executor(None, chunk_one, papers[0]) if papers else None
+            for index in range(len(papers)):
+                chunks = await next_chunks
+                if index + 1 < len(papers):
+                    next_chunks = loop.run_in_executor(None, chunk_one, papers[index + 1])
+                yield index, chunks
+            return
+
+        # Sized for the configured workers, not this call's paper count, so later calls reuse it
+        pool = self._get_pool(pool_workers)
+        remaining = iter(enumerate(papers))
+        pending: Dict[asyncio.Future, int] = {}
+
+        def submit_next() -> None:
+            item = next(remaining, None)
+            if item is not None:
+                index, paper = item
+                try:
+                    future = loop.run_in_executor(pool, _chunk_paper_in_worker, self.paper_chunk_args(paper))
+                except (BrokenProcessPool, RuntimeError) as e:
+                    # The pool broke or was shut down mid-run; report the paper as failed
+                    future = loop.create_future()
+                    future.set_exception(e)
+                pending[future] = index
+
+        try:
+            # Keep every worker busy plus one queued paper each, without holding all results in memory
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    submit_next()
+                    try:
+                        chunks = future.result()
+                    except BrokenProcessPool as e:
+                        # A dead worker breaks the whole pool; the next call starts a fresh one
+                        logger.error(f"Chunking worker died on paper {papers[index].get('arxiv_id')}: {e}")
+                        if self._pool is pool:
+                            self.shutdown(wait=False)
+                        chunks = None
+                    except Exception as e:
+                        logger.error(f"Error chunking paper {papers[index].get('arxiv_id')}: {e}")
+                        chunks = None
+                    yield index, chunks
+        finally:
+            # Papers not yet started are dropped if the consumer stops early; the pool stays up
+            for future in pending:
+                future.cancel()
 
     def chunk_paper(
         self,
@@ -38,216 +241,343 @@ class TextChunker:
         arxiv_id: str,
         paper_id: str,
         sections: Optional[Union[Dict[str, str], str, list]] = None,
-    ) -> List[TextChunk]:
+    ) -> List[ChunkRecord]:
+        chunks = None
+
         # Try section-based chunking first
         if sections:
             try:
-                section_chunks = self._chunk_by_sections(title, abstract, arxiv_id, paper_id, sections)
-                if section_chunks:
-                    logger.info(f"Created {len(section_chunks)} section-based chunks for {arxiv_id}")
-                    return section_chunks
+                chunks = self._chunk_by_sections(title, abstract, arxiv_id, paper_id, sections)
+                if chunks:
+                    logger.info(f"Created {len(chunks)} section-based chunks for {arxiv_id}")
             except Exception as e:
                 logger.warning(f"Section-based chunking failed for {arxiv_id}: {e}")
 
-        # Fallback to traditional word-based chunking
-        logger.info(f"Using traditional word-based chunking for {arxiv_id}")
-        return self.chunk_text(full_text, arxiv_id, paper_id)
+        if not chunks:
+            # Fallback to traditional word-based chunking
+            logger.info(f"Using traditional word-based chunking for {arxiv_id}")
+            chunks = self.chunk_text(full_text, arxiv_id, paper_id)
+
+        # Content hashes let re-indexing skip chunks whose text is already embedded
+        for chunk in chunks:
+            chunk.chunk_hash = hashlib.sha256(chunk.text.encode("utf-8")).hexdigest()
+        return chunks
 
-    def chunk_text(self, text: str, arxiv_id: str, paper_id: str) -> List[TextChunk]:
+    def chunk_text(
+        self,
+        text: str,
+        arxiv_id: str,
+        paper_id: str,
+        token_spans: Optional[TokenSpans] = None,
+        chunk_size: Optional[int] = None,
+        overlap_size: Optional[int] = None,
+    ) -> List[ChunkRecord]:
+        """
+        Split text into overlapping windows of ``chunk_size`` words or tokens.
+
+        Args:
+            text: Text to chunk
+            arxiv_id: arXiv paper ID
+            paper_id: Database paper ID
+            token_spans: Precomputed token spans of ``text`` (token mode; avoids re-tokenizing)
+            chunk_size: Override of the configured chunk size (e.g. to leave room for a header)
+            overlap_size: Override of the configured overlap (0 for back-to-back windows)
+
+        Returns:
+            List of chunks
+        """
         if not text or not text.strip():
             logger.warning(f"Empty text provided for paper {arxiv_id}")
             return []
 
-        # Split text into words
-        words = self._split_into_words(text)
+        # Word spans give exact character offsets; chunk text is sliced from the source
+        spans = self._word_spans(text)
+        sizes = self._cumulative_sizes(text, spans, token_spans)
+        word_count = len(spans)
+        token_mode = self.token_counter is not None
+        budget = chunk_size or self.chunk_size
+        overlap = self.overlap_size if overlap_size is None else overlap_size
 
-        if len(words) < self.min_chunk_size:
-            logger.warning(f"Text for paper {arxiv_id} has only {len(words)} words, less than minimum {self.min_chunk_size}")
+        if sizes[-1] < self.min_chunk_size:
+            logger.warning(f"Text for paper {arxiv_id} has only {sizes[-1]} units, less than minimum {self.min_chunk_size}")
             # Return single chunk if text is too small
-            if words:
+            if spans:
+                start_char, end_char = spans[0][0], spans[-1][1]
                 return [
-                    TextChunk(
-                        text=self._reconstruct_text(words, text),
-                        metadata=ChunkMetadata(
-                            chunk_index=0,
-                            start_char=0,
-                            end_char=len(text),
-                            word_count=len(words),
-                            overlap_with_previous=0,
-                            overlap_with_next=0,
-                        ),
+                    ChunkRecord(
+                        text=text[start_char:end_char],
                         arxiv_id=arxiv_id,
                         paper_id=paper_id,
+                        chunk_index=0,
+                        start_char=start_char,
+                        end_char=end_char,
+                        word_count=word_count,
+                        token_count=sizes[-1] if token_mode else None,
                     )
                 ]
             return []
 
         chunks = []
-        chunk_index = 0
-        current_position = 0
-
-        while current_position < len(words):
-            # Calculate chunk boundaries
-            chunk_start = current_position
-            chunk_end = min(current_position + self.chunk_size, len(words))
-
-            # Extract chunk words
-            chunk_words = words[chunk_start:chunk_end]
-            chunk_text = self._reconstruct_text(chunk_words)
-
-            # Calculate character offsets (approximate)
-            start_char = len(" ".join(words[:chunk_start])) if chunk_start > 0 else 0
-            end_char = len(" ".join(words[:chunk_end]))
-
-            # Calculate overlaps
-            overlap_with_previous = min(self.overlap_size, chunk_start) if chunk_start > 0 else 0
-            overlap_with_next = self.overlap_size if chunk_end < len(words) else 0
-
-            # Create chunk
-            chunk = TextChunk(
-                text=chunk_text,
-                metadata=ChunkMetadata(
-                    chunk_index=chunk_index,
-                    start_char=start_char,
-                    end_char=end_char,
-                    word_count=len(chunk_words),
-                    overlap_with_previous=overlap_with_previous,
-                    overlap_with_next=overlap_with_next,
-                    section_title=None,  # Could be enhanced with section detection
-                ),
+        chunk_start = 0
+        overlap_with_previous = 0
+
+        while True:
+            # Longest run of words that fits the budget (at least one word, even if oversized)
+            chunk_end = max(chunk_start + 1, bisect_right(sizes, sizes[chunk_start] + budget) - 1)
+            chunk_end = min(chunk_end, word_count)
+
+            # Next window starts as far back as the overlap allows, but always moves forward
+            if chunk_end < word_count:
+                if overlap:
+                    next_start = max(chunk_start + 1, bisect_left(sizes, sizes[chunk_end] - overlap))
+                else:
+                    next_start = chunk_end
+                overlap_with_next = sizes[chunk_end] - sizes[next_start]
+            else:
+                next_start = None
+                overlap_with_next = 0
+
+            # Exact character offsets of the first and last word
+            start_char = spans[chunk_start][0]
+            end_char = spans[chunk_end - 1][1]
+
+            chunk = ChunkRecord(
+                text=text[start_char:end_char],
                 arxiv_id=arxiv_id,
                 paper_id=paper_id,
+                chunk_index=len(chunks),
+                start_char=start_char,
+                end_char=end_char,
+                word_count=chunk_end - chunk_start,
+                token_count=sizes[chunk_end] - sizes[chunk_start] if token_mode else None,
+                overlap_with_previous=overlap_with_previous,
+                overlap_with_next=overlap_with_next,
+                section_title=None,  # Could be enhanced with section detection
             )
             chunks.append(chunk)
 
-            # Move to next chunk position (with overlap)
-            current_position += self.chunk_size - self.overlap_size
-            chunk_index += 1
-
-            # Break if we've processed all words
-            if chunk_end >= len(words):
+            if next_start is None:
                 break
+            chunk_start = next_start
+            overlap_with_previous = overlap_with_next
 
-        logger.info(f"Chunked paper {arxiv_id}: {len(words)} words -> {len(chunks)} chunks")
+        unit = "tokens" if token_mode else "words"
+        logger.info(f"Chunked paper {arxiv_id}: {sizes[-1]} {unit} -> {len(chunks)} chunks")
 
         return chunks
 
     def _chunk_by_sections(
         self, title: str, abstract: str, arxiv_id: str, paper_id: str, sections: Union[Dict[str, str], str, list]
-    ) -> List[TextChunk]:
+    ) -> List[ChunkRecord]:
+        """
+        Pack whole paragraphs of the section tree into chunks, in document order.
+
+        A chunk closes when the next paragraph would exceed the budget, or when a new top-level
+        section starts and the chunk is at least half full, so small sections are still combined.
+        Paragraphs larger than the budget are split between sentences; only a single sentence
+        larger than the budget is cut into word windows.
+        """
         # Parse sections data
-        sections_dict = self._parse_sections(sections)
-        if not sections_dict:
+        parsed_sections = self._parse_sections(sections)
+        if not parsed_sections:
             return []
 
         # Filter and clean sections
-        sections_dict = self._filter_sections(sections_dict, abstract)
-        if not sections_dict:
+        parsed_sections = self._filter_sections(parsed_sections, abstract)
+        if not parsed_sections:
             logger.warning(f"No meaningful sections found after filtering for {arxiv_id}")
             return []
 
-        # Create header (title + abstract)
-        header = f"{title}\n\nAbstract: {abstract}\n\n"
-
-        # Process sections using hybrid strategy
-        chunks = []
-        small_sections = []  # Buffer for combining small sections
-
-        section_items = list(sections_dict.items())
-
-        for i, (section_title, section_content) in enumerate(section_items):
-            content_str = str(section_content) if section_content else ""
-            section_words = len(content_str.split())
-
-            if section_words < 100:
-                # Collect small sections to combine later
-                small_sections.append((section_title, content_str, section_words))
+        header = self._section_header(title, abstract)
+        if self.header_strategy != "full" and abstract.strip():
+            # The abstract is not repeated in every chunk, so it is indexed once as its own section
+            parsed_sections.insert(0, PaperSection(title="Abstract", content=abstract.strip()))
+
+        # Flatten the tree: each section gets its path ("Method > Training") and top-level ancestor
+        labels = []
+        tops = []
+        paragraphs = []  # (section index, paragraph text)
+        stack: List[Tuple[int, str, int]] = []
+        for index, section in enumerate(parsed_sections):
+            while stack and stack[-1][0] >= section.level:
+                stack.pop()
+            stack.append((section.level, section.title, index))
+            labels.append("Section: " + " > ".join(section_title for _, section_title, _ in stack))
+            tops.append(stack[0][2])
+            for paragraph in _PARAGRAPH_BREAK.split(section.content):
+                paragraph = paragraph.strip()
+                if paragraph:
+                    paragraphs.append((index, paragraph))
+
+        # Size header, labels and paragraphs in one batch (one tokenizer call in token mode)
+        sizes = self._unit_sizes([header] + labels + [paragraph for _, paragraph in paragraphs])
+        header_size = sizes[0]
+        label_sizes = sizes[1 : len(labels) + 1]
+        paragraph_sizes = sizes[len(labels) + 1 :]
+
+        # Every chunk carries the header, so in token mode it counts against the budget
+        budget = self.chunk_size if self.token_counter is None else max(self.chunk_size - header_size, self.min_chunk_size)
+
+        blocks = []  # (section index, text, size) with every block fitting the budget
+        for (index, paragraph), size in zip(paragraphs, paragraph_sizes):
+            if size + label_sizes[index] <= budget:
+                blocks.append((index, paragraph, size))
+            else:
+                limit = max(budget - label_sizes[index], 1)
+                pieces = self._split_paragraph(paragraph, limit, arxiv_id, paper_id)
+                blocks.extend((index, piece, piece_size) for piece, piece_size in pieces)
+
+        chunks: List[ChunkRecord] = []
+        parts: List[Tuple[int, List[str]]] = []  # (section index, texts) of the open chunk
+        parts_size = 0
+
+        def flush() -> None:
+            body = "\n\n".join(f"{labels[index]}\n\n" + "\n\n".join(texts) for index, texts in parts)
+            chunk_text = f"{header}{body}"
+            titles = [parsed_sections[index].title for index, _ in parts]
+            if len(titles) == 1:
+                section_title = labels[parts[0][0]][len("Section: ") :]
+            else:
+                section_title = " + ".join(titles[:3])  # Limit title length
+                if len(titles) > 3:
+                    section_title += f" + {len(titles) - 3} more"
+            chunks.append(
+                ChunkRecord(
+                    text=chunk_text,
+                    arxiv_id=arxiv_id,
+                    paper_id=paper_id,
+                    chunk_index=len(chunks),
+                    start_char=0,
+                    end_char=len(chunk_text),
+                    word_count=len(chunk_text.split()),
+                    token_count=header_size + parts_size if self.token_counter is not None else None,
+                    section_title=section_title,
+                )
+            )
 
-                # If this is the last section or next section is large, process accumulated small sections
-                if i == len(section_items) - 1 or len(str(section_items[i + 1][1]).split()) >= 100:
-                    chunks.extend(self._create_combined_chunk(header, small_sections, chunks, arxiv_id, paper_id))
-                    small_sections = []
+        for index, text, size in blocks:
+            same_section = bool(parts) and parts[-1][0] == index
+            cost = size if same_section else size + label_sizes[index]
+            new_topic = bool(parts) and tops[index] != tops[parts[-1][0]] and parts_size >= budget // 2
+            if parts and (parts_size + cost > budget or new_topic):
+                flush()
+                parts, parts_size = [], 0
+                same_section, cost = False, size + label_sizes[index]
+
+            if same_section:
+                parts[-1][1].append(text)
+            else:
+                parts.append((index, [text]))
+            parts_size += cost
 
-            elif 100 <= section_words <= 800:
-                # Perfect size - create single chunk
-                chunk_text = f"{header}Section: {section_title}\n\n{content_str}"
-                chunk = self._create_section_chunk(chunk_text, section_title, len(chunks), arxiv_id, paper_id)
-                chunks.append(chunk)
+        if parts:
+            flush()
 
-            else:
-                # Large section - split using traditional chunking
-                section_text = f"Section: {section_title}\n\n{content_str}"
-                full_section_text = f"{header}{section_text}"
+        return chunks
 
-                # Use traditional chunking but with section context
-                section_chunks = self._split_large_section(
-                    full_section_text, header, section_title, len(chunks), arxiv_id, paper_id
+    def _section_header(self, title: str, abstract: str) -> str:
+        """Paper context prepended to every section chunk, per ``header_strategy``."""
+        if self.header_strategy == "full":
+            return f"{title}\n\nAbstract: {abstract}\n\n"
+        if self.header_strategy == "title-only":
+            return f"{title}\n\n"
+        # "none": title and abstract are searchable through their own indexed fields
+        return ""
+
+    def _unit_sizes(self, texts: List[str]) -> List[int]:
+        """Size of each text in chunking units: tokens in token mode, whitespace words otherwise."""
+        if self.token_counter is None:
+            return [len(text.split()) for text in texts]
+        return self.token_counter.count_batch(texts)
+
+    def _split_paragraph(self, paragraph: str, limit: int, arxiv_id: str, paper_id: str) -> List[Tuple[str, int]]:
+        """Pack the sentences of an oversized paragraph into pieces of at most ``limit`` units."""
+        sentences = [sentence for sentence in _SENTENCE_BREAK.split(paragraph) if sentence]
+        pieces: List[Tuple[str, int]] = []
+        current: List[str] = []
+        current_size = 0
+        for sentence, size in zip(sentences, self._unit_sizes(sentences)):
+            if current and current_size + size > limit:
+                pieces.append((" ".join(current), current_size))
+                current, current_size = [], 0
+
+            if size > limit:
+                # A single sentence over budget can only be cut into word windows. They become
+                # separate blocks that may be packed into one chunk, so they must not overlap.
+                pieces.extend(
+                    (window.text, window.token_count if window.token_count is not None else window.word_count)
+                    for window in self.chunk_text(sentence, arxiv_id, paper_id, chunk_size=limit, overlap_size=0)
                 )
-                chunks.extend(section_chunks)
+                continue
 
-        return chunks
+            current.append(sentence)
+            current_size += size
 
-    def _parse_sections(self, sections: Union[Dict[str, str], str, list]) -> Dict[str, str]:
-        """Parse sections data into a dictionary."""
-        if isinstance(sections, dict):
-            return sections
-        elif isinstance(sections, list):
-            # Handle list of sections directly
-            result = {}
-            for i, section in enumerate(sections):
-                if isinstance(section, dict):
-                    title = section.get("title", section.get("heading", f"Section {i + 1}"))
-                    content = section.get("content", section.get("text", ""))
-                    result[title] = content
-                else:
-                    result[f"Section {i + 1}"] = str(section)
-            return result
-        elif isinstance(sections, str):
+        if current:
+            pieces.append((" ".join(current), current_size))
+        return pieces
+
+    def _parse_sections(self, sections: Union[Dict[str, str], str, list]) -> List[PaperSection]:
+        """Parse sections data into an ordered list; repeated titles are kept as separate sections."""
+        if isinstance(sections, str):
             try:
-                parsed = json.loads(sections)
-                if isinstance(parsed, dict):
-                    return parsed
-                elif isinstance(parsed, list):
-                    # Convert list to dict with enumerated keys
-                    result = {}
-                    for i, section in enumerate(parsed):
-                        if isinstance(section, dict):
-                            title = section.get("title", section.get("heading", f"Section {i + 1}"))
-                            content = section.get("content", section.get("text", ""))
-                            result[title] = content
-                        else:
-                            result[f"Section {i + 1}"] = str(section)
-                    return result
+                sections = json.loads(sections)
             except json.JSONDecodeError:
                 logger.warning("Failed to parse sections JSON")
-        return {}
+                return []
 
-    def _filter_sections(self, sections_dict: Dict[str, str], abstract: str) -> Dict[str, str]:
-        filtered = {}
+        if isinstance(sections, dict):
+            items = [{"title": title, "content": content} for title, content in sections.items()]
+        elif isinstance(sections, list):
+            items = sections
+        else:
+            return []
+
+        result = []
+        for i, section in enumerate(items):
+            if isinstance(section, PaperSection):
+                title, content, level = section.title, section.content, section.level
+            elif isinstance(section, dict):
+                title = section.get("title", section.get("heading", f"Section {i + 1}"))
+                content = section.get("content", section.get("text", ""))
+                level = section.get("level") or 1
+            else:
+                title, content, level = f"Section {i + 1}", section, 1
+
+            title = str(title)
+            # Layout models rarely report depth; section numbering ("3.2 Training") does
+            numbered = _SECTION_NUMBER.match(title)
+            if numbered:
+                level = numbered.group(2).count(".") + 1
+            result.append(PaperSection(title=title, content=str(content) if content else "", level=int(level)))
+        return result
+
+    def _filter_sections(self, sections: List[PaperSection], abstract: str) -> List[PaperSection]:
+        filtered = []
         abstract_words = set(abstract.lower().split())
 
-        for section_title, section_content in sections_dict.items():
-            content_str = str(section_content).strip()
+        for section in sections:
+            content_str = section.content.strip()
 
             # Skip empty sections
             if not content_str:
                 continue
 
             # Skip metadata/header sections based on title
-            if self._is_metadata_section(section_title):
+            if self._is_metadata_section(section.title):
                 continue
 
             # Skip sections that are duplicates of the abstract
             if self._is_duplicate_abstract(content_str, abstract, abstract_words):
-                logger.debug(f"Skipping duplicate abstract section: {section_title}")
+                logger.debug(f"Skipping duplicate abstract section: {section.title}")
                 continue
 
             # Skip sections that are too small and contain only metadata
             if len(content_str.split()) < 20 and self._is_metadata_content(content_str):
-                logger.debug(f"Skipping metadata section: {section_title}")
+                logger.debug(f"Skipping metadata section: {section.title}")
                 continue
 
-            filtered[section_title] = content_str
+            filtered.append(section)
 
         return filtered
 
@@ -326,101 +656,3 @@ class TextChunker:
                 return True
 
         return False
-
-    def _create_combined_chunk(
-        self, header: str, small_sections: List, existing_chunks: List, arxiv_id: str, paper_id: str
-    ) -> List[TextChunk]:
-        if not small_sections:
-            return []
-
-        # Combine all small sections
-        combined_content = []
-        total_words = 0
-
-        for section_title, content, word_count in small_sections:
-            combined_content.append(f"Section: {section_title}\n\n{content}")
-            total_words += word_count
-
-        combined_text = f"{header}{'\\n\\n'.join(combined_content)}"
-
-        # If still too small, combine with previous chunk if possible
-        if total_words + len(header.split()) < 200 and existing_chunks:
-            # Try to merge with previous chunk
-            prev_chunk = existing_chunks[-1]
-            merged_text = f"{prev_chunk.text}\\n\\n{'\\n\\n'.join(combined_content)}"
-
-            # Update the previous chunk
-            existing_chunks[-1] = TextChunk(
-                text=merged_text,
-                metadata=ChunkMetadata(
-                    chunk_index=prev_chunk.metadata.chunk_index,
-                    start_char=0,
-                    end_char=len(merged_text),
-                    word_count=len(merged_text.split()),
-                    overlap_with_previous=0,
-                    overlap_with_next=0,
-                    section_title=f"{prev_chunk.metadata.section_title} + Combined",
-                ),
-                arxiv_id=arxiv_id,
-                paper_id=paper_id,
-            )
-            return []
-
-        # Create new chunk with combined content
-        sections_titles = [title for title, _, _ in small_sections]
-        combined_title = " + ".join(sections_titles[:3])  # Limit title length
-        if len(sections_titles) > 3:
-            combined_title += f" + {len(sections_titles) - 3} more"
-
-        chunk = self._create_section_chunk(combined_text, combined_title, len(existing_chunks), arxiv_id, paper_id)
-        return [chunk]
-
-    def _create_section_chunk(
-        self, chunk_text: str, section_title: str, chunk_index: int, arxiv_id: str, paper_id: str
-    ) -> TextChunk:
-        return TextChunk(
-            text=chunk_text,
-            metadata=ChunkMetadata(
-                chunk_index=chunk_index,
-                start_char=0,
-                end_char=len(chunk_text),
-                word_count=len(chunk_text.split()),
-                overlap_with_previous=0,
-                overlap_with_next=0,
-                section_title=section_title,
-            ),
-            arxiv_id=arxiv_id,
-            paper_id=paper_id,
-        )
-
-    def _split_large_section(
-        self, full_section_text: str, header: str, section_title: str, base_chunk_index: int, arxiv_id: str, paper_id: str
-    ) -> List[TextChunk]:
-        # Remove header from section text for chunking, then add back to each chunk
-        section_only = full_section_text[len(header) :]
-
-        # Use traditional chunking on section content
-        traditional_chunks = self.chunk_text(section_only, arxiv_id, paper_id)
-
-        # Add header to each chunk and update metadata
-        enhanced_chunks = []
-        for i, chunk in enumerate(traditional_chunks):
-            enhanced_text = f"{header}{chunk.text}"
-
-            enhanced_chunk = TextChunk(
-                text=enhanced_text,
-                metadata=ChunkMetadata(
-                    chunk_index=base_chunk_index + i,
-                    start_char=chunk.metadata.start_char,
-                    end_char=chunk.metadata.end_char + len(header),
-                    word_count=len(enhanced_text.split()),
-                    overlap_with_previous=chunk.metadata.overlap_with_previous,
-                    overlap_with_next=chunk.metadata.overlap_with_next,
-                    section_title=f"{section_title} (Part {i + 1})",
-                ),
-                arxiv_id=arxiv_id,
-                paper_id=paper_id,
-            )
-            enhanced_chunks.append(enhanced_chunk)
-
-        return enhanced_chunks
@@ -0,0 +1,61 @@
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+TokenSpans = List[Tuple[int, int]]
+
+# Approximation of a subword vocabulary: words are split into pieces of up to 4 chars, each
+# punctuation mark is its own token. Slightly overestimates real tokenizers on English prose.
+_APPROXIMATE_TOKEN = re.compile(r"\w{1,4}|[^\w\s]")
+
+
+class TokenCounter(ABC):
+    """Token boundaries for chunk sizing, as character spans into the source text."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Identifier used in logs and chunk metadata."""
+
+    @abstractmethod
+    def token_spans_batch(self, texts: List[str]) -> List[TokenSpans]:
+        """Tokenize several texts in one call and return each text's token spans."""
+
+    def count_batch(self, texts: List[str]) -> List[int]:
+        return [len(spans) for spans in self.token_spans_batch(texts)]
+
+
+class ApproximateTokenCounter(TokenCounter):
+    """Regex-based fallback that needs no model files."""
+
+    @property
+    def name(self) -> str:
+        return "approximate"
+
+    def token_spans_batch(self, texts: List[str]) -> List[TokenSpans]:
+        return [[match.span() for match in _APPROXIMATE_TOKEN.finditer(text)] for text in texts]
+
+
+class HuggingFaceTokenCounter(TokenCounter):
+    """Local fast tokenizer (the embedding model's own vocabulary) via the ``tokenizers`` library."""
+
+    def __init__(self, tokenizer_name: str):
+        from tokenizers import Tokenizer
+
+        self.tokenizer_name = tokenizer_name
+        self._tokenizer = Tokenizer.from_pretrained(tokenizer_name)
+        # Chunks are sized on content only; truncation would hide oversized chunks
+        self._tokenizer.no_truncation()
+        self._tokenizer.no_padding()
+
+    @property
+    def name(self) -> str:
+        return self.tokenizer_name
+
+    def token_spans_batch(self, texts: List[str]) -> List[TokenSpans]:
+        encodings = self._tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [list(encoding.offsets) for encoding in encodings]
+
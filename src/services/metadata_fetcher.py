@@ -2,21 +2,23 @@ import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from dateutil import parser as date_parser
 from sqlalchemy.orm import Session
 from src.config import Settings
-from src.exceptions import MetadataFetchingException, PipelineException
+from src.exceptions import PipelineException
 from src.repositories.paper import PaperRepository
 from src.schemas.arxiv.paper import ArxivPaper, PaperCreate
-from src.schemas.pdf_parser.models import ArxivMetadata, ParsedPaper, PdfContent
-from src.services.arxiv.client import ArxivClient
-from src.services.opensearch.client import OpenSearchClient
+from src.schemas.pdf_parser.models import ArxivMetadata, ParsedPaper
+from src.services.arxiv.client import ArxivClient, PDFDownloadStats
 from src.services.pdf_parser.parser import PDFParserService
 
 logger = logging.getLogger(__name__)
 
+# Queue sentinel telling a stage worker that its upstream stage is finished
+_STAGE_DONE = None
+
 
 class MetadataFetcher:
 
@@ -28,6 +30,8 @@ class MetadataFetcher:
         max_concurrent_downloads: int = 5,
         max_concurrent_parsing: int = 3,
         settings: Optional[Settings] = None,
+        queue_size: int = 10,
+        fetch_page_size: int = 100,
     ):
         from src.config import get_settings
 
@@ -36,6 +40,8 @@ class MetadataFetcher:
         self.pdf_cache_dir = pdf_cache_dir or self.arxiv_client.pdf_cache_dir
         self.max_concurrent_downloads = max_concurrent_downloads
         self.max_concurrent_parsing = max_concurrent_parsing
+        self.queue_size = queue_size
+        self.fetch_page_size = fetch_page_size
         self.settings = settings or get_settings()
 
     async def fetch_and_process_papers(
@@ -47,7 +53,12 @@ class MetadataFetcher:
         store_to_db: bool = True,
         db_session: Optional[Session] = None,
     ) -> Dict[str, Any]:
+        """Run the staged fetch -> download -> parse -> persist pipeline.
 
+        Stages are connected by bounded queues, so peak memory is set by the queue
+        depths and worker counts rather than by the number of papers, and each paper
+        is persisted as soon as it has gone through every stage.
+        """
         results = {
             "papers_fetched": 0,
             "pdfs_downloaded": 0,
@@ -57,186 +68,314 @@ class MetadataFetcher:
             "errors": [],
             "processing_time": 0,
         }
+        failures = {"download": [], "parse": []}
 
         start_time = datetime.now()
 
-        try:
-            # Step 1: Fetch paper metadata from arXiv
-            papers = await self.arxiv_client.fetch_papers(
-                max_results=max_results, from_date=from_date, to_date=to_date, sort_by="submittedDate", sort_order="descending"
-            )
-
-            results["papers_fetched"] = len(papers)
-
-            if not papers:
-                logger.warning("No papers found")
-                return results
-
-            # Step 2: Process PDFs if requested
-            pdf_results = {}
-            if process_pdfs:
-                pdf_results = await self._process_pdfs_batch(papers)
-                results["pdfs_downloaded"] = pdf_results["downloaded"]
-                results["pdfs_parsed"] = pdf_results["parsed"]
-                results["errors"].extend(pdf_results["errors"])
-
-            # Step 3: Store to database if requested
-            if store_to_db and db_session:
-                logger.info("Step 3: Storing papers to database...")
-                stored_count = self._store_papers_to_db(papers, pdf_results.get("parsed_papers", {}), db_session)
-                results["papers_stored"] = stored_count
-            elif store_to_db:
-                logger.warning("Database storage requested but no session provided")
-                results["errors"].append("Database session not provided for storage")
-
-            # Calculate total processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
-            results["processing_time"] = processing_time
-
-            # Simple logging summary
-            logger.info(
-                f"Pipeline completed in {processing_time:.1f}s: {results['papers_fetched']} papers, {results['pdfs_downloaded']} PDFs, {len(results['errors'])} errors"
-            )
-
-            if results["errors"]:
-                logger.warning("Errors summary:")
-                for i, error in enumerate(results["errors"][:5], 1):  # Show first 5 errors
-                    logger.warning(f"  {i}. {error}")
-                if len(results["errors"]) > 5:
-                    logger.warning(f"  ... and {len(results['errors']) - 5} more errors")
+        if store_to_db and not db_session:
+            logger.warning("Database storage requested but no session provided")
+            results["errors"].append("Database session not provided for storage")
+        paper_repo = PaperRepository(db_session) if store_to_db and db_session else None
+
+        if max_results is None:
+            max_results = self.arxiv_client.max_results
+
+        # Parse cache hit/miss counts are reported per run
+        self.pdf_parser.reset_cache_stats()
+
+        download_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        persist_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        download_workers = max(1, self.max_concurrent_downloads) if process_pdfs else 0
+        parse_workers = max(1, self.max_concurrent_parsing) if process_pdfs else 0
+        download_stats: List[PDFDownloadStats] = []
+
+        logger.info(
+            f"Starting pipeline: {download_workers} download workers, {parse_workers} parse workers, "
+            f"queue size {self.queue_size}"
+        )
+
+        # Each stage signals completion to the next one by sending one sentinel per downstream worker
+        stages = [
+            self._run_stage(
+                [
+                    self._fetch_stage(
+                        max_results,
+                        from_date,
+                        to_date,
+                        download_queue if process_pdfs else persist_queue,
+                        process_pdfs,
+                        results,
+                    )
+                ],
+                download_queue if process_pdfs else persist_queue,
+                download_workers if process_pdfs else 1,
+            ),
+            self._run_stage(
+                [
+                    self._download_worker(download_queue, parse_queue, results, failures, download_stats)
+                    for _ in range(download_workers)
+                ],
+                parse_queue,
+                parse_workers,
+            ),
+            self._run_stage(
+                [self._parse_worker(parse_queue, persist_queue, results, failures) for _ in range(parse_workers)],
+                persist_queue,
+                1 if process_pdfs else 0,
+            ),
+            self._persist_worker(persist_queue, paper_repo, results),
+        ]
+        tasks = [asyncio.create_task(stage) for stage in stages]
 
-            return results
+        try:
+            await asyncio.gather(*tasks)
 
         except Exception as e:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
             logger.error(f"Pipeline error: {e}")
             results["errors"].append(f"Pipeline error: {str(e)}")
             raise PipelineException(f"Pipeline execution failed: {e}") from e
 
-    async def _process_pdfs_batch(self, papers: List[ArxivPaper]) -> Dict[str, Any]:
-        results = {
-            "downloaded": 0,
-            "parsed": 0,
-            "parsed_papers": {},
-            "errors": [],
-            "download_failures": [],
-            "parse_failures": [],
-        }
-
-        logger.info(f"Starting async pipeline for {len(papers)} PDFs...")
-        logger.info(f"Concurrent downloads: {self.max_concurrent_downloads}")
-        logger.info(f"Concurrent parsing: {self.max_concurrent_parsing}")
-
-        # Create semaphores for controlled concurrency
-        download_semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
-        parse_semaphore = asyncio.Semaphore(self.max_concurrent_parsing)
-
-        # Start all download+parse pipelines concurrently
-        pipeline_tasks = [self._download_and_parse_pipeline(paper, download_semaphore, parse_semaphore) for paper in papers]
-
-        # Wait for all pipelines to complete
-        pipeline_results = await asyncio.gather(*pipeline_tasks, return_exceptions=True)
-
-        # Process results with detailed error tracking
-        for paper, result in zip(papers, pipeline_results):
-            if isinstance(result, Exception):
-                error_msg = f"Pipeline error for {paper.arxiv_id}: {str(result)}"
-                logger.error(error_msg)
-                results["errors"].append(error_msg)
-            elif result:
-                # Check if result is a tuple before unpacking
-                # Handle AirflowTaskTerminated and other non-tuple results
-                if isinstance(result, tuple) and len(result) == 2:
-                    # Result is tuple: (download_success, parsed_paper)
-                    download_success, parsed_paper = result
-                else:
-                    # Result is not a tuple (could be AirflowTaskTerminated or other error)
-                    error_msg = f"Pipeline error for {paper.arxiv_id}: Unexpected result type {type(result).__name__}"
-                    logger.error(error_msg)
-                    results["errors"].append(error_msg)
-                    continue
-
-                if download_success:
-                    results["downloaded"] += 1
-
-                    if parsed_paper:
-                        results["parsed"] += 1
-                        results["parsed_papers"][paper.arxiv_id] = parsed_paper
-                    else:
-                        # Download succeeded but parsing failed
-                        results["parse_failures"].append(paper.arxiv_id)
-                else:
-                    # Download failed
-                    results["download_failures"].append(paper.arxiv_id)
-            else:
-                # No result returned (shouldn't happen but handle gracefully)
-                results["download_failures"].append(paper.arxiv_id)
-
-        # Simple processing summary
-        logger.info(f"PDF processing: {results['downloaded']}/{len(papers)} downloaded, {results['parsed']} parsed")
-
-        if results["download_failures"]:
-            logger.warning(f"Download failures: {len(results['download_failures'])}")
+        if not results["papers_fetched"]:
+            logger.warning("No papers found")
+
+        if failures["download"]:
+            logger.warning(f"Download failures: {len(failures['download'])}")
+            results["errors"].extend([f"Download failed: {arxiv_id}" for arxiv_id in failures["download"]])
+        if failures["parse"]:
+            logger.warning(f"Parse failures: {len(failures['parse'])}")
+            results["errors"].extend([f"PDF parse failed: {arxiv_id}" for arxiv_id in failures["parse"]])
+
+        if process_pdfs:
+            results["download_stats"] = self._collect_download_stats(download_stats)
+            results["parse_cache_stats"] = self.pdf_parser.get_cache_stats()
+
+        # Calculate total processing time
+        processing_time = (datetime.now() - start_time).total_seconds()
+        results["processing_time"] = processing_time
+        results["rate_limit_stats"] = self.arxiv_client.get_rate_limit_stats()
+
+        # Simple logging summary
+        logger.info(
+            f"Pipeline completed in {processing_time:.1f}s: {results['papers_fetched']} papers, "
+            f"{results['pdfs_downloaded']} PDFs, {results['pdfs_parsed']} parsed, "
+            f"{results['papers_stored']} stored, {len(results['errors'])} errors"
+        )
+
+        for limiter_stats in results["rate_limit_stats"].values():
+            logger.info(
+                f"arXiv {limiter_stats['name']} rate limiter: {limiter_stats['acquisitions']} requests, "
+                f"{limiter_stats['throttled']} throttled, {limiter_stats['total_wait_seconds']:.1f}s total wait"
+            )
 
-        if results["parse_failures"]:
-            logger.warning(f"Parse failures: {len(results['parse_failures'])}")
+        if results.get("parse_cache_stats"):
+            cache_stats = results["parse_cache_stats"]
+            logger.info(
+                f"Parse cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                f"({cache_stats['entries']} entries, {cache_stats['size_bytes'] / 1024 / 1024:.1f}MB)"
+            )
 
-        # Add specific failure info to general errors list for backward compatibility
-        if results["download_failures"]:
-            results["errors"].extend([f"Download failed: {arxiv_id}" for arxiv_id in results["download_failures"]])
-        if results["parse_failures"]:
-            results["errors"].extend([f"PDF parse failed: {arxiv_id}" for arxiv_id in results["parse_failures"]])
+        if results["errors"]:
+            logger.warning("Errors summary:")
+            for i, error in enumerate(results["errors"][:5], 1):  # Show first 5 errors
+                logger.warning(f"  {i}. {error}")
+            if len(results["errors"]) > 5:
+                logger.warning(f"  ... and {len(results['errors']) - 5} more errors")
 
         return results
 
-    async def _download_and_parse_pipeline(
-        self, paper: ArxivPaper, download_semaphore: asyncio.Semaphore, parse_semaphore: asyncio.Semaphore
-    ) -> tuple:
-        download_success = False
-        parsed_paper = None
+    async def _run_stage(self, workers: List, downstream: asyncio.Queue, downstream_workers: int) -> None:
+        await asyncio.gather(*workers)
+        for _ in range(downstream_workers):
+            await downstream.put(_STAGE_DONE)
 
-        try:
-            # Step 1: Download PDF with download concurrency control
-            async with download_semaphore:
+    async def _fetch_stage(
+        self,
+        max_results: int,
+        from_date: Optional[str],
+        to_date: Optional[str],
+        output: asyncio.Queue,
+        process_pdfs: bool,
+        results: Dict[str, Any],
+    ) -> None:
+        # Papers are handed downstream page by page, so downloads start before the last page arrives
+        async for paper in self.arxiv_client.iter_papers(
+            page_size=self.fetch_page_size,
+            max_results=max_results,
+            from_date=from_date,
+            to_date=to_date,
+            sort_by="submittedDate",
+            sort_order="descending",
+        ):
+            results["papers_fetched"] += 1
+            # Without PDF processing papers go straight to the persist stage as (paper, parsed_paper) pairs
+            await output.put(paper if process_pdfs else (paper, None))
+
+    async def _download_worker(
+        self,
+        input_queue: asyncio.Queue,
+        output: asyncio.Queue,
+        results: Dict[str, Any],
+        failures: Dict[str, List[str]],
+        download_stats: List[PDFDownloadStats],
+    ) -> None:
+        while (paper := await input_queue.get()) is not _STAGE_DONE:
+            pdf_path = None
+            # Keep the PDF from being evicted by later downloads until the parse stage is done with it
+            self.arxiv_client.pdf_cache.pin(paper.arxiv_id)
+            try:
                 logger.debug(f"Starting download: {paper.arxiv_id}")
-                pdf_path = await self.arxiv_client.download_pdf(paper, False)
+                pdf_path, stats = await self.arxiv_client.download_pdf_with_stats(paper, False)
+                if stats is not None:
+                    download_stats.append(stats)
+            except Exception as e:
+                logger.error(f"Download error for {paper.arxiv_id}: {e}")
 
-                if pdf_path:
-                    download_success = True
-                    logger.debug(f"Download complete: {paper.arxiv_id}")
-                else:
-                    logger.error(f"Download failed: {paper.arxiv_id}")
-                    return (False, None)
-
-            # Step 2: Parse PDF with parse concurrency control (happens AFTER download completes)
-            # This allows other downloads to continue while this PDF is being parsed
-            async with parse_semaphore:
-                logger.debug(f"Starting parse: {paper.arxiv_id}")
-                pdf_content = await self.pdf_parser.parse_pdf(pdf_path)
-
-                if pdf_content:
-                    # Create ArxivMetadata from the paper
-                    arxiv_metadata = ArxivMetadata(
-                        title=paper.title,
-                        authors=paper.authors,
-                        abstract=paper.abstract,
-                        arxiv_id=paper.arxiv_id,
-                        categories=paper.categories,
-                        published_date=paper.published_date,
-                        pdf_url=paper.pdf_url,
-                    )
+            if pdf_path:
+                results["pdfs_downloaded"] += 1
+                logger.debug(f"Download complete: {paper.arxiv_id}")
+            else:
+                self.arxiv_client.pdf_cache.unpin(paper.arxiv_id)
+                failures["download"].append(paper.arxiv_id)
+
+            await output.put((paper, pdf_path))
+
+    async def _parse_worker(
+        self, input_queue: asyncio.Queue, output: asyncio.Queue, results: Dict[str, Any], failures: Dict[str, List[str]]
+    ) -> None:
+        while (item := await input_queue.get()) is not _STAGE_DONE:
+            paper, pdf_path = item
+            parsed_paper = None
+
+            if pdf_path:
+                try:
+                    logger.debug(f"Starting parse: {paper.arxiv_id}")
+                    parsed_paper = await self._parse_paper(paper, pdf_path)
+                except Exception as e:
+                    logger.error(f"Parse error for {paper.arxiv_id}: {e}")
+                finally:
+                    self.arxiv_client.pdf_cache.unpin(paper.arxiv_id)
 
-                    # Combine into ParsedPaper
-                    parsed_paper = ParsedPaper(arxiv_metadata=arxiv_metadata, pdf_content=pdf_content)
-                    logger.debug(f"Parse complete: {paper.arxiv_id} - {len(pdf_content.raw_text)} chars extracted")
+                if parsed_paper:
+                    results["pdfs_parsed"] += 1
                 else:
                     # PDF parsing failed, but this is not critical - we can continue with metadata only
                     logger.warning(f"PDF parsing failed for {paper.arxiv_id}, continuing with metadata only")
+                    failures["parse"].append(paper.arxiv_id)
+
+            await output.put((paper, parsed_paper))
+
+    async def _parse_paper(self, paper: ArxivPaper, pdf_path: Path) -> Optional[ParsedPaper]:
+        pdf_content = await self.pdf_parser.parse_pdf(pdf_path)
+        if not pdf_content:
+            return None
+
+        # Create ArxivMetadata from the paper
+        arxiv_metadata = ArxivMetadata(
+            title=paper.title,
+            authors=paper.authors,
+            abstract=paper.abstract,
+            arxiv_id=paper.arxiv_id,
+            categories=paper.categories,
+            published_date=paper.published_date,
+            pdf_url=paper.pdf_url,
+        )
+
+        logger.debug(f"Parse complete: {paper.arxiv_id} - {len(pdf_content.raw_text)} chars extracted")
+        return ParsedPaper(arxiv_metadata=arxiv_metadata, pdf_content=pdf_content)
+
+    async def _persist_worker(
+        self, input_queue: asyncio.Queue, paper_repo: Optional[PaperRepository], results: Dict[str, Any]
+    ) -> None:
+        while (item := await input_queue.get()) is not _STAGE_DONE:
+            paper, parsed_paper = item
+
+            if paper_repo is not None and self._store_paper(paper, parsed_paper, paper_repo):
+                results["papers_stored"] += 1
+            # Dropping the reference here releases the parsed full text
+
+    def _store_paper(self, paper: ArxivPaper, parsed_paper: Optional[ParsedPaper], paper_repo: PaperRepository) -> bool:
+        try:
+            # Base paper data
+            published_date = (
+                date_parser.parse(paper.published_date) if isinstance(paper.published_date, str) else paper.published_date
+            )
+            paper_data = {
+                "arxiv_id": paper.arxiv_id,
+                "title": paper.title,
+                "authors": paper.authors,
+                "abstract": paper.abstract,
+                "categories": paper.categories,
+                "published_date": published_date,
+                "pdf_url": paper.pdf_url,
+            }
+
+            # Add parsed content if available
+            if parsed_paper:
+                parsed_content = self._serialize_parsed_content(parsed_paper)
+                paper_data.update(parsed_content)
+                logger.debug(
+                    f"Storing paper {paper.arxiv_id} with parsed content "
+                    f"({len(parsed_content.get('raw_text') or '')} chars)"
+                )
+            else:
+                # No parsed content - just store metadata
+                paper_data.update({"pdf_processed": False, "parser_metadata": {"note": "PDF processing not available or failed"}})
+                logger.debug(f"Storing paper {paper.arxiv_id} with metadata only")
+
+            # The repository commits each upsert, so the paper is durable as soon as it finishes the pipeline
+            stored_paper = paper_repo.upsert(PaperCreate(**paper_data))
+
+            if stored_paper:
+                content_info = "with parsed content" if parsed_paper else "metadata only"
+                logger.debug(f"Stored paper {paper.arxiv_id} to database ({content_info})")
+                return True
+            return False
 
         except Exception as e:
-            logger.error(f"Pipeline error for {paper.arxiv_id}: {e}")
-            raise MetadataFetchingException(f"Pipeline error for {paper.arxiv_id}: {e}") from e
+            logger.error(f"Failed to store paper {paper.arxiv_id}: {e}")
+            paper_repo.session.rollback()
+            return False
+
+    def _collect_download_stats(self, download_stats: List[PDFDownloadStats]) -> Dict[str, Any]:
+        totals = {
+            "downloads": 0,
+            "resumed_downloads": 0,
+            "not_modified": 0,
+            "bytes_downloaded": 0,
+            "bytes_resumed": 0,
+            "download_seconds": 0.0,
+            "avg_throughput_mb_per_s": 0.0,
+        }
+
+        for stats in download_stats:
+            logger.debug(
+                f"Download {stats.arxiv_id}: {stats.bytes_downloaded} bytes in {stats.seconds:.2f}s "
+                f"({stats.throughput_bytes_per_second / 1024 / 1024:.2f}MB/s, {stats.attempts} attempts, resumed={stats.resumed})"
+            )
+            totals["downloads"] += 1
+            totals["resumed_downloads"] += int(stats.resumed)
+            totals["not_modified"] += int(stats.not_modified)
+            totals["bytes_downloaded"] += stats.bytes_downloaded
+            totals["bytes_resumed"] += stats.bytes_resumed
+            totals["download_seconds"] += stats.seconds
+
+        if totals["download_seconds"] > 0:
+            totals["avg_throughput_mb_per_s"] = round(totals["bytes_downloaded"] / totals["download_seconds"] / 1024 / 1024, 3)
+        totals["download_seconds"] = round(totals["download_seconds"], 2)
+
+        if totals["downloads"]:
+            logger.info(
+                f"Downloaded {totals['bytes_downloaded'] / 1024 / 1024:.1f}MB in {totals['downloads']} requests "
+                f"({totals['avg_throughput_mb_per_s']}MB/s per download, {totals['resumed_downloads']} resumed)"
+            )
 
-        return (download_success, parsed_paper)
+        return totals
 
     def _serialize_parsed_content(self, parsed_paper: ParsedPaper) -> Dict[str, Any]:
         try:
@@ -261,70 +400,6 @@ class MetadataFetcher:
             logger.error(f"Failed to serialize parsed content: {e}")
             return {"pdf_processed": False, "parser_metadata": {"error": str(e)}}
 
-    def _store_papers_to_db(
-        self,
-        papers: List[ArxivPaper],
-        parsed_papers: Dict[str, ParsedPaper],
-        db_session: Session,
-    ) -> int:
-        paper_repo = PaperRepository(db_session)
-        stored_count = 0
-
-        for paper in papers:
-            try:
-                # Get parsed content if available
-                parsed_paper = parsed_papers.get(paper.arxiv_id)
-
-                # Base paper data
-                published_date = (
-                    date_parser.parse(paper.published_date) if isinstance(paper.published_date, str) else paper.published_date
-                )
-                paper_data = {
-                    "arxiv_id": paper.arxiv_id,
-                    "title": paper.title,
-                    "authors": paper.authors,
-                    "abstract": paper.abstract,
-                    "categories": paper.categories,
-                    "published_date": published_date,
-                    "pdf_url": paper.pdf_url,
-                }
-
-                # Add parsed content if available
-                if parsed_paper:
-                    parsed_content = self._serialize_parsed_content(parsed_paper)
-                    paper_data.update(parsed_content)
-                    logger.debug(
-                        f"Storing paper {paper.arxiv_id} with parsed content ({len(parsed_content.get('raw_text', '')) if parsed_content.get('raw_text') else 0} chars)"
-                    )
-                else:
-                    # No parsed content - just store metadata
-                    paper_data.update(
-                        {"pdf_processed": False, "parser_metadata": {"note": "PDF processing not available or failed"}}
-                    )
-                    logger.debug(f"Storing paper {paper.arxiv_id} with metadata only")
-
-                paper_create = PaperCreate(**paper_data)
-                stored_paper = paper_repo.upsert(paper_create)
-
-                if stored_paper:
-                    stored_count += 1
-                    content_info = "with parsed content" if parsed_paper else "metadata only"
-                    logger.debug(f"Stored paper {paper.arxiv_id} to database ({content_info})")
-
-            except Exception as e:
-                logger.error(f"Failed to store paper {paper.arxiv_id}: {e}")
-
-        # Commit all changes
-        try:
-            db_session.commit()
-            logger.info(f"Committed {stored_count} papers to database with full content storage")
-        except Exception as e:
-            logger.error(f"Failed to commit papers to database: {e}")
-            db_session.rollback()
-            stored_count = 0
-
-        return stored_count
-
 
 def make_metadata_fetcher(
     arxiv_client: ArxivClient,
@@ -342,6 +417,9 @@ def make_metadata_fetcher(
         pdf_parser=pdf_parser,
         pdf_cache_dir=pdf_cache_dir,
         max_concurrent_downloads=settings.arxiv.max_concurrent_downloads,
-        max_concurrent_parsing=settings.arxiv.max_concurrent_parsing,
+        # Enough parse stage workers to keep every process in the parse pool busy
+        max_concurrent_parsing=max(settings.arxiv.max_concurrent_parsing, settings.pdf_parser.parse_workers),
         settings=settings,
+        queue_size=settings.arxiv.pipeline_queue_size,
+        fetch_page_size=settings.arxiv.fetch_page_size,
     )
@@ -1,10 +1,14 @@
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from opensearchpy import OpenSearch
 from src.config import Settings
+from src.exceptions import ConfigurationError
+from src.schemas.indexing.models import ChunkRecord
 
-from .index_config_hybrid import ARXIV_PAPERS_CHUNKS_MAPPING, HYBRID_RRF_PIPELINE
+from .index_config_hybrid import HYBRID_RRF_PIPELINE, make_chunks_mapping
 from .query_builder import QueryBuilder
 
 logger = logging.getLogger(__name__)
@@ -16,6 +20,7 @@ class OpenSearchClient:
         self.host = host
         self.settings = settings
         self.index_name = f"{settings.opensearch.index_name}-{settings.opensearch.chunk_index_suffix}"
+        self.index_mapping = make_chunks_mapping(settings.opensearch.vector_dimension)
 
         self.client = OpenSearch(
             hosts=[host],
@@ -75,17 +80,38 @@ class OpenSearchClient:
                 logger.info(f"Deleted existing hybrid index: {self.index_name}")
 
             if not self.client.indices.exists(index=self.index_name):
-                self.client.indices.create(index=self.index_name, body=ARXIV_PAPERS_CHUNKS_MAPPING)
+                self.client.indices.create(index=self.index_name, body=self.index_mapping)
                 logger.info(f"Created hybrid index: {self.index_name}")
                 return True
 
             logger.info(f"Hybrid index already exists: {self.index_name}")
+            self._add_missing_mapping_fields()
             return False
 
         except Exception as e:
             logger.error(f"Error creating hybrid index: {e}")
             raise
 
+    def _add_missing_mapping_fields(self) -> None:
+        """Add fields introduced after the index was created; the mapping is strict.
+
+        Raises ConfigurationError when the index was built for a different embedding dimension.
+        """
+        current = self.client.indices.get_mapping(index=self.index_name)[self.index_name]["mappings"].get("properties", {})
+        expected = self.index_mapping["mappings"]["properties"]
+
+        indexed_dimension = current.get("embedding", {}).get("dimension")
+        if indexed_dimension and indexed_dimension != expected["embedding"]["dimension"]:
+            raise ConfigurationError(
+                f"Index {self.index_name} stores {indexed_dimension}-dim embeddings but OPENSEARCH__VECTOR_DIMENSION is "
+                f"{expected['embedding']['dimension']}; recreate the index (setup_indices(force=True)) and re-index papers"
+            )
+
+        missing = {field: definition for field, definition in expected.items() if field not in current}
+        if missing:
+            self.client.indices.put_mapping(index=self.index_name, body={"properties": missing})
+            logger.info(f"Added fields to hybrid index mapping: {', '.join(missing)}")
+
     def _create_rrf_pipeline(self, force: bool = False) -> bool:
         try:
             pipeline_id = HYBRID_RRF_PIPELINE["id"]
@@ -283,19 +309,45 @@ class OpenSearchClient:
             logger.error(f"Error indexing chunk: {e}")
             return False
 
-    def bulk_index_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _chunk_source(self, chunk: ChunkRecord, paper_fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Document body of a chunk, without the embedding."""
+        return {
+            **paper_fields,
+            "arxiv_id": chunk.arxiv_id,
+            "paper_id": chunk.paper_id,
+            "chunk_index": chunk.chunk_index,
+            "chunk_hash": chunk.chunk_hash,
+            "chunk_text": chunk.text,
+            "chunk_word_count": chunk.word_count,
+            "start_char": chunk.start_char,
+            "end_char": chunk.end_char,
+            "section_title": chunk.section_title,
+        }
+
+    def bulk_index_chunks(self, chunks: List[ChunkRecord], paper_fields: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Bulk index embedded chunk records of one paper.
+
+        Each bulk action is built straight from the record, with the denormalized paper fields
+        shared across the paper's chunks, and streamed to the bulk helper.
+
+        Args:
+            chunks: Chunk records with ``embedding`` set
+            paper_fields: Paper-level fields stored on every chunk (title, authors, ...)
+
+        Returns:
+            Dict with success and failed counts
+        """
         from opensearchpy import helpers
 
-        try:
-            actions = []
+        def actions():
             for chunk in chunks:
-                chunk_data = chunk["chunk_data"].copy()
-                chunk_data["embedding"] = chunk["embedding"]
-
-                action = {"_index": self.index_name, "_source": chunk_data}
-                actions.append(action)
+                source = self._chunk_source(chunk, paper_fields)
+                source["embedding"] = chunk.embedding
+                yield {"_index": self.index_name, "_source": source}
 
-            success, failed = helpers.bulk(self.client, actions, refresh=True)
+        try:
+            success, failed = helpers.bulk(self.client, actions(), refresh=True)
 
             logger.info(f"Bulk indexed {success} chunks, {len(failed)} failed")
             return {"success": success, "failed": len(failed)}
@@ -304,6 +356,96 @@ class OpenSearchClient:
             logger.error(f"Bulk chunk indexing error: {e}")
             raise
 
+    def get_indexed_chunks(self, arxiv_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the stored chunks of a paper without their embeddings.
+
+        Unlike ``get_chunks_by_paper`` this raises on errors, since callers use the result to
+        decide what to delete.
+
+        Args:
+            arxiv_id: Paper to look up
+
+        Returns:
+            Dict of document ID to stored source
+        """
+        search_body = {
+            "query": {"term": {"arxiv_id": arxiv_id}},
+            "size": 10000,
+            "_source": {"excludes": ["embedding"]},
+        }
+        response = self.client.search(index=self.index_name, body=search_body)
+        return {hit["_id"]: hit["_source"] for hit in response["hits"]["hits"]}
+
+    def sync_paper_chunks(
+        self,
+        new_chunks: List[ChunkRecord],
+        kept_chunks: List[Tuple[str, ChunkRecord, Dict[str, Any]]],
+        stale_ids: List[str],
+        paper_fields: Dict[str, Any],
+    ) -> Dict[str, int]:
+        """
+        Apply an incremental re-index of one paper in a single bulk request.
+
+        New chunks are indexed with their embeddings. Kept chunks are partially updated (their
+        stored embedding is untouched), and only if a field such as ``chunk_index`` or the paper
+        metadata changed. Stale chunks are deleted.
+
+        Args:
+            new_chunks: Chunk records with ``embedding`` set
+            kept_chunks: (document ID, chunk record, stored source) for chunks already indexed
+            stale_ids: Document IDs no longer produced by the chunker
+            paper_fields: Paper-level fields stored on every chunk
+
+        Returns:
+            Dict with indexed, updated, deleted and failed counts
+        """
+        from opensearchpy import helpers
+
+        serializer = self.client.transport.serializer
+        actions = []
+        for chunk in new_chunks:
+            source = self._chunk_source(chunk, paper_fields)
+            source["embedding"] = chunk.embedding
+            actions.append({"_index": self.index_name, "_source": source})
+
+        updated = 0
+        for doc_id, chunk, stored in kept_chunks:
+            source = self._chunk_source(chunk, paper_fields)
+            # Compare as stored: dates and other values go through the same JSON serializer
+            if json.loads(serializer.dumps(source)) != stored:
+                actions.append({"_op_type": "update", "_index": self.index_name, "_id": doc_id, "doc": source})
+                updated += 1
+
+        actions.extend({"_op_type": "delete", "_index": self.index_name, "_id": doc_id} for doc_id in stale_ids)
+
+        if not actions:
+            return {"indexed": 0, "updated": 0, "deleted": 0, "failed": 0}
+
+        try:
+            _, failed = helpers.bulk(self.client, actions, refresh=True, raise_on_error=False)
+        except Exception as e:
+            logger.error(f"Bulk chunk sync error: {e}")
+            raise
+
+        # A stale chunk that is already gone (404) is not a failure
+        failures = Counter(
+            op_type
+            for item in failed
+            for op_type, result in item.items()
+            if not (op_type == "delete" and result.get("status") == 404)
+        )
+        logger.info(
+            f"Synced chunks: {len(new_chunks)} indexed, {updated} updated, {len(stale_ids)} deleted, "
+            f"{sum(failures.values())} failed"
+        )
+        return {
+            "indexed": len(new_chunks) - failures["index"],
+            "updated": updated - failures["update"],
+            "deleted": len(stale_ids) - failures["delete"],
+            "failed": sum(failures.values()),
+        }
+
     def delete_paper_chunks(self, arxiv_id: str) -> bool:
         try:
             response = self.client.delete_by_query(
@@ -1,3 +1,6 @@
+import copy
+from typing import Any, Dict
+
 ARXIV_PAPERS_CHUNKS_INDEX = "arxiv-papers-chunks"
 
 # Index mapping for chunked papers with vector embeddings
@@ -21,6 +24,7 @@ ARXIV_PAPERS_CHUNKS_MAPPING = {
             "arxiv_id": {"type": "keyword"},
             "paper_id": {"type": "keyword"},
             "chunk_index": {"type": "integer"},
+            "chunk_hash": {"type": "keyword"},
             "chunk_text": {
                 "type": "text",
                 "analyzer": "text_analyzer",
@@ -31,7 +35,7 @@ ARXIV_PAPERS_CHUNKS_MAPPING = {
             "end_char": {"type": "integer"},
             "embedding": {
                 "type": "knn_vector",
-                "dimension": 1024,  # Jina v3 embeddings dimension
+                "dimension": 1024,  # Jina v3 default; make_chunks_mapping sizes it for the configured model
                 "method": {
                     "name": "hnsw",  # Hierarchical Navigable Small World
                     "space_type": "cosinesimil",  # Cosine similarity
@@ -63,6 +67,14 @@ ARXIV_PAPERS_CHUNKS_MAPPING = {
     },
 }
 
+
+def make_chunks_mapping(vector_dimension: int) -> Dict[str, Any]:
+    """Chunk index mapping with the embedding field sized to ``vector_dimension``."""
+    mapping = copy.deepcopy(ARXIV_PAPERS_CHUNKS_MAPPING)
+    mapping["mappings"]["properties"]["embedding"]["dimension"] = vector_dimension
+    return mapping
+
+
 HYBRID_RRF_PIPELINE = {
     "id": "hybrid-rrf-pipeline",
     "description": "Post processor for hybrid RRF search",
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -9,6 +10,8 @@ from docling.document_converter import DocumentConverter, PdfFormatOption
 from src.exceptions import PDFParsingException, PDFValidationError
 from src.schemas.pdf_parser.models import PaperFigure, PaperSection, PaperTable, ParserType, PdfContent
 
+from .sharding import PDFIUM_LOCK, sections_from_elements
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,18 +32,19 @@ class DoclingParser:
 
     def _warm_up_models(self):
         if not self._warmed_up:
-            # This happens only once per DoclingParser instance
+            # Load the PDF pipeline models once per DoclingParser instance so the first document doesn't pay for it
+            self._converter.initialize_pipeline(InputFormat.PDF)
             self._warmed_up = True
 
-    def _validate_pdf(self, pdf_path: Path) -> bool:
+    def _validate_pdf(self, pdf_path: Path, page_count: Optional[int] = None) -> bool:
         try:
             # Check file exists and is not empty
-            if pdf_path.stat().st_size == 0:
+            file_size = pdf_path.stat().st_size
+            if file_size == 0:
                 logger.error(f"PDF file is empty: {pdf_path}")
                 raise PDFValidationError(f"PDF file is empty: {pdf_path}")
 
             # Check file size limit
-            file_size = pdf_path.stat().st_size
             if file_size > self.max_file_size_bytes:
                 logger.warning(
                     f"PDF file size ({file_size / 1024 / 1024:.1f}MB) exceeds limit ({self.max_file_size_bytes / 1024 / 1024:.1f}MB), skipping processing"
@@ -56,10 +60,12 @@ class DoclingParser:
                     logger.error(f"File does not have PDF header: {pdf_path}")
                     raise PDFValidationError(f"File does not have PDF header: {pdf_path}")
 
-            # Check page count limit
-            pdf_doc = pdfium.PdfDocument(str(pdf_path))
-            actual_pages = len(pdf_doc)
-            pdf_doc.close()
+            # Check page count limit; callers that already inspected the PDF pass page_count so it isn't opened twice
+            if page_count is None:
+                pdf_doc = pdfium.PdfDocument(str(pdf_path))
+                page_count = len(pdf_doc)
+                pdf_doc.close()
+            actual_pages = page_count
 
             if actual_pages > self.max_pages:
                 logger.warning(
@@ -75,10 +81,25 @@ class DoclingParser:
             logger.error(f"Error validating PDF {pdf_path}: {e}")
             raise PDFValidationError(f"Error validating PDF {pdf_path}: {e}")
 
-    async def parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
+    async def parse_pdf(self, pdf_path: Path, shard: bool = False, page_count: Optional[int] = None) -> Optional[PdfContent]:
+        # In-process parsing (no PDFParserService pool) still runs off the event loop, in a worker thread
+        return await asyncio.to_thread(self._parse_pdf_in_thread, pdf_path, shard, page_count)
+
+    def _parse_pdf_in_thread(self, pdf_path: Path, shard: bool, page_count: Optional[int]) -> Optional[PdfContent]:
+        # Docling renders pages with pypdfium2, which is not thread-safe, and one converter is
+        # shared by all calls, so in-process conversions (and shards) run one at a time
+        with PDFIUM_LOCK:
+            return self.parse_pdf_sync(pdf_path, shard=shard, page_count=page_count)
+
+    def parse_pdf_sync(self, pdf_path: Path, shard: bool = False, page_count: Optional[int] = None) -> Optional[PdfContent]:
+        """Parse a PDF; with ``shard=True`` the file is one page range of a larger document.
+
+        Shards keep a trailing header with no body and flag text that precedes their first
+        header, so the stitcher can join sections that cross shard boundaries.
+        """
         try:
             # Validate PDF first (includes size and page limits)
-            self._validate_pdf(pdf_path)
+            self._validate_pdf(pdf_path, page_count)
 
             # Warm up models on first use
             self._warm_up_models()
@@ -91,24 +112,11 @@ class DoclingParser:
             doc = result.document
 
             # Extract sections from document structure
-            sections = []
-            current_section = {"title": "Content", "content": ""}
-
-            for element in doc.texts:
-                if hasattr(element, "label") and element.label in ["title", "section_header"]:
-                    # Save previous section if it has content
-                    if current_section["content"].strip():
-                        sections.append(PaperSection(title=current_section["title"], content=current_section["content"].strip()))
-                    # Start new section
-                    current_section = {"title": element.text.strip(), "content": ""}
-                else:
-                    # Add content to current section
-                    if hasattr(element, "text") and element.text:
-                        current_section["content"] += element.text + "\n"
-
-            # Add final section
-            if current_section["content"].strip():
-                sections.append(PaperSection(title=current_section["title"], content=current_section["content"].strip()))
+            sections, starts_mid_section = sections_from_elements(doc.texts, shard=shard)
+
+            metadata = {"source": "docling", "note": "Content extracted from PDF, metadata comes from arXiv API"}
+            if shard:
+                metadata["starts_mid_section"] = starts_mid_section
 
             # Focus on what arXiv API doesn't provide: structured full text content only
             return PdfContent(
@@ -118,7 +126,7 @@ class DoclingParser:
                 raw_text=doc.export_to_text(),
                 references=[],
                 parser_used=ParserType.DOCLING,
-                metadata={"source": "docling", "note": "Content extracted from PDF, metadata comes from arXiv API"},
+                metadata=metadata,
             )
 
         except PDFValidationError as e:
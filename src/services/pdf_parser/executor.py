@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.exceptions import PDFParsingException
+from src.schemas.pdf_parser.models import PdfContent
+
+from .docling import DoclingParser
+from .text_layer import TextLayerParser
+
+logger = logging.getLogger(__name__)
+
+# Per-process parsers, created once by the pool initializer and reused for every document
+_worker_parser: Optional[DoclingParser] = None
+_worker_text_parser: Optional[TextLayerParser] = None
+
+
+def _init_worker(parser_options: Dict[str, Any], text_layer_options: Dict[str, Any]) -> None:
+    """Pool initializer: build and warm up one DoclingParser per worker process."""
+    global _worker_parser, _worker_text_parser
+    logging.basicConfig(level=logging.INFO)
+    _worker_parser = DoclingParser(**parser_options)
+    _worker_parser._warm_up_models()
+    _worker_text_parser = TextLayerParser(**text_layer_options)
+    logger.info(f"PDF parse worker {os.getpid()} ready")
+
+
+def _parse_in_worker(pdf_path: str, shard: bool = False, page_count: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Parse one PDF inside a worker and return plain data that pickles cheaply."""
+    content = _worker_parser.parse_pdf_sync(Path(pdf_path), shard=shard, page_count=page_count)
+    return content.model_dump() if content else None
+
+
+def _extract_text_layer_in_worker(pdf_path: str) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Run the fast text-layer extractor inside a worker."""
+    content, quality = _worker_text_parser.parse_pdf_sync(Path(pdf_path))
+    return (content.model_dump() if content else None), quality
+
+
+class PDFParseExecutor:
+    """Runs Docling conversions in a process pool so parsing never blocks the event loop.
+
+    Each worker keeps a warmed-up DocumentConverter for its lifetime and is recycled after
+    ``max_tasks_per_child`` documents to bound memory growth. A document that exceeds the
+    timeout recycles the whole pool, since a running conversion cannot be cancelled.
+    """
+
+    def __init__(
+        self,
+        parser_options: Dict[str, Any],
+        text_layer_options: Dict[str, Any],
+        max_workers: int = 2,
+        max_tasks_per_child: int = 50,
+        timeout_seconds: float = 300.0,
+    ):
+        self.parser_options = parser_options
+        self.text_layer_options = text_layer_options
+        self.max_workers = max_workers
+        self.max_tasks_per_child = max_tasks_per_child or None
+        self.timeout_seconds = timeout_seconds
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that already runs threads (uvicorn, Airflow) is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.parser_options, self.text_layer_options),
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+            logger.info(f"Started PDF parse pool with {self.max_workers} workers")
+        return self._pool
+
+    def _recycle_pool(self) -> None:
+        """Terminate the current pool (including stuck workers); the next parse starts a fresh one."""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        self._generation += 1
+
+        # Running conversions ignore cancellation, so the worker processes have to be killed
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        logger.warning(f"Recycled PDF parse pool ({len(processes)} workers terminated)")
+
+    async def parse(self, pdf_path: Path, shard: bool = False, page_count: Optional[int] = None) -> Optional[PdfContent]:
+        """
+        Parse a PDF with Docling in a worker process.
+
+        Args:
+            pdf_path: Path to the PDF file
+            shard: The file is one page range of a larger document
+            page_count: Known page count, saves reopening the PDF for validation
+
+        Returns:
+            PdfContent, or None when the PDF is skipped because of size/page limits
+
+        Raises:
+            PDFParsingException: On timeout or when the worker process dies
+        """
+        result = await self._run(pdf_path, _parse_in_worker, str(pdf_path), shard, page_count)
+        return PdfContent.model_validate(result) if result else None
+
+    async def extract_text_layer(self, pdf_path: Path) -> Tuple[Optional[PdfContent], float]:
+        """
+        Run the fast text-layer extractor in a worker process.
+
+        Returns:
+            Tuple of (PdfContent or None, quality score)
+        """
+        result, quality = await self._run(pdf_path, _extract_text_layer_in_worker, str(pdf_path))
+        return (PdfContent.model_validate(result) if result else None), quality
+
+    async def _run(self, pdf_path: Path, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+
+        # One retry when the pool was recycled underneath us because of another document's timeout
+        for attempt in range(2):
+            pool = self._get_pool()
+            generation = self._generation
+            future = loop.run_in_executor(pool, func, *args)
+
+            try:
+                return await asyncio.wait_for(future, timeout=self.timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.error(f"PDF processing timed out after {self.timeout_seconds}s: {pdf_path.name}")
+                if generation == self._generation:
+                    self._recycle_pool()
+                raise PDFParsingException(f"PDF processing timed out after {self.timeout_seconds}s: {pdf_path}")
+            except asyncio.CancelledError:
+                # Queued work is cancelled when another document's timeout recycles the pool
+                if generation != self._generation and not asyncio.current_task().cancelling() and attempt == 0:
+                    logger.info(f"Resubmitting {pdf_path.name} to the recycled parse pool")
+                    continue
+                raise
+            except BrokenProcessPool as e:
+                if generation != self._generation and attempt == 0:
+                    logger.info(f"Resubmitting {pdf_path.name} to the recycled parse pool")
+                    continue
+                logger.error(f"PDF parse worker died while processing {pdf_path.name}: {e}")
+                if generation == self._generation:
+                    self._recycle_pool()
+                raise PDFParsingException(f"PDF parse worker died while processing {pdf_path}: {e}")
+
+        raise PDFParsingException(f"PDF parse pool unavailable for {pdf_path}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
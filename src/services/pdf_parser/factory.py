@@ -1,8 +1,42 @@
+import logging
 from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
-from src.config import get_settings
+from src.config import Settings, get_settings
+from src.exceptions import ParseCacheException, PDFCacheException
+from src.services.arxiv.pdf_cache import PDFCache
 
 from .parser import PDFParserService
+from .result_cache import ParseResultCache
+
+logger = logging.getLogger(__name__)
+
+
+def make_parse_result_cache(settings: Settings) -> Optional[ParseResultCache]:
+    """Create the parse result cache, or None when it is disabled or unavailable."""
+    if not settings.pdf_parser.result_cache_enabled:
+        return None
+
+    try:
+        return ParseResultCache(
+            Path(settings.pdf_parser.result_cache_dir),
+            max_size_bytes=settings.pdf_parser.result_cache_max_size_mb * 1024 * 1024,
+        )
+    except (ParseCacheException, OSError) as e:
+        logger.warning(f"Parse result cache unavailable, parsing without it: {e}")
+        return None
+
+
+def make_pdf_cache_index(settings: Settings) -> Optional[PDFCache]:
+    """Open the downloaded-PDF cache index so validation results can be memoized next to it."""
+    try:
+        return PDFCache(
+            Path(settings.arxiv.pdf_cache_dir), max_size_bytes=settings.arxiv.pdf_cache_max_size_mb * 1024 * 1024
+        )
+    except (PDFCacheException, OSError) as e:
+        logger.warning(f"PDF cache index unavailable, validation results won't be memoized: {e}")
+        return None
 
 
 @lru_cache(maxsize=1)
@@ -13,4 +47,13 @@ def make_pdf_parser_service() -> PDFParserService:
         max_file_size_mb=settings.pdf_parser.max_file_size_mb,
         do_ocr=settings.pdf_parser.do_ocr,
         do_table_structure=settings.pdf_parser.do_table_structure,
+        parse_workers=settings.pdf_parser.parse_workers,
+        max_tasks_per_child=settings.pdf_parser.max_tasks_per_child,
+        parse_timeout_seconds=settings.pdf_parser.parse_timeout_seconds,
+        shard_pages=settings.pdf_parser.shard_pages,
+        max_document_pages=settings.pdf_parser.max_document_pages,
+        fast_path_enabled=settings.pdf_parser.fast_path_enabled,
+        fast_path_min_quality=settings.pdf_parser.fast_path_min_quality,
+        result_cache=make_parse_result_cache(settings),
+        pdf_cache=make_pdf_cache_index(settings),
     )
@@ -1,38 +1,278 @@
+import asyncio
 import logging
+import tempfile
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-from src.exceptions import PDFParsingException, PDFValidationError
+from src.exceptions import ParseCacheException, PDFCacheException, PDFParsingException, PDFValidationError
 from src.schemas.pdf_parser.models import PdfContent
+from src.services.arxiv.pdf_cache import PDFCache, PDFCacheEntry
 
 from .docling import DoclingParser
+from .executor import PDFParseExecutor
+from .result_cache import ParseResultCache
+from .sharding import PDFIUM_LOCK, split_pdf, stitch_shards
+from .text_layer import TextLayerParser
+from .validation import PDFInfo, inspect_pdf
 
 logger = logging.getLogger(__name__)
 
 
 class PDFParserService:
 
-    def __init__(self, max_pages: int, max_file_size_mb: int, do_ocr: bool = False, do_table_structure: bool = True):
-        self.docling_parser = DoclingParser(
+    def __init__(
+        self,
+        max_pages: int,
+        max_file_size_mb: int,
+        do_ocr: bool = False,
+        do_table_structure: bool = True,
+        parse_workers: int = 0,
+        max_tasks_per_child: int = 50,
+        parse_timeout_seconds: float = 300.0,
+        shard_pages: int = 0,
+        max_document_pages: int = 200,
+        fast_path_enabled: bool = True,
+        fast_path_min_quality: float = 0.6,
+        result_cache: Optional[ParseResultCache] = None,
+        pdf_cache: Optional[PDFCache] = None,
+    ):
+        parser_options = dict(
             max_pages=max_pages, max_file_size_mb=max_file_size_mb, do_ocr=do_ocr, do_table_structure=do_table_structure
         )
 
+        # Documents longer than shard_pages are split into page ranges (0 disables sharding).
+        # Without sharding Docling sees the whole document, so its max_pages is the document limit.
+        self.shard_pages = min(shard_pages, max_pages)
+        self.max_document_pages = max_document_pages if self.shard_pages else max_pages
+        self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        text_layer_options = dict(max_pages=self.max_document_pages, max_file_size_mb=max_file_size_mb)
+
+        # Text-layer extraction first; Docling only when its quality score is too low
+        self.fast_path_enabled = fast_path_enabled
+        self.fast_path_min_quality = fast_path_min_quality
+
+        # With a pool, the converters live in the worker processes only
+        self.executor: Optional[PDFParseExecutor] = None
+        self.docling_parser: Optional[DoclingParser] = None
+        self.text_layer_parser: Optional[TextLayerParser] = None
+        if parse_workers > 0:
+            self.executor = PDFParseExecutor(
+                parser_options,
+                text_layer_options,
+                max_workers=parse_workers,
+                max_tasks_per_child=max_tasks_per_child,
+                timeout_seconds=parse_timeout_seconds,
+            )
+        else:
+            self.docling_parser = DoclingParser(**parser_options)
+            self.text_layer_parser = TextLayerParser(**text_layer_options)
+
+        # Downloaded PDFs are indexed here; their validation results are memoized in the same index
+        self.pdf_cache = pdf_cache
+
+        # Everything that can change the parse output goes into the result cache key
+        self.result_cache = result_cache
+        self.cache_options = dict(
+            parsers=["pdfium", "docling"] if fast_path_enabled else ["docling"],
+            fast_path_min_quality=fast_path_min_quality if fast_path_enabled else None,
+            do_ocr=do_ocr,
+            do_table_structure=do_table_structure,
+            max_pages=max_pages,
+            shard_pages=self.shard_pages,
+            max_document_pages=self.max_document_pages,
+        )
+
     async def parse_pdf(self, pdf_path: Path) -> Optional[PdfContent]:
         if not pdf_path.exists():
             logger.error(f"PDF file not found: {pdf_path}")
             raise PDFValidationError(f"PDF file not found: {pdf_path}")
 
+        cache_entry = await self._lookup_pdf_cache_entry(pdf_path)
+
+        cache_key = await self._get_cache_key(pdf_path, cache_entry.sha256 if cache_entry else None)
+        if cache_key is not None:
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Parse cache hit for {pdf_path.name}")
+                return cached
+
         try:
-            result = await self.docling_parser.parse_pdf(pdf_path)
+            pdf_info = await self._inspect_pdf(pdf_path, cache_entry)
+            result = await self._parse_document(pdf_path, pdf_info)
             if result:
                 logger.info(f"Parsed {pdf_path.name}")
+                if cache_key is not None:
+                    await self._cache_put(cache_key, result)
                 return result
             else:
-                logger.error(f"Docling parsing returned no result for {pdf_path.name}")
-                raise PDFParsingException(f"Docling parsing returned no result for {pdf_path.name}")
+                logger.error(f"PDF parsing returned no result for {pdf_path.name}")
+                raise PDFParsingException(f"PDF parsing returned no result for {pdf_path.name}")
 
         except (PDFValidationError, PDFParsingException):
             raise
         except Exception as e:
             logger.error(f"Docling parsing error for {pdf_path.name}: {e}")
             raise PDFParsingException(f"Docling parsing error for {pdf_path.name}: {e}")
+
+    async def _lookup_pdf_cache_entry(self, pdf_path: Path) -> Optional[PDFCacheEntry]:
+        if self.pdf_cache is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.pdf_cache.lookup_file, pdf_path)
+        except PDFCacheException as e:
+            logger.warning(f"PDF cache index lookup failed for {pdf_path.name}: {e}")
+            return None
+
+    async def _inspect_pdf(self, pdf_path: Path, cache_entry: Optional[PDFCacheEntry]) -> PDFInfo:
+        """Validate the PDF, reusing results memoized in the PDF cache index when the file is unchanged."""
+        if cache_entry is not None and cache_entry.page_count is not None and cache_entry.has_text_layer is not None:
+            pdf_info = PDFInfo(cache_entry.size, cache_entry.page_count, cache_entry.has_text_layer, cache_entry.sha256)
+        else:
+            pdf_info = await asyncio.to_thread(inspect_pdf, pdf_path, cache_entry.size if cache_entry else None)
+            if cache_entry is not None:
+                pdf_info.sha256 = cache_entry.sha256
+                try:
+                    await asyncio.to_thread(
+                        self.pdf_cache.record_pdf_info,
+                        cache_entry.arxiv_id,
+                        cache_entry.sha256,
+                        pdf_info.page_count,
+                        pdf_info.has_text_layer,
+                    )
+                except PDFCacheException as e:
+                    logger.warning(f"Failed to memoize PDF validation for {pdf_path.name}: {e}")
+
+        if pdf_info.size > self.max_file_size_bytes:
+            raise PDFValidationError(
+                f"PDF file too large: {pdf_info.size / 1024 / 1024:.1f}MB > {self.max_file_size_bytes / 1024 / 1024:.1f}MB"
+            )
+        if pdf_info.page_count > self.max_document_pages:
+            raise PDFValidationError(f"PDF has too many pages: {pdf_info.page_count} > {self.max_document_pages}")
+
+        return pdf_info
+
+    async def _get_cache_key(self, pdf_path: Path, pdf_sha256: Optional[str] = None) -> Optional[str]:
+        if self.result_cache is None:
+            return None
+        if pdf_sha256 is None:
+            pdf_sha256 = await asyncio.to_thread(ParseResultCache.hash_file, pdf_path)
+        return ParseResultCache.make_key(pdf_sha256, self.cache_options)
+
+    async def _cache_get(self, cache_key: str) -> Optional[PdfContent]:
+        # sqlite reads and decompression of large results stay off the event loop
+        try:
+            return await asyncio.to_thread(self.result_cache.get, cache_key)
+        except ParseCacheException as e:
+            logger.warning(f"Parse cache lookup failed, parsing instead: {e}")
+            return None
+
+    async def _cache_put(self, cache_key: str, content: PdfContent) -> None:
+        try:
+            await asyncio.to_thread(self.result_cache.put, cache_key, content)
+        except ParseCacheException as e:
+            logger.warning(f"Failed to store parse result in cache: {e}")
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Parse result cache counters, or None when caching is disabled."""
+        if self.result_cache is None:
+            return None
+        try:
+            return self.result_cache.get_stats()
+        except ParseCacheException as e:
+            logger.warning(f"Failed to read parse cache stats: {e}")
+            return None
+
+    def reset_cache_stats(self) -> None:
+        if self.result_cache is not None:
+            self.result_cache.reset_stats()
+
+    async def _parse_document(self, pdf_path: Path, pdf_info: PDFInfo) -> Optional[PdfContent]:
+        timings: Dict[str, float] = {}
+        quality = None
+
+        if self.fast_path_enabled and not pdf_info.has_text_layer:
+            # Scanned PDF: nothing for the text-layer extractor to read
+            quality = 0.0
+            logger.info(f"{pdf_path.name} has no text layer, using Docling")
+        elif self.fast_path_enabled:
+            start = time.perf_counter()
+            content, quality = await self._extract_text_layer(pdf_path)
+            timings["pdfium_seconds"] = round(time.perf_counter() - start, 3)
+
+            if content is not None and quality >= self.fast_path_min_quality:
+                return self._add_parser_metadata(content, timings, quality, escalated=False)
+            logger.info(f"Text layer quality {quality:.2f} < {self.fast_path_min_quality} for {pdf_path.name}, using Docling")
+
+        start = time.perf_counter()
+        content = await self._parse_with_docling(pdf_path, pdf_info.page_count)
+        timings["docling_seconds"] = round(time.perf_counter() - start, 3)
+
+        if content is None:
+            return None
+        return self._add_parser_metadata(content, timings, quality, escalated=self.fast_path_enabled)
+
+    async def _extract_text_layer(self, pdf_path: Path) -> Tuple[Optional[PdfContent], float]:
+        try:
+            if self.executor is not None:
+                return await self.executor.extract_text_layer(pdf_path)
+            return await asyncio.to_thread(self._extract_text_layer_in_thread, pdf_path)
+        except PDFParsingException as e:
+            # Unreadable text layer: let Docling have a go
+            logger.warning(f"Text layer extraction failed for {pdf_path.name}: {e}")
+            return None, 0.0
+
+    def _extract_text_layer_in_thread(self, pdf_path: Path) -> Tuple[Optional[PdfContent], float]:
+        # The lock is taken in the worker thread, so waiting for pdfium never blocks the event loop
+        with PDFIUM_LOCK:
+            return self.text_layer_parser.parse_pdf_sync(pdf_path)
+
+    @staticmethod
+    def _add_parser_metadata(
+        content: PdfContent, timings: Dict[str, float], quality: Optional[float], escalated: bool
+    ) -> PdfContent:
+        """Record which parser produced the content and how long each tier took."""
+        parser_info: Dict[str, Any] = {"parser": content.parser_used.value, "timings": timings, "escalated": escalated}
+        if quality is not None:
+            parser_info["text_layer_quality"] = quality
+        content.metadata.update(parser_info)
+        return content
+
+    async def _parse_with_docling(self, pdf_path: Path, page_count: int) -> Optional[PdfContent]:
+        if 0 < self.shard_pages < page_count:
+            return await self._parse_sharded(pdf_path, page_count)
+
+        return await self._parse_file(pdf_path, page_count=page_count)
+
+    async def _parse_file(
+        self, pdf_path: Path, shard: bool = False, page_count: Optional[int] = None
+    ) -> Optional[PdfContent]:
+        if self.executor is not None:
+            return await self.executor.parse(pdf_path, shard=shard, page_count=page_count)
+        return await self.docling_parser.parse_pdf(pdf_path, shard=shard, page_count=page_count)
+
+    async def _parse_sharded(self, pdf_path: Path, page_count: int) -> Optional[PdfContent]:
+        """Parse page-range shards in parallel workers and stitch them back in page order."""
+        with tempfile.TemporaryDirectory(prefix="pdf_shards_") as shard_dir:
+            shard_paths = await asyncio.to_thread(split_pdf, pdf_path, self.shard_pages, Path(shard_dir))
+            logger.info(f"Parsing {pdf_path.name} ({page_count} pages) as {len(shard_paths)} shards")
+
+            # Let every shard finish before the shard files are removed
+            shard_page_counts = [min(self.shard_pages, page_count - start) for start in range(0, page_count, self.shard_pages)]
+            results = await asyncio.gather(
+                *(self._parse_file(path, True, pages) for path, pages in zip(shard_paths, shard_page_counts)),
+                return_exceptions=True,
+            )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        if any(result is None for result in results):
+            return None
+
+        return stitch_shards(results, page_count)
+
+    def shutdown(self) -> None:
+        """Stop the parse worker processes, if any."""
+        if self.executor is not None:
+            self.executor.shutdown()
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from src.exceptions import ParseCacheException
+from src.schemas.pdf_parser.models import PdfContent
+
+logger = logging.getLogger(__name__)
+
+# Bump when parser output changes in a way that should invalidate cached results
+PARSE_CACHE_VERSION = 1
+
+
+class ParseResultCache:
+    """Size-bounded on-disk cache of parsed PdfContent.
+
+    Entries are keyed by the PDF's sha256 plus a fingerprint of the parser pipeline and its
+    options, and stored as zlib-compressed JSON in a SQLite file. Least recently used entries
+    are evicted once the stored payloads exceed the byte budget.
+    """
+
+    INDEX_FILENAME = "parse_cache.sqlite3"
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes  # 0 disables eviction
+        self.db_path = self.cache_dir / self.INDEX_FILENAME
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._init_db()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+        except sqlite3.Error as e:
+            raise ParseCacheException(f"Failed to open parse cache {self.db_path}: {e}")
+
+        try:
+            with conn:
+                yield conn
+        except sqlite3.Error as e:
+            logger.error(f"Parse cache error: {e}")
+            raise ParseCacheException(f"Parse cache error: {e}")
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    parser_used TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_parse_cache_last_access ON parse_cache (last_access)")
+
+    @staticmethod
+    def make_key(pdf_sha256: str, parser_options: Dict[str, Any]) -> str:
+        """Build a cache key from the PDF hash and the parser pipeline options."""
+        options = json.dumps({"version": PARSE_CACHE_VERSION, **parser_options}, sort_keys=True)
+        fingerprint = hashlib.sha256(options.encode()).hexdigest()[:16]
+        return f"{pdf_sha256}:{fingerprint}"
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, cache_key: str) -> Optional[PdfContent]:
+        """
+        Look up a parsed document and mark it as recently used.
+
+        Args:
+            cache_key: Key from ``make_key``
+
+        Returns:
+            PdfContent or None on a miss
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT payload FROM parse_cache WHERE cache_key = ?", (cache_key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE parse_cache SET last_access = ? WHERE cache_key = ?", (time.time(), cache_key))
+
+        if row is None:
+            self._misses += 1
+            return None
+
+        try:
+            content = PdfContent.model_validate_json(zlib.decompress(row[0]))
+        except Exception as e:
+            logger.warning(f"Dropping unreadable parse cache entry {cache_key}: {e}")
+            self.remove(cache_key)
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return content
+
+    def put(self, cache_key: str, content: PdfContent) -> None:
+        """Store a parsed document and evict old entries if over budget."""
+        payload = zlib.compress(content.model_dump_json().encode("utf-8"), 6)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO parse_cache (cache_key, parser_used, payload, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    parser_used = excluded.parser_used,
+                    payload = excluded.payload,
+                    size = excluded.size,
+                    created_at = excluded.created_at,
+                    last_access = excluded.last_access
+                """,
+                (cache_key, content.parser_used.value, payload, len(payload), now, now),
+            )
+        self.evict(keep=cache_key)
+
+    def remove(self, cache_key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM parse_cache WHERE cache_key = ?", (cache_key,))
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Evict least recently used entries until the stored payloads fit the byte budget.
+
+        Args:
+            keep: Key that must not be evicted (e.g. the entry just written)
+
+        Returns:
+            Number of evicted entries
+        """
+        if self.max_size_bytes <= 0:
+            return 0
+
+        with self._connect() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()[0]
+            if total <= self.max_size_bytes:
+                return 0
+
+            evicted = []
+            for cache_key, size in conn.execute("SELECT cache_key, size FROM parse_cache ORDER BY last_access ASC"):
+                if total <= self.max_size_bytes:
+                    break
+                if cache_key == keep:
+                    continue
+                evicted.append((cache_key,))
+                total -= size
+            conn.executemany("DELETE FROM parse_cache WHERE cache_key = ?", evicted)
+
+        self._evictions += len(evicted)
+        logger.info(f"Evicted {len(evicted)} parse results from cache ({total / 1024 / 1024:.1f}MB remaining)")
+        return len(evicted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache usage and hit/miss counters since the last reset."""
+        with self._connect() as conn:
+            entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parse_cache").fetchone()
+        lookups = self._hits + self._misses
+        return {
+            "entries": entries,
+            "size_bytes": total,
+            "max_size_bytes": self.max_size_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters, e.g. at the start of a pipeline run."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
@@ -0,0 +1,130 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Tuple
+
+import pypdfium2 as pdfium
+from src.schemas.pdf_parser.models import PaperSection, ParserType, PdfContent
+
+logger = logging.getLogger(__name__)
+
+# pdfium is not thread-safe: serialize calls made in this process (e.g. from asyncio.to_thread)
+PDFIUM_LOCK = threading.Lock()
+
+
+def split_pdf(pdf_path: Path, shard_pages: int, output_dir: Path) -> List[Path]:
+    """
+    Split a PDF into consecutive page-range files.
+
+    Args:
+        pdf_path: Source PDF
+        shard_pages: Maximum pages per shard
+        output_dir: Directory for the shard files
+
+    Returns:
+        Shard paths in page order
+    """
+    shard_paths = []
+    with PDFIUM_LOCK:
+        source = pdfium.PdfDocument(str(pdf_path))
+        try:
+            page_count = len(source)
+            for start in range(0, page_count, shard_pages):
+                end = min(start + shard_pages, page_count)
+                shard_path = output_dir / f"{pdf_path.stem}.pages-{start + 1}-{end}.pdf"
+
+                shard = pdfium.PdfDocument.new()
+                try:
+                    shard.import_pages(source, pages=list(range(start, end)))
+                    shard.save(str(shard_path))
+                finally:
+                    shard.close()
+                shard_paths.append(shard_path)
+        finally:
+            source.close()
+
+    logger.debug(f"Split {pdf_path.name} into {len(shard_paths)} shards of up to {shard_pages} pages")
+    return shard_paths
+
+
+def sections_from_elements(elements: Iterable[Any], shard: bool = False) -> Tuple[List[PaperSection], bool]:
+    """
+    Group Docling text elements into sections at title and section-header elements.
+
+    Args:
+        elements: Docling text items in reading order
+        shard: The elements come from a page-range shard; a trailing header without body is kept
+            so ``stitch_shards`` can give it the next shard's text
+
+    Returns:
+        Sections, and whether the first one is untitled text continuing the previous shard
+    """
+    sections: List[PaperSection] = []
+    current_section = {"title": "Content", "content": "", "level": 1}
+    seen_header = False
+    starts_mid_section = False
+
+    def close_section() -> None:
+        nonlocal starts_mid_section
+        sections.append(PaperSection(**{**current_section, "content": current_section["content"].strip()}))
+        # Only a kept pre-header section continues the previous shard; blank text before it does not
+        starts_mid_section = starts_mid_section or not seen_header
+
+    for element in elements:
+        if getattr(element, "label", None) in ["title", "section_header"]:
+            if current_section["content"].strip():
+                close_section()
+            # Section headers carry their depth in the document tree
+            current_section = {"title": element.text.strip(), "content": "", "level": getattr(element, "level", 1) or 1}
+            seen_header = True
+        elif getattr(element, "text", None):
+            current_section["content"] += element.text + "\n"
+
+    if current_section["content"].strip() or (shard and seen_header):
+        close_section()
+
+    return sections, starts_mid_section
+
+
+def stitch_shards(shards: List[PdfContent], page_count: int) -> PdfContent:
+    """
+    Merge per-shard parse results back into one document, in page order.
+
+    Text before a shard's first header continues the last section of the previous shard, and a
+    header left without body at the end of a shard receives that text.
+
+    Args:
+        shards: Parsed shards in page order (parsed with ``shard=True``)
+        page_count: Total pages of the original document
+
+    Returns:
+        PdfContent for the whole document
+    """
+    sections: List[PaperSection] = []
+    for shard in shards:
+        shard_sections = list(shard.sections)
+        if sections and shard_sections and shard.metadata.get("starts_mid_section"):
+            continuation = shard_sections.pop(0)
+            previous = sections[-1]
+            sections[-1] = PaperSection(
+                title=previous.title,
+                content=f"{previous.content}\n{continuation.content}".strip(),
+                level=previous.level,
+            )
+        sections.extend(shard_sections)
+
+    return PdfContent(
+        # Headers that never received a body are dropped, as in an unsharded parse
+        sections=[section for section in sections if section.content.strip()],
+        figures=[],
+        tables=[],
+        raw_text="\n\n".join(shard.raw_text for shard in shards if shard.raw_text),
+        references=[],
+        parser_used=ParserType.DOCLING,
+        metadata={
+            "source": "docling",
+            "note": "Content extracted from PDF, metadata comes from arXiv API",
+            "pages": page_count,
+            "shards": len(shards),
+        },
+    )
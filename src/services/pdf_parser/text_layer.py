@@ -0,0 +1,235 @@
+import logging
+import re
+import statistics
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+from src.exceptions import PDFParsingException, PDFValidationError
+from src.schemas.pdf_parser.models import PaperSection, ParserType, PdfContent
+
+logger = logging.getLogger(__name__)
+
+# "3 Method", "4.2. Ablations", "A.1 Proofs" - numbered headings are short and don't end with a period
+_NUMBERED_HEADER = re.compile(r"^(?:(\d+(?:\.\d+)*)|([A-H](?:\.\d+)*))\.?\s+([A-Z][^\n]{0,80})$")
+_NAMED_HEADERS = {
+    "abstract",
+    "introduction",
+    "background",
+    "related work",
+    "method",
+    "methods",
+    "methodology",
+    "experiments",
+    "results",
+    "discussion",
+    "conclusion",
+    "conclusions",
+    "limitations",
+    "acknowledgements",
+    "acknowledgments",
+    "references",
+    "bibliography",
+    "appendix",
+}
+_WORD = re.compile(r"[^\W\d_]{1,24}")
+_MAX_HEADER_WORDS = 12
+
+
+@dataclass
+class _TextLine:
+    text: str
+    font_size: float
+
+
+class TextLayerParser:
+    """Fast extractor that reads the PDF text layer with pypdfium2.
+
+    Section headers are detected heuristically from numbering, well-known section names and
+    font size. ``quality_score`` rates the result so callers can fall back to Docling for
+    scanned or oddly laid out PDFs.
+    """
+
+    def __init__(self, max_pages: int, max_file_size_mb: int):
+        self.max_pages = max_pages
+        self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+
+    def parse_pdf_sync(self, pdf_path: Path) -> Tuple[Optional[PdfContent], float]:
+        """
+        Extract sections from the text layer.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Tuple of (PdfContent or None when there is no usable text, quality score in [0, 1])
+        """
+        file_size = pdf_path.stat().st_size
+        if file_size > self.max_file_size_bytes:
+            raise PDFValidationError(
+                f"PDF file too large: {file_size / 1024 / 1024:.1f}MB > {self.max_file_size_bytes / 1024 / 1024:.1f}MB"
+            )
+
+        try:
+            page_lines, page_count = self._extract_lines(pdf_path)
+        except PDFValidationError:
+            raise
+        except Exception as e:
+            raise PDFParsingException(f"Failed to read PDF text layer: {e}")
+
+        lines = [line for page in page_lines for line in page]
+        if not lines:
+            return None, 0.0
+
+        sections = self._build_sections(lines)
+        raw_text = "\n\n".join("\n".join(line.text for line in page) for page in page_lines)
+        quality = self.quality_score(raw_text, page_count, len(sections))
+
+        content = PdfContent(
+            sections=sections,
+            figures=[],
+            tables=[],
+            raw_text=raw_text,
+            references=[],
+            parser_used=ParserType.PDFIUM,
+            metadata={"source": "pdfium", "note": "Content extracted from PDF text layer, metadata comes from arXiv API"},
+        )
+        return content, quality
+
+    def _extract_lines(self, pdf_path: Path) -> Tuple[List[List[_TextLine]], int]:
+        pdf_doc = pdfium.PdfDocument(str(pdf_path))
+        try:
+            page_count = len(pdf_doc)
+            if page_count > self.max_pages:
+                raise PDFValidationError(f"PDF has too many pages: {page_count} > {self.max_pages}")
+
+            page_lines = []
+            for page_index in range(page_count):
+                page = pdf_doc[page_index]
+                textpage = page.get_textpage()
+                try:
+                    page_lines.append(self._page_lines(textpage))
+                finally:
+                    textpage.close()
+                    page.close()
+            return page_lines, page_count
+        finally:
+            pdf_doc.close()
+
+    @staticmethod
+    def _page_lines(textpage: pdfium.PdfTextPage) -> List[_TextLine]:
+        text = textpage.get_text_range()
+        lines = []
+        offset = 0
+        for raw_line in re.split(r"\r\n|\n|\r", text):
+            stripped = raw_line.strip()
+            if stripped:
+                # Font size of the first visible char; text indices can differ from char indices
+                text_index = offset + (len(raw_line) - len(raw_line.lstrip()))
+                char_index = pdfium_c.FPDFText_GetCharIndexFromTextIndex(textpage.raw, text_index)
+                font_size = pdfium_c.FPDFText_GetFontSize(textpage.raw, char_index) if char_index >= 0 else 0.0
+                lines.append(_TextLine(stripped, round(font_size, 1)))
+            offset += len(raw_line) + (2 if text.startswith("\r\n", offset + len(raw_line)) else 1)
+        return lines
+
+    @staticmethod
+    def _body_font_size(lines: List[_TextLine]) -> float:
+        weights = Counter()
+        for line in lines:
+            weights[line.font_size] += len(line.text)
+        return weights.most_common(1)[0][0]
+
+    def _header_level(self, line: _TextLine, body_size: float) -> Optional[int]:
+        """Return the section level if the line looks like a header, else None."""
+        text = line.text
+        words = text.split()
+        if len(words) > _MAX_HEADER_WORDS or text.endswith((".", ",", ";")):
+            return None
+
+        larger = line.font_size > body_size
+        numbered = _NUMBERED_HEADER.match(text)
+        if numbered:
+            number, letter = numbered.group(1), numbered.group(2)
+            # Plain numbers in body font are usually list items or table rows, not headings
+            if number and int(number.split(".")[0]) <= 30 and ("." in number or larger or len(words) <= 6):
+                return number.count(".") + 1
+            # Appendix letters need a sub-number or a larger font to be told apart from "A ..." sentences
+            if letter and ("." in letter or larger):
+                return letter.count(".") + 1
+
+        if text.lower().rstrip(":") in _NAMED_HEADERS:
+            return 1
+
+        if body_size and line.font_size >= body_size * 1.15 and any(c.isalpha() for c in text):
+            return 1
+
+        return None
+
+    def _build_sections(self, lines: List[_TextLine]) -> List[PaperSection]:
+        body_size = self._body_font_size(lines)
+        sections = []
+        current_title, current_level, current_lines = "Content", 1, []
+
+        def flush() -> None:
+            content = self._join_lines(current_lines)
+            if content:
+                sections.append(PaperSection(title=current_title, content=content, level=current_level))
+
+        for line in lines:
+            level = self._header_level(line, body_size)
+            if level is not None:
+                flush()
+                current_title, current_level, current_lines = line.text, level, []
+            else:
+                current_lines.append(line.text)
+        flush()
+        return sections
+
+    @staticmethod
+    def _join_lines(lines: List[str]) -> str:
+        """Join visual lines into paragraphs, undoing end-of-line hyphenation."""
+        if not lines:
+            return ""
+        typical_length = statistics.median(len(line) for line in lines)
+
+        parts = [lines[0]]
+        for previous, line in zip(lines, lines[1:]):
+            if previous.endswith("-") and previous[-2:-1].isalpha() and line[:1].islower():
+                parts[-1] = parts[-1][:-1]
+                parts.append(line)
+            elif previous.endswith((".", "!", "?", ":")) and len(previous) < 0.8 * typical_length:
+                # A short line ending a sentence closes its paragraph
+                parts.append("\n" + line)
+            else:
+                parts.append(" " + line)
+        return "".join(parts).strip()
+
+    @staticmethod
+    def quality_score(raw_text: str, page_count: int, section_count: int) -> float:
+        """
+        Rate the extracted text layer between 0 (unusable) and 1.
+
+        Combines text density per page, the share of clean characters, the share of real
+        words and whether any section structure was found.
+        """
+        if not raw_text.strip() or page_count == 0:
+            return 0.0
+
+        chars = len(raw_text)
+        density = min(1.0, chars / page_count / 1500)
+
+        # Broken font encodings show up as replacement/private-use chars or "(cid:NN)" runs
+        bad_chars = sum(1 for c in raw_text if c == "\ufffd" or "\ue000" <= c <= "\uf8ff" or (ord(c) < 32 and c not in "\n\r\t"))
+        bad_chars += 6 * raw_text.count("(cid:")
+        clean = max(0.0, 1.0 - bad_chars / chars)
+
+        tokens = raw_text.split()
+        words = sum(1 for token in tokens if _WORD.fullmatch(token.strip(".,;:()[]\"'")))
+        wordlike = words / len(tokens) if tokens else 0.0
+
+        structure = 1.0 if section_count >= 3 else 0.5 if section_count == 2 else 0.0
+
+        return round(0.3 * density + 0.3 * clean + 0.25 * wordlike + 0.15 * structure, 3)
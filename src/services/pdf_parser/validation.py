@@ -0,0 +1,68 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pypdfium2 as pdfium
+from src.exceptions import PDFValidationError
+
+from .sharding import PDFIUM_LOCK
+
+logger = logging.getLogger(__name__)
+
+# Pages sampled when checking for a text layer; scanned papers have no chars on any of them
+_TEXT_LAYER_SAMPLE_PAGES = 3
+
+
+@dataclass
+class PDFInfo:
+    """Cheap facts about a PDF, gathered with a single pdfium open."""
+
+    size: int
+    page_count: int
+    has_text_layer: bool
+    sha256: Optional[str] = None
+
+
+def inspect_pdf(pdf_path: Path, size: Optional[int] = None) -> PDFInfo:
+    """
+    Check the PDF header and read page count and text-layer presence in one pass.
+
+    Args:
+        pdf_path: Path to the PDF file
+        size: File size if the caller already has it
+
+    Returns:
+        PDFInfo
+    """
+    if size is None:
+        size = pdf_path.stat().st_size
+    if size == 0:
+        raise PDFValidationError(f"PDF file is empty: {pdf_path}")
+
+    with open(pdf_path, "rb") as f:
+        if not f.read(8).startswith(b"%PDF-"):
+            raise PDFValidationError(f"File does not have PDF header: {pdf_path}")
+
+    try:
+        with PDFIUM_LOCK:
+            pdf_doc = pdfium.PdfDocument(str(pdf_path))
+            try:
+                page_count = len(pdf_doc)
+                has_text_layer = False
+                for page_index in range(min(page_count, _TEXT_LAYER_SAMPLE_PAGES)):
+                    page = pdf_doc[page_index]
+                    textpage = page.get_textpage()
+                    try:
+                        has_text_layer = textpage.count_chars() > 0
+                    finally:
+                        textpage.close()
+                        page.close()
+                    if has_text_layer:
+                        break
+            finally:
+                pdf_doc.close()
+    except Exception as e:
+        raise PDFValidationError(f"Error validating PDF {pdf_path}: {e}")
+
+    return PDFInfo(size=size, page_count=page_count, has_text_layer=has_text_layer)
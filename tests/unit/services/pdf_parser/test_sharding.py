@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+from src.schemas.pdf_parser.models import ParserType, PdfContent
+from src.services.pdf_parser.sharding import sections_from_elements, stitch_shards
+
+
+def _text(text):
+    return SimpleNamespace(label="text", text=text)
+
+
+def _header(text, level=1):
+    return SimpleNamespace(label="section_header", text=text, level=level)
+
+
+def _shard(elements):
+    sections, starts_mid_section = sections_from_elements(elements, shard=True)
+    return PdfContent(
+        sections=sections,
+        raw_text="",
+        parser_used=ParserType.DOCLING,
+        metadata={"starts_mid_section": starts_mid_section},
+    )
+
+
+def test_blank_text_before_first_header_does_not_start_mid_section():
+    sections, starts_mid_section = sections_from_elements([_text("\n"), _header("2 Method"), _text("We propose.")], shard=True)
+
+    assert not starts_mid_section
+    assert [section.title for section in sections] == ["2 Method"]
+
+
+def test_stitch_keeps_header_after_blank_leading_text():
+    first = _shard([_header("1 Introduction"), _text("Intro text.")])
+    second = _shard([_text("\n"), _text("   "), _header("2 Method"), _text("We propose.")])
+
+    stitched = stitch_shards([first, second], page_count=20)
+
+    assert [(section.title, section.content) for section in stitched.sections] == [
+        ("1 Introduction", "Intro text."),
+        ("2 Method", "We propose."),
+    ]
+
+
+def test_stitch_merges_leading_text_into_previous_section():
+    first = _shard([_header("1 Introduction"), _text("Intro starts")])
+    second = _shard([_text("and continues."), _header("2 Method"), _text("We propose.")])
+
+    stitched = stitch_shards([first, second], page_count=20)
+
+    assert [(section.title, section.content) for section in stitched.sections] == [
+        ("1 Introduction", "Intro starts\nand continues."),
+        ("2 Method", "We propose."),
+    ]
+
+
+def test_stitch_fills_trailing_header_from_next_shard():
+    first = _shard([_header("1 Introduction"), _text("Intro text."), _header("2 Method")])
+    second = _shard([_text("We propose."), _header("3 Results"), _text("It works.")])
+
+    stitched = stitch_shards([first, second], page_count=20)
+
+    assert [(section.title, section.content) for section in stitched.sections] == [
+        ("1 Introduction", "Intro text."),
+        ("2 Method", "We propose."),
+        ("3 Results", "It works."),
+    ]